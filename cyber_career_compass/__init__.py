@@ -1 +1,82 @@
-"""Cyber Career Compass — NIST NICE–driven terminal career assessment game."""
+"""
+Cyber Career Compass — NIST NICE–driven terminal career assessment game.
+
+The public API is loaded lazily (module __getattr__): `import cyber_career_compass` imports no
+submodule, and the first access to a name imports only the module that defines it, so e.g.
+`from cyber_career_compass import ScoreState` never pulls in Streamlit, plotly, fpdf or the
+translation bundles. Submodules are reachable as attributes too (cyber_career_compass.results).
+Cold-import budget: python -m cyber_career_compass.import_budget
+"""
+
+import importlib
+from typing import Any, Dict, List
+
+# Public name → defining submodule
+_LAZY_API: Dict[str, str] = {
+    # Scoring and NICE framework
+    "ScoreState": "scoring",
+    "xp_to_rank": "scoring",
+    "get_ares_recommendations": "scoring",
+    "ALL_CATEGORIES": "nice_framework",
+    "ALL_ROLE_IDS": "nice_framework",
+    "get_work_role": "nice_framework",
+    "get_certifications": "nice_framework",
+    "get_category_label": "nice_framework",
+    # Session model
+    "SessionModel": "session",
+    "get_session": "session",
+    "register_bank": "session",
+    "get_shared_bank": "session",
+    # Content: compiled banks, Ares catalog, versions
+    "get_compiled_bank": "bank_compiler",
+    "BankCompileError": "bank_compiler",
+    "get_catalog": "ares_catalog",
+    "CatalogError": "ares_catalog",
+    "get_content": "content_registry",
+    "content_version": "content_registry",
+    "start_content_watcher": "content_registry",
+    # Engines
+    "calculate_gaps": "project_ares",
+    "get_recommended_deployments": "project_ares",
+    "plan_deployments": "training_plan",
+    "draw_sprint": "validation_sprint",
+    "score_validation_sprint": "validation_sprint",
+    "get_round_set": "proving_rounds",
+    "score_rounds": "drift_scoring",
+    "LiveFireSim": "live_fire_scenario",
+    "ArchetypePosterior": "posterior",
+    # Translations
+    "SUPPORTED_LANGUAGES": "translations",
+    "get_ui": "translations",
+    # Results (Streamlit, plotly, fpdf)
+    "render_dossier": "results",
+    "render_radar_chart": "results",
+    "build_dossier_pdf": "results",
+    # Dossier identity and artifact cache (artifacts build through results)
+    "dossier_id": "dossier",
+    "get_dossier": "dossier",
+    # Cache layer (memory / shared-memory / disk tiers)
+    "get_cache": "cache",
+    "cache_stats": "cache",
+}
+
+__all__ = sorted(_LAZY_API)
+
+
+def __getattr__(name: str) -> Any:
+    module = _LAZY_API.get(name)
+    if module is not None:
+        value = getattr(importlib.import_module(f".{module}", __name__), name)
+        globals()[name] = value  # later lookups skip __getattr__
+        return value
+    if not name.startswith("__"):
+        try:
+            return importlib.import_module(f".{name}", __name__)
+        except ModuleNotFoundError as exc:
+            if exc.name != f"{__name__}.{name}":
+                raise
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(_LAZY_API))
@@ -0,0 +1,139 @@
+"""
+Cohort analytics — streaming aggregates fed by ScoreState completion events.
+Each event carries one assessment's own score (SessionModel.mission_score() / validation_score() /
+live_fire_score(): what that assessment added), not the session's cumulative ScoreState.
+
+Per (cohort, tier) the engine keeps, in O(1) per event and O(1) per read:
+- archetype counters (guardian / analyst / ghost / architect),
+- Welford running mean/variance of raw NICE category scores,
+- fixed-bucket histograms of normalized radar scores (0–100, 10 buckets).
+Every event also updates the cohort's "all" tier, so "all" counts completed assessments across
+tiers, not students (a student who finishes three assessments contributes three events).
+Process-wide; guarded by one lock.
+Cohort names come from the URL (?cohort=): normalize_cohort() maps anything outside COHORT_PATTERN
+to "default", and once MAX_COHORTS cohorts exist new ones are folded into "default" too.
+"""
+
+import math
+import re
+import threading
+from typing import Any, Dict, List, Optional, Tuple
+
+from .nice_framework import ALL_CATEGORIES
+
+ALL_TIERS = "all"
+DEFAULT_COHORT = "default"
+COHORT_PATTERN = re.compile(r"[A-Za-z0-9][A-Za-z0-9_.-]{0,31}")
+MAX_COHORTS = 64  # named cohorts kept besides "default"; later ones count as "default"
+
+# Radar score histogram: 10 buckets of width 10 over 0–100 (100 falls in the last bucket)
+HISTOGRAM_BUCKETS = 10
+HISTOGRAM_WIDTH = 100.0 / HISTOGRAM_BUCKETS
+
+ARCHETYPE_IDS = ("guardian", "analyst", "ghost", "architect")
+
+
+class RunningMoments:
+    """Welford's online mean/variance."""
+
+    __slots__ = ("n", "mean", "m2")
+
+    def __init__(self) -> None:
+        self.n = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+
+    def add(self, x: float) -> None:
+        self.n += 1
+        delta = x - self.mean
+        self.mean += delta / self.n
+        self.m2 += delta * (x - self.mean)
+
+    @property
+    def variance(self) -> float:
+        """Sample variance (0.0 below two observations)."""
+        return self.m2 / (self.n - 1) if self.n > 1 else 0.0
+
+    @property
+    def stddev(self) -> float:
+        return math.sqrt(self.variance)
+
+
+class CohortAggregate:
+    """Streaming aggregates for one (cohort, tier)."""
+
+    __slots__ = ("completions", "archetypes", "moments", "histograms")
+
+    def __init__(self) -> None:
+        self.completions = 0
+        self.archetypes: Dict[str, int] = {a: 0 for a in ARCHETYPE_IDS}
+        self.moments: Dict[str, RunningMoments] = {c: RunningMoments() for c in ALL_CATEGORIES}
+        self.histograms: Dict[str, List[int]] = {c: [0] * HISTOGRAM_BUCKETS for c in ALL_CATEGORIES}
+
+    def add(self, archetype_id: str, raw: Dict[str, float], radar: Dict[str, float]) -> None:
+        self.completions += 1
+        self.archetypes[archetype_id] = self.archetypes.get(archetype_id, 0) + 1
+        for cat in ALL_CATEGORIES:
+            self.moments[cat].add(float(raw.get(cat, 0.0)))
+            v = max(0.0, min(100.0, float(radar.get(cat, 0.0))))
+            self.histograms[cat][min(HISTOGRAM_BUCKETS - 1, int(v // HISTOGRAM_WIDTH))] += 1
+
+    def summary(self) -> Dict[str, Any]:
+        return {
+            "completions": self.completions,
+            "archetypes": dict(self.archetypes),
+            "mean": {c: m.mean for c, m in self.moments.items()},
+            "variance": {c: m.variance for c, m in self.moments.items()},
+            "histograms": {c: list(h) for c, h in self.histograms.items()},
+        }
+
+
+_lock = threading.Lock()
+_aggregates: Dict[Tuple[str, str], CohortAggregate] = {}
+_cohorts: Dict[str, None] = {}  # named cohorts seen (insertion-ordered set)
+
+
+def normalize_cohort(raw: Optional[str]) -> str:
+    """Cohort name from untrusted input: COHORT_PATTERN (1–32 of [A-Za-z0-9_.-]) or "default"."""
+    raw = (raw or "").strip()
+    return raw if COHORT_PATTERN.fullmatch(raw) else DEFAULT_COHORT
+
+
+def record_completion(score_state: Any, tier: str, cohort: Optional[str] = None) -> None:
+    """Completion event: fold one finished assessment (its own ScoreState, not the session's) into its cohort/tier aggregates."""
+    archetype_id = score_state.get_archetype()
+    raw = score_state.get_category_scores()
+    radar = score_state.get_normalized_radar_scores()
+    cohort = normalize_cohort(cohort)
+    with _lock:
+        if cohort != DEFAULT_COHORT and cohort not in _cohorts:
+            if len(_cohorts) >= MAX_COHORTS:
+                cohort = DEFAULT_COHORT
+            else:
+                _cohorts[cohort] = None
+        keys = [(cohort, ALL_TIERS)]
+        if tier and tier != ALL_TIERS:
+            keys.append((cohort, tier))
+        for key in keys:
+            agg = _aggregates.get(key)
+            if agg is None:
+                agg = _aggregates[key] = CohortAggregate()
+            agg.add(archetype_id, raw, radar)
+
+
+def get_cohort_summary(cohort: Optional[str] = None, tier: str = ALL_TIERS) -> Dict[str, Any]:
+    """Dashboard read: completions, archetype distribution, per-category mean/variance and histograms."""
+    with _lock:
+        agg = _aggregates.get((normalize_cohort(cohort), tier))
+        return (agg or CohortAggregate()).summary()
+
+
+def list_cohorts() -> List[Tuple[str, str]]:
+    with _lock:
+        return sorted(_aggregates)
+
+
+def reset_analytics() -> None:
+    with _lock:
+        _aggregates.clear()
+        _cohorts.clear()
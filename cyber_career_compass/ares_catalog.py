@@ -0,0 +1,236 @@
+"""
+Project Ares catalog — Battle Rooms, Missions, work-role mappings and competency baselines,
+loaded from one file (data/ares_catalog.json, override with CCC_ARES_CATALOG) into indexed, read-only structures.
+
+get_catalog() is the only entry point: indexes by scenario id, by NICE work role (aliases such as
+PR-CDA-001 resolve to their role), by NICE category (through the category's role) and by type.
+The file is re-checked at most every CATALOG_CHECK_S; when its mtime/size change the catalog is
+rebuilt and swapped in one assignment, and `version` changes so derived caches can key on it.
+A file that fails validation keeps the previous catalog (CatalogError is raised on first load only).
+content_registry pins a session's snapshot per script run (pin_catalog), so get_catalog() keeps
+returning the catalog that session started on; latest_catalog() ignores the pin.
+Validate from the command line: python -m cyber_career_compass.ares_catalog
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+CATALOG_PATH = Path(os.environ.get("CCC_ARES_CATALOG") or Path(__file__).resolve().parent / "data" / "ares_catalog.json")
+CATALOG_CHECK_S = 1.0  # min interval between stat() calls on the hot path
+
+SCENARIO_TYPES = ("BR", "M")
+
+
+class CatalogError(ValueError):
+    """The Ares catalog file is missing fields or references unknown ids."""
+
+
+@dataclass(frozen=True)
+class AresScenario:
+    id: str
+    type: str  # "BR" (Battle Room) or "M" (Mission)
+    title: str
+    training_value: str
+
+
+@dataclass(frozen=True, eq=False)
+class AresCatalog:
+    """One immutable catalog snapshot. Hashes by identity, so caches can key on the object."""
+
+    version: str  # content digest of the file
+    scenarios: Dict[str, AresScenario]
+    by_role: Dict[str, Tuple[str, ...]]  # NICE role id (and aliases) → scenario ids, guide order
+    by_category: Dict[str, Tuple[str, ...]]  # NICE category → scenario ids of its role
+    by_type: Dict[str, Tuple[str, ...]]
+    role_names: Dict[str, str]
+    role_baselines: Dict[str, float]
+    role_learning_paths: Dict[str, str]
+    app_role_to_nice: Dict[str, str]
+    app_role_baselines: Dict[str, float]
+    category_to_role: Dict[str, str]
+    default_baseline: float
+    default_role: str
+    default_learning_path: str
+    default_scenarios: Tuple[str, ...]
+    _legacy: Dict[str, Any] = field(default_factory=dict, repr=False)
+
+    def scenarios_for_role(self, nice_role_id: str) -> Tuple[str, ...]:
+        return self.by_role.get(nice_role_id, self.default_scenarios)
+
+    def legacy_view(self, name: str) -> Any:
+        """Dict shapes of the former module literals (project_ares / scoring), built once per snapshot."""
+        view = self._legacy.get(name)
+        if view is None:
+            view = self._legacy[name] = _LEGACY_VIEWS[name](self)
+        return view
+
+
+_LEGACY_VIEWS = {
+    "ARES_SCENARIOS": lambda c: {s.id: {"title": s.title, "training_value": s.training_value} for s in c.scenarios.values()},
+    "NICE_ROLE_TO_SCENARIOS": lambda c: {r: list(c.by_role[r]) for r in c.role_names},
+    "COMPETENCY_BASELINE_PER_WORK_ROLE": lambda c: dict(c.role_baselines),
+    "COMPETENCY_BASELINE_PER_APP_ROLE": lambda c: dict(c.app_role_baselines),
+    "APP_ROLE_TO_NICE_ID": lambda c: dict(c.app_role_to_nice),
+    "NICE_ROLE_TO_LEARNING_PATH_KEY": lambda c: dict(c.role_learning_paths),
+    "NIST_CATEGORY_TO_NICE_ROLE": lambda c: dict(c.category_to_role),
+    "NIST_CATEGORY_TO_ARES_SCENARIOS": lambda c: {cat: list(s) for cat, s in c.by_category.items()},
+    "NICE_ARES_MASTER": lambda c: {r: list(s) for r, s in c.by_role.items()},
+}
+
+
+def build_catalog(raw: Dict[str, Any], version: str) -> AresCatalog:
+    """Validate the parsed file and build the indexes. Raises CatalogError listing every problem."""
+    errors: List[str] = []
+    for key in ("defaults", "scenarios", "work_roles", "app_roles", "categories"):
+        if not isinstance(raw.get(key), dict):
+            errors.append(f"missing object {key!r}")
+    if errors:
+        raise CatalogError("Ares catalog invalid:\n  " + "\n  ".join(errors))
+
+    scenarios: Dict[str, AresScenario] = {}
+    for sid, s in raw["scenarios"].items():
+        if s.get("type") not in SCENARIO_TYPES or not s.get("title") or not s.get("training_value"):
+            errors.append(f"scenario {sid}: needs type in {SCENARIO_TYPES}, title and training_value")
+            continue
+        scenarios[sid] = AresScenario(sid, s["type"], s["title"], s["training_value"])
+
+    defaults = raw["defaults"]
+    default_baseline = float(defaults.get("competency_baseline", 65.0))
+    by_role: Dict[str, Tuple[str, ...]] = {}
+    role_names: Dict[str, str] = {}
+    role_baselines: Dict[str, float] = {}
+    role_paths: Dict[str, str] = {}
+    for rid, r in raw["work_roles"].items():
+        unknown = [s for s in r.get("scenarios", ()) if s not in scenarios]
+        if unknown:
+            errors.append(f"work role {rid}: unknown scenarios {unknown}")
+        by_role[rid] = tuple(r.get("scenarios", ()))
+        role_names[rid] = r.get("name", rid)
+        role_baselines[rid] = float(r.get("baseline", default_baseline))
+        role_paths[rid] = r.get("learning_path", defaults.get("learning_path", "computer_networking"))
+    for alias, rid in raw.get("role_aliases", {}).items():
+        if rid not in by_role:
+            errors.append(f"role alias {alias}: unknown work role {rid}")
+        else:
+            by_role[alias] = by_role[rid]
+
+    app_to_nice: Dict[str, str] = {}
+    app_baselines: Dict[str, float] = {}
+    for aid, a in raw["app_roles"].items():
+        if a.get("nice_role") not in role_names:
+            errors.append(f"app role {aid}: unknown work role {a.get('nice_role')}")
+        app_to_nice[aid] = a.get("nice_role", "")
+        app_baselines[aid] = float(a.get("baseline", default_baseline))
+
+    category_to_role: Dict[str, str] = {}
+    for cat, c in raw["categories"].items():
+        if c.get("nice_role") not in role_names:
+            errors.append(f"category {cat}: unknown work role {c.get('nice_role')}")
+        category_to_role[cat] = c.get("nice_role", "")
+
+    default_role = defaults.get("nice_role", "")
+    default_scenarios = tuple(defaults.get("scenarios", ()))
+    if default_role not in role_names:
+        errors.append(f"defaults: unknown work role {default_role}")
+    if any(s not in scenarios for s in default_scenarios):
+        errors.append(f"defaults: unknown scenarios in {list(default_scenarios)}")
+    if errors:
+        raise CatalogError("Ares catalog invalid:\n  " + "\n  ".join(errors))
+
+    return AresCatalog(
+        version=version,
+        scenarios=scenarios,
+        by_role=by_role,
+        by_category={cat: by_role[rid] for cat, rid in category_to_role.items()},
+        by_type={t: tuple(s.id for s in scenarios.values() if s.type == t) for t in SCENARIO_TYPES},
+        role_names=role_names,
+        role_baselines=role_baselines,
+        role_learning_paths=role_paths,
+        app_role_to_nice=app_to_nice,
+        app_role_baselines=app_baselines,
+        category_to_role=category_to_role,
+        default_baseline=default_baseline,
+        default_role=default_role,
+        default_learning_path=defaults.get("learning_path", "computer_networking"),
+        default_scenarios=default_scenarios,
+    )
+
+
+def load_catalog(path: Path = CATALOG_PATH) -> AresCatalog:
+    data = path.read_bytes()
+    try:
+        raw = json.loads(data)
+    except json.JSONDecodeError as exc:
+        raise CatalogError(f"Ares catalog {path.name}: {exc}") from exc
+    return build_catalog(raw, hashlib.blake2b(data, digest_size=8).hexdigest())
+
+
+_lock = threading.Lock()
+_current: Optional[AresCatalog] = None
+_stamp: Tuple[int, int] = (0, 0)  # (mtime_ns, size) of the loaded file
+_checked_at = 0.0
+_pinned: ContextVar[Optional[AresCatalog]] = ContextVar("ccc_ares_catalog", default=None)
+
+
+def pin_catalog(catalog: Optional[AresCatalog]) -> None:
+    """Serve catalog from get_catalog() in the current context (None: follow the latest)."""
+    _pinned.set(catalog)
+
+
+def get_catalog() -> AresCatalog:
+    """Pinned catalog for this context, else the latest."""
+    pinned = _pinned.get()
+    return pinned if pinned is not None else latest_catalog()
+
+
+def latest_catalog() -> AresCatalog:
+    """Latest catalog; reloads when the file changed (checked at most every CATALOG_CHECK_S)."""
+    global _current, _stamp, _checked_at
+    now = time.monotonic()
+    current = _current
+    if current is not None and now - _checked_at < CATALOG_CHECK_S:
+        return current
+    with _lock:
+        if _current is not None and now - _checked_at < CATALOG_CHECK_S:
+            return _current
+        _checked_at = now
+        st = os.stat(CATALOG_PATH)
+        stamp = (st.st_mtime_ns, st.st_size)
+        if _current is not None and stamp == _stamp:
+            return _current
+        try:
+            catalog = load_catalog(CATALOG_PATH)
+        except CatalogError:
+            if _current is None:
+                raise
+            return _current  # keep serving the last good catalog
+        _current, _stamp = catalog, stamp
+        return catalog
+
+
+def reload_catalog() -> AresCatalog:
+    """Re-check the file now and return the latest catalog."""
+    global _checked_at
+    _checked_at = 0.0
+    return latest_catalog()
+
+
+if __name__ == "__main__":
+    import sys
+
+    try:
+        cat = load_catalog()
+    except CatalogError as exc:
+        print(exc)
+        sys.exit(1)
+    print(
+        f"Ares catalog {cat.version}: {len(cat.by_type['BR'])} Battle Rooms, {len(cat.by_type['M'])} Missions, "
+        f"{len(cat.role_names)} work roles, {len(cat.app_role_to_nice)} app roles, {len(cat.category_to_role)} categories"
+    )
@@ -0,0 +1,386 @@
+"""
+Question bank compiler — validates the CANONICAL_*_WEIGHTS tables against the translation text
+lists once, at build time, and writes a ready-to-load artifact.
+
+Checks (all languages): text/weight table lengths match (no silent CANONICAL_*[0] fallback),
+choice counts match per item and across languages, category codes are NICE codes, weights are
+non-negative with 0 < sum ≤ 1 (sums ≠ 1 are reported as warnings), non-empty text, and bank sizes
+(Explorer 20, Specialist 50, Operator 12, TKS Validation 25, Calibration pool 45), and the
+structure of the compiled Operator decision tree (operator_tree.py) and its equivalence with the
+uncompiled branching rule for every (lang, index, history prefix).
+
+The artifact (data/question_banks.pkl) holds one CompiledBank per (bank, lang): the Question
+objects plus dense choice weight vectors, and ContentTexts (UI strings, NICE role / certification /
+label tables), so a hot reload (content_registry.py) republishes those too. Runtime loading is a
+single unpickle — no checks, no object construction. It is not checked in: build it at deploy / in CI, before workers start.
+A worker that finds it missing or stale says so on stderr and, with CCC_BANK_ARTIFACT=build
+(default), builds and writes it once (later workers load it); CCC_BANK_ARTIFACT=require
+raises BankCompileError instead.
+Build: python -m cyber_career_compass.bank_compiler [--check] [-v]
+"""
+
+import argparse
+import dataclasses
+import hashlib
+import os
+import pickle
+import sys
+import tempfile
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .nice_framework import ALL_CATEGORIES
+from .translations import SUPPORTED_LANGUAGES
+
+ARTIFACT_PATH = Path(__file__).resolve().parent / "data" / "question_banks.pkl"
+ARTIFACT_VERSION = 5
+ARTIFACT_MODE = os.environ.get("CCC_BANK_ARTIFACT", "build").strip().lower()  # "build" | "require"
+
+BANK_SIZES: Dict[str, int] = {
+    "explorer": 20,
+    "specialist": 50,
+    "operator": 12,
+    "tks_validation": 25,
+    "calibration": 45,
+}
+
+WEIGHT_SUM_TOLERANCE = 1e-6
+_CATEGORY_INDEX = {c: i for i, c in enumerate(ALL_CATEGORIES)}
+
+
+class BankCompileError(ValueError):
+    """Raised when a question bank fails build-time validation; message lists every problem."""
+
+
+@dataclass(frozen=True)
+class CompiledBank:
+    """
+    One validated bank for one language. weights[q, c, k] is the weight option c of item q adds
+    to category ALL_CATEGORIES[k] (zero-padded); correct_index is -1 where an item has none.
+    Decision-tree banks (operator_tree.py) also carry children[q, c], the next item id (-1 = end),
+    and base_nodes[step], the item served at step when the prior answer is missing or invalid.
+    """
+
+    name: str
+    lang: str
+    questions: Tuple[Any, ...]
+    weights: np.ndarray
+    n_options: np.ndarray
+    correct_index: np.ndarray
+    children: Optional[np.ndarray] = None
+    base_nodes: Optional[np.ndarray] = None
+
+
+@dataclass(frozen=True, eq=False)
+class ContentTexts:
+    """Display tables served from the content snapshot (translations.get_ui & co., nice_framework lookups)."""
+
+    lang_map: Dict[str, Dict[str, Any]]  # translations.LANG_MAP
+    work_roles: Dict[Any, Any]  # nice_framework.WORK_ROLES
+    certifications: Dict[Any, Any]  # nice_framework.CERTIFICATIONS
+    category_labels: Dict[str, str]  # nice_framework.CATEGORY_LABELS
+
+
+class CompiledArtifact(NamedTuple):
+    banks: Dict[Tuple[str, str], CompiledBank]
+    texts: ContentTexts
+
+
+def source_files() -> List[Path]:
+    here = Path(__file__).resolve().parent
+    return [
+        here / "questions.py",
+        here / "content.py",
+        here / "translations.py",
+        here / "nice_framework.py",
+        here / "operator_tree.py",
+        Path(__file__).resolve(),
+    ]
+
+
+def source_digest() -> str:
+    """SHA-256 over the bank sources; the artifact is stale when this changes."""
+    h = hashlib.sha256()
+    for path in source_files():
+        if path.exists():
+            h.update(path.read_bytes())
+    return h.hexdigest()
+
+
+# ─── Validation ──────────────────────────────────────────────────────────────
+def _table_pairs() -> List[Tuple[str, Callable[[str], List[Dict[str, Any]]], List[List[Dict[str, float]]]]]:
+    """(section, texts(lang), canonical weights) for every translated section of questions.py."""
+    from . import questions as q
+    from . import translations as tr
+
+    return [
+        ("instinct", tr.get_instinct_texts, q.CANONICAL_INSTINCT_WEIGHTS),
+        ("explorer_instinct", tr.get_explorer_instinct_texts, q.CANONICAL_EXPLORER_INSTINCT_WEIGHTS),
+        ("technical", tr.get_technical_texts, q.CANONICAL_TECHNICAL_WEIGHTS),
+        ("deep", tr.get_deep_texts, q.CANONICAL_DEEP_WEIGHTS),
+        ("specialist_tks", tr.get_specialist_tks_texts, q.CANONICAL_SPECIALIST_TKS_WEIGHTS),
+        ("operator", tr.get_operator_texts, q.CANONICAL_OPERATOR_WEIGHTS),
+    ]
+
+
+def _check_weights(where: str, weights: Dict[str, float], errors: List[str], warnings: List[str]) -> None:
+    total = 0.0
+    for cat, w in weights.items():
+        if cat not in _CATEGORY_INDEX:
+            errors.append(f"{where}: unknown category code {cat!r}")
+        if w < 0:
+            errors.append(f"{where}: negative weight {cat}={w}")
+        total += w
+    if total <= 0:
+        errors.append(f"{where}: weights sum to {total:g} (must be > 0)")
+    elif total > 1.0 + WEIGHT_SUM_TOLERANCE:
+        errors.append(f"{where}: weights sum to {total:g} (must be ≤ 1)")
+    elif abs(total - 1.0) > WEIGHT_SUM_TOLERANCE:
+        warnings.append(f"{where}: weights sum to {total:g}")
+
+
+def validate_sources(langs: Sequence[str] = SUPPORTED_LANGUAGES) -> Tuple[List[str], List[str]]:
+    """Validate every text/weight table pair in every language. Returns (errors, warnings)."""
+    from .content import TKS_VALIDATION_CHOICES, TKS_VALIDATION_PROMPTS, TKS_VALIDATION_WEIGHTS
+
+    errors: List[str] = []
+    warnings: List[str] = []
+    for section, texts_fn, table in _table_pairs():
+        for i, options in enumerate(table):
+            for j, w in enumerate(options):
+                _check_weights(f"{section}[{i}].choice[{j}]", w, errors, warnings)
+        en_shape: Optional[List[int]] = None
+        for lang in langs:
+            texts = texts_fn(lang)
+            where = f"{section}/{lang}"
+            if len(texts) != len(table):
+                errors.append(f"{where}: {len(texts)} texts vs {len(table)} weight rows")
+            shape = [len(t.get("choices", [])) for t in texts]
+            for i, t in enumerate(texts):
+                if not str(t.get("prompt", "")).strip():
+                    errors.append(f"{where}[{i}]: empty prompt")
+                if any(not str(c).strip() for c in t.get("choices", [])):
+                    errors.append(f"{where}[{i}]: empty choice text")
+                if i < len(table) and len(t.get("choices", [])) != len(table[i]):
+                    errors.append(f"{where}[{i}]: {len(t.get('choices', []))} choices vs {len(table[i])} weight vectors")
+            if en_shape is None:
+                en_shape = shape
+            elif shape != en_shape:
+                errors.append(f"{where}: choice counts {shape} differ from {langs[0]} {en_shape}")
+
+    n_tks = len(TKS_VALIDATION_PROMPTS)
+    if not (n_tks == len(TKS_VALIDATION_CHOICES) == len(TKS_VALIDATION_WEIGHTS)):
+        errors.append(
+            f"tks_validation: {n_tks} prompts, {len(TKS_VALIDATION_CHOICES)} choice lists, {len(TKS_VALIDATION_WEIGHTS)} weight rows"
+        )
+    for i in range(min(n_tks, len(TKS_VALIDATION_CHOICES), len(TKS_VALIDATION_WEIGHTS))):
+        if len(TKS_VALIDATION_CHOICES[i]) != len(TKS_VALIDATION_WEIGHTS[i]):
+            errors.append(f"tks_validation[{i}]: {len(TKS_VALIDATION_CHOICES[i])} choices vs {len(TKS_VALIDATION_WEIGHTS[i])} weight vectors")
+        for j, w in enumerate(TKS_VALIDATION_WEIGHTS[i]):
+            _check_weights(f"tks_validation[{i}].choice[{j}]", w, errors, warnings)
+    return errors, warnings
+
+
+# ─── Compilation ─────────────────────────────────────────────────────────────
+def _bank_builders() -> Dict[str, Callable[[str], Sequence[Any]]]:
+    from .content import get_calibration_pool, get_tks_validation_pool
+    from .questions import get_explorer_questions, get_operator_questions, get_specialist_questions
+
+    return {
+        "explorer": get_explorer_questions,
+        "specialist": get_specialist_questions,
+        "operator": get_operator_questions,
+        "tks_validation": get_tks_validation_pool,
+        "calibration": get_calibration_pool,
+    }
+
+
+def _check_tree(where: str, children: np.ndarray, steps: np.ndarray, n_options: np.ndarray, base_nodes: np.ndarray, errors: List[str]) -> None:
+    """Every node reachable from a base node, edges go exactly one step deeper, leaves only at the last step."""
+    last = int(steps.max())
+    reached = {int(b) for b in base_nodes}
+    for node in range(children.shape[0]):
+        for c in range(int(n_options[node])):
+            child = int(children[node, c])
+            if child < 0:
+                if steps[node] != last:
+                    errors.append(f"{where}: node {node} choice {c} ends the mission at step {steps[node]}")
+            elif child >= children.shape[0] or steps[child] != steps[node] + 1:
+                errors.append(f"{where}: node {node} choice {c} → {child} does not advance one step")
+            else:
+                reached.add(child)
+    if len(reached) != children.shape[0]:
+        errors.append(f"{where}: unreachable nodes {sorted(set(range(children.shape[0])) - reached)}")
+
+
+def compile_bank(name: str, lang: str, questions: Sequence[Any]) -> CompiledBank:
+    """Freeze built Question objects and their dense weight vectors into a CompiledBank."""
+    max_c = max((len(q.choices) for q in questions), default=1)
+    weights = np.zeros((len(questions), max_c, len(ALL_CATEGORIES)), dtype=np.float64)
+    n_options = np.zeros(len(questions), dtype=np.int8)
+    correct = np.full(len(questions), -1, dtype=np.int8)
+    for i, q in enumerate(questions):
+        n_options[i] = len(q.choices)
+        if q.correct_index is not None:
+            correct[i] = q.correct_index
+        for j, choice in enumerate(q.choices):
+            for cat, w in choice.weights.items():
+                weights[i, j, _CATEGORY_INDEX[cat]] = w
+    for arr in (weights, n_options, correct):
+        arr.setflags(write=False)
+    return CompiledBank(name, lang, tuple(questions), weights, n_options, correct)
+
+
+def compile_banks(langs: Sequence[str] = SUPPORTED_LANGUAGES) -> Tuple[Dict[Tuple[str, str], CompiledBank], List[str]]:
+    """
+    Validate, then build every (bank, lang). Raises BankCompileError listing all problems.
+    Returns (banks, warnings).
+    """
+    errors, warnings = validate_sources(langs)
+    banks: Dict[Tuple[str, str], CompiledBank] = {}
+    if not errors:
+        for name, build in _bank_builders().items():
+            for lang in langs:
+                try:
+                    questions = list(build(lang))
+                except (AssertionError, IndexError, KeyError) as exc:
+                    errors.append(f"{name}/{lang}: build failed: {exc!r}")
+                    continue
+                if len(questions) != BANK_SIZES[name]:
+                    errors.append(f"{name}/{lang}: {len(questions)} items, expected {BANK_SIZES[name]}")
+                    continue
+                banks[(name, lang)] = compile_bank(name, lang, questions)
+        from .operator_tree import OPERATOR_TREE_BANK, build_operator_tree, tree_mismatches
+
+        for lang in langs:
+            questions, children, steps, base_nodes = build_operator_tree(lang)
+            bank = compile_bank(OPERATOR_TREE_BANK, lang, questions)
+            where = f"{OPERATOR_TREE_BANK}/{lang}"
+            _check_tree(where, children, steps, bank.n_options, base_nodes, errors)
+            mismatches = tree_mismatches(lang, questions, children, base_nodes)
+            if mismatches:
+                errors.append(f"{where}: {len(mismatches)} cases differ from the branching rule, e.g. {', '.join(mismatches[:3])}")
+            for arr in (children, base_nodes):
+                arr.setflags(write=False)
+            banks[(OPERATOR_TREE_BANK, lang)] = dataclasses.replace(bank, children=children, base_nodes=base_nodes)
+    if errors:
+        raise BankCompileError("Question bank validation failed:\n  " + "\n  ".join(errors))
+    return banks, warnings
+
+
+def compile_texts() -> ContentTexts:
+    """Snapshot of the display tables as currently imported (a fresh interpreter sees the edited files)."""
+    from . import nice_framework, translations
+
+    return ContentTexts(
+        translations.LANG_MAP,
+        nice_framework.WORK_ROLES,
+        nice_framework.CERTIFICATIONS,
+        nice_framework.CATEGORY_LABELS,
+    )
+
+
+def write_artifact(path: Path = ARTIFACT_PATH, langs: Sequence[str] = SUPPORTED_LANGUAGES) -> List[str]:
+    """Compile and write the artifact. Returns validation warnings."""
+    banks, warnings = compile_banks(langs)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    payload = {"version": ARTIFACT_VERSION, "digest": source_digest(), "banks": banks, "texts": compile_texts()}
+    # A private temp file per writer: workers cold-starting together (or hot-reload builds) each
+    # publish a complete artifact with an atomic rename; the last one wins, all are identical.
+    fd, tmp = tempfile.mkstemp(prefix=f".{path.name}.", suffix=".tmp", dir=path.parent)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            pickle.dump(payload, f, protocol=pickle.HIGHEST_PROTOCOL)
+            f.flush()
+            os.fsync(f.fileno())
+        os.chmod(tmp, 0o644)  # mkstemp creates 0600; the artifact is read by every worker
+        os.replace(tmp, path)
+    except BaseException:
+        Path(tmp).unlink(missing_ok=True)
+        raise
+    return warnings
+
+
+# ─── Runtime loading ─────────────────────────────────────────────────────────
+def read_artifact(path: Path = ARTIFACT_PATH, digest: Optional[str] = None) -> Optional[CompiledArtifact]:
+    """Banks and texts from the artifact, or None when it is missing, from another version, or not built from digest (default: current sources)."""
+    try:
+        with open(path, "rb") as f:
+            payload = pickle.load(f)
+    except Exception:  # missing, truncated, or pickled by incompatible code: rebuild rather than crash
+        return None
+    if not isinstance(payload, dict) or payload.get("version") != ARTIFACT_VERSION or payload.get("digest") != (digest or source_digest()):
+        return None
+    return CompiledArtifact(payload["banks"], payload["texts"])
+
+
+@lru_cache(maxsize=1)
+def load_compiled_artifact(path: Path = ARTIFACT_PATH) -> CompiledArtifact:
+    """
+    Load the artifact once per process. When it is missing, stale (sources changed) or from another
+    version: raise under CCC_BANK_ARTIFACT=require, else build and write it (never serve unvalidated
+    banks). Later source edits are picked up by content_registry, not here.
+    """
+    artifact = read_artifact(path)
+    if artifact is not None:
+        return artifact
+    hint = "build it at deploy: python -m cyber_career_compass.bank_compiler"
+    if ARTIFACT_MODE == "require":
+        raise BankCompileError(f"{path} is missing or stale (CCC_BANK_ARTIFACT=require); {hint}")
+    print(f"[banks] {path} is missing or stale; compiling at startup ({hint})", file=sys.stderr)
+    try:
+        write_artifact(path)
+    except OSError as exc:
+        print(f"[banks] could not write {path} ({exc}); every worker will compile", file=sys.stderr)
+        return CompiledArtifact(compile_banks()[0], compile_texts())
+    artifact = read_artifact(path)
+    if artifact is None:
+        raise BankCompileError(f"{path} does not load back after a build")
+    return artifact
+
+
+def load_compiled_banks(path: Path = ARTIFACT_PATH) -> Dict[Tuple[str, str], CompiledBank]:
+    return load_compiled_artifact(path).banks
+
+
+def get_compiled_bank(name: str, lang: str) -> CompiledBank:
+    """Bank from the active content snapshot (the session's pinned version, else the latest)."""
+    from .content_registry import get_content
+
+    banks = get_content().banks
+    return banks.get((name, lang)) or banks[(name, SUPPORTED_LANGUAGES[0])]
+
+
+def get_compiled_questions(name: str, lang: str) -> Tuple[Any, ...]:
+    """Bank loader for session.register_bank: the compiled Question tuple."""
+    return get_compiled_bank(name, lang).questions
+
+
+if __name__ == "__main__":
+    # Build through the package module so the artifact pickles cyber_career_compass.bank_compiler.CompiledBank,
+    # not __main__.CompiledBank (which no other process could unpickle).
+    from . import bank_compiler as compiler
+
+    parser = argparse.ArgumentParser(description="Validate the question banks and write the compiled artifact")
+    parser.add_argument("--check", action="store_true", help="validate only; do not write the artifact")
+    parser.add_argument("-v", "--verbose", action="store_true", help="list every warning")
+    args = parser.parse_args()
+    try:
+        warns = compiler.compile_banks()[1] if args.check else compiler.write_artifact()
+    except compiler.BankCompileError as exc:
+        print(exc, file=sys.stderr)
+        sys.exit(1)
+    for w in warns if args.verbose else []:
+        print(f"warning: {w}")
+    print(f"{len(warns)} warnings (choice weights not summing to 1.0)")
+    if args.check:
+        sys.exit(0)
+    artifact = compiler.read_artifact()
+    if artifact is None:
+        print(f"{ARTIFACT_PATH} does not load back", file=sys.stderr)
+        sys.exit(1)
+    print(f"Wrote {ARTIFACT_PATH} ({len(artifact.banks)} banks)")
@@ -0,0 +1,818 @@
+"""
+Cache layer — named caches over interchangeable backends (tiers), each with TTL, size-based
+eviction and hit/miss/eviction counters. Everything is in-process or local to the host; no
+external services.
+
+Backends:
+- MemoryCache: per-process LRU of live objects (max_entries, optional max_bytes, ttl_s).
+- SharedMemoryCache: one multiprocessing.shared_memory segment per cache, shared by every worker
+  process on the host. Set-associative (SHM_WAYS slots per bucket; the least recently used slot
+  of a full bucket is evicted); values are pickled into fixed-size slots and larger ones are
+  rejected. An flock() on a lock file in CACHE_DIR serialises access across processes. POSIX only.
+- DiskCache: one file per key under CCC_CACHE_DIR/<cache>, written with an atomic rename; past
+  max_bytes the least recently used files are removed down to DISK_LOW_WATER. Survives restarts
+  and can be shared by replicas that mount the same directory (and run as the same user).
+
+Both cross-process tiers unpickle what other processes wrote, so they only trust this user:
+CACHE_DIR (default <tmp>/ccc-cache-<uid>) must be a directory owned by the user with mode 0700,
+files and segments owned by anyone else are refused, and every payload carries a keyed BLAKE2b
+MAC checked before pickle.loads(). The key is CCC_CACHE_SECRET, else a random key created once
+in <dir>/cache.key (0600) and shared by every process that uses the directory.
+
+get_cache(name, ...) returns the process-wide TieredCache for name. Lookups go through its tiers
+in order, and a hit in a lower tier is copied into the tiers above it. Shareable caches (values
+pickle; keys are str/int/float/bool/None or tuples of them) use the tiers listed in
+CCC_CACHE_TIERS (default "memory"; e.g. "memory,shm,disk"); the others hold live objects and use
+the memory tier only. A tier that cannot be opened is skipped with a warning.
+Stats: cache_stats(); metrics.render_prometheus() exports them as ccc_cache_* series.
+Check: python -m cyber_career_compass.cache [--unlink]
+"""
+
+import hashlib
+import hmac
+import os
+import pickle
+import stat
+import struct
+import sys
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Callable, Dict, Hashable, Iterator, List, Optional, Sequence
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover  (Windows: no shared-memory tier)
+    fcntl = None  # type: ignore[assignment]
+
+_UID = os.getuid() if hasattr(os, "getuid") else None  # None: no ownership checks (Windows)
+
+CACHE_TIERS = os.environ.get("CCC_CACHE_TIERS", "memory")
+CACHE_DIR = Path(os.environ.get("CCC_CACHE_DIR") or Path(tempfile.gettempdir()) / f"ccc-cache-{_UID if _UID is not None else 'user'}")
+TIER_NAMES = ("memory", "shm", "disk")
+
+DISK_MAX_BYTES = 256 * 1024 * 1024
+DISK_LOW_WATER = 0.9  # evict down to this fraction of max_bytes
+SHM_WAYS = 4
+SHM_SLOTS = 256
+SHM_SLOT_BYTES = 16 * 1024
+MAC_BYTES = 16
+SECRET_FILE = "cache.key"
+
+MISSING = object()  # get() sentinel: cached values may be None
+
+
+class CacheError(RuntimeError):
+    """A cache tier could not be opened."""
+
+
+def key_digest(cache: str, key: Hashable) -> bytes:
+    """16-byte digest of (cache, key) for the cross-process tiers; repr() of the supported key types is stable."""
+    return hashlib.blake2b(f"{cache}\0{key!r}".encode(), digest_size=16, person=b"ccc-cache").digest()
+
+
+# ─── Trust: private directory, owned files, payload MACs ─────────────────────
+def _check_private(st: os.stat_result, what: str) -> None:
+    """Raise CacheError unless st belongs to this user and grants nothing to group/others."""
+    if _UID is not None and (st.st_uid != _UID or st.st_mode & 0o077):
+        raise CacheError(f"{what} must be owned by uid {_UID} with no group/other access "
+                         f"(is uid {st.st_uid}, mode {stat.S_IMODE(st.st_mode):o})")
+
+
+def private_dir(path: Path) -> Path:
+    """Create path (0700) if missing; CacheError unless it is a real directory only this user can open."""
+    try:
+        path.mkdir(mode=0o700, parents=True, exist_ok=True)
+        st = os.lstat(path)
+    except OSError as exc:
+        raise CacheError(f"cache directory {path}: {exc}") from exc
+    if not stat.S_ISDIR(st.st_mode):
+        raise CacheError(f"cache directory {path} is not a directory")
+    _check_private(st, f"cache directory {path}")
+    return path
+
+
+def read_private(path: Path) -> bytes:
+    """Contents of a regular file owned by this user (no symlinks); OSError/CacheError otherwise."""
+    fd = os.open(path, os.O_RDONLY | getattr(os, "O_NOFOLLOW", 0))
+    with os.fdopen(fd, "rb") as f:
+        st = os.fstat(fd)
+        if not stat.S_ISREG(st.st_mode):
+            raise CacheError(f"{path} is not a regular file")
+        _check_private(st, str(path))
+        return f.read()
+
+
+def write_private(path: Path, data: bytes) -> None:
+    """Create path exclusively with mode 0600 and write data (FileExistsError if it exists)."""
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, "O_NOFOLLOW", 0), 0o600)
+    with os.fdopen(fd, "wb") as f:
+        f.write(data)
+
+
+_secret_lock = threading.Lock()
+_secrets: Dict[Path, bytes] = {}
+
+
+def cache_secret(directory: Path) -> bytes:
+    """MAC key for payloads under directory: CCC_CACHE_SECRET, else directory/cache.key (random, created once)."""
+    env = os.environ.get("CCC_CACHE_SECRET")
+    if env:
+        return hashlib.blake2b(env.encode(), digest_size=32, person=b"ccc-key").digest()
+    with _secret_lock:
+        key = _secrets.get(directory)
+        if key is None:
+            key = _secrets[directory] = _load_secret(private_dir(directory) / SECRET_FILE)
+    return key
+
+
+def _load_secret(path: Path) -> bytes:
+    try:
+        if not path.exists():
+            tmp = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+            write_private(tmp, os.urandom(32))
+            try:
+                os.link(tmp, path)  # atomic publish; the first process wins and the rest read its key
+            except FileExistsError:
+                pass
+            finally:
+                tmp.unlink(missing_ok=True)
+        key = read_private(path)
+    except OSError as exc:
+        raise CacheError(f"cache key {path}: {exc}") from exc
+    if len(key) < 32:
+        raise CacheError(f"cache key {path} is truncated")
+    return key
+
+
+def payload_mac(secret: bytes, digest: bytes, expires: float, data: bytes) -> bytes:
+    """MAC binding a payload to its key digest and expiry (so entries cannot be swapped or extended)."""
+    h = hashlib.blake2b(digest, key=secret, digest_size=MAC_BYTES)
+    h.update(struct.pack("<d", expires))
+    h.update(data)
+    return h.digest()
+
+
+def _approx_size(value: Any) -> int:
+    if isinstance(value, (bytes, bytearray, str)):
+        return len(value)
+    return sys.getsizeof(value)  # shallow; byte budgets on live objects are approximate
+
+
+class CacheStats:
+    __slots__ = ("hits", "misses", "evictions", "expirations", "rejections", "entries", "bytes")
+
+    def __init__(self) -> None:
+        self.reset()
+
+    def reset(self) -> None:
+        self.hits = self.misses = self.evictions = self.expirations = self.rejections = 0
+        self.entries = self.bytes = 0
+
+    def as_dict(self) -> Dict[str, int]:
+        return {name: getattr(self, name) for name in self.__slots__}
+
+
+class CacheBackend:
+    """One tier. get() returns MISSING on a miss; set() returns False when the value was not stored."""
+
+    tier = ""
+
+    def __init__(self, name: str, ttl_s: float = 0.0) -> None:
+        self.name = name
+        self.ttl_s = ttl_s
+        self.stats = CacheStats()
+
+    def get(self, key: Hashable) -> Any:
+        raise NotImplementedError
+
+    def set(self, key: Hashable, value: Any, ttl_s: Optional[float] = None) -> bool:
+        raise NotImplementedError
+
+    def delete(self, key: Hashable) -> None:
+        raise NotImplementedError
+
+    def clear(self) -> None:
+        """Drop every entry and reset the counters."""
+        raise NotImplementedError
+
+    def stats_dict(self) -> Dict[str, int]:
+        return self.stats.as_dict()
+
+    def _expiry(self, ttl_s: Optional[float], now: float) -> float:
+        ttl = self.ttl_s if ttl_s is None else ttl_s
+        return now + ttl if ttl > 0 else 0.0
+
+
+# ─── Memory ──────────────────────────────────────────────────────────────────
+class MemoryCache(CacheBackend):
+    tier = "memory"
+
+    def __init__(self, name: str, max_entries: int = 256, max_bytes: int = 0, ttl_s: float = 0.0,
+                 sizeof: Callable[[Any], int] = _approx_size) -> None:
+        super().__init__(name, ttl_s)
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._sizeof = sizeof
+        self._lock = threading.Lock()
+        self._data: "OrderedDict[Hashable, tuple]" = OrderedDict()  # key → (value, expires (monotonic, 0 = never), size)
+
+    def get(self, key: Hashable) -> Any:
+        with self._lock:
+            item = self._data.get(key)
+            if item is not None and item[1] and time.monotonic() >= item[1]:
+                self._drop(key)
+                self.stats.expirations += 1
+                item = None
+            if item is None:
+                self.stats.misses += 1
+                return MISSING
+            self._data.move_to_end(key)
+            self.stats.hits += 1
+            return item[0]
+
+    def set(self, key: Hashable, value: Any, ttl_s: Optional[float] = None) -> bool:
+        size = self._sizeof(value) if self.max_bytes else 0
+        if self.max_entries <= 0 or (self.max_bytes and size > self.max_bytes):
+            with self._lock:
+                self.stats.rejections += 1
+            return False
+        with self._lock:
+            self._drop(key)
+            self._data[key] = (value, self._expiry(ttl_s, time.monotonic()), size)
+            self.stats.bytes += size
+            while len(self._data) > self.max_entries or (self.max_bytes and self.stats.bytes > self.max_bytes):
+                self._drop(next(iter(self._data)))
+                self.stats.evictions += 1
+            self.stats.entries = len(self._data)
+        return True
+
+    def _drop(self, key: Hashable) -> None:
+        item = self._data.pop(key, None)
+        if item is not None:
+            self.stats.bytes -= item[2]
+            self.stats.entries = len(self._data)
+
+    def delete(self, key: Hashable) -> None:
+        with self._lock:
+            self._drop(key)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+            self.stats.reset()
+
+
+# ─── Shared memory ───────────────────────────────────────────────────────────
+SHM_MAGIC = b"CCCSHM02"
+_SHM_HEADER = struct.Struct("<8sIII")  # magic, buckets, ways, slot_bytes
+SHM_HEADER_BYTES = 64
+_SLOT = struct.Struct(f"<16sddI{MAC_BYTES}s")  # key digest, expires_at (epoch s, 0 = never), last_used, length (0 = empty), MAC
+_EMPTY_SLOT = (b"\0" * 16, 0.0, 0.0, 0, b"\0" * MAC_BYTES)
+
+
+def shm_prefix() -> str:
+    """Segment name prefix: one namespace per checkout, so two deployments on a host do not collide."""
+    root = str(Path(__file__).resolve().parent.parent)
+    return "ccc_" + hashlib.blake2b(root.encode(), digest_size=4).hexdigest()
+
+
+_SHM_TRACK_ARG = sys.version_info >= (3, 13)  # SharedMemory(track=False)
+
+
+def _open_segment(name: str, size: int = 0) -> Any:
+    """Create (size > 0) or attach to a segment that outlives this process."""
+    from multiprocessing import resource_tracker, shared_memory
+
+    kwargs = {"track": False} if _SHM_TRACK_ARG else {}
+    try:
+        if not size:
+            raise FileExistsError(name)
+        shm = shared_memory.SharedMemory(name=name, create=True, size=size, **kwargs)
+    except FileExistsError:
+        shm = shared_memory.SharedMemory(name=name, **kwargs)
+    if not _SHM_TRACK_ARG:
+        # Before 3.13 the resource tracker unlinks every attached segment when this worker exits.
+        resource_tracker.unregister(shm._name, "shared_memory")  # type: ignore[attr-defined]
+    return shm
+
+
+def _unlink_segment(shm: Any) -> None:
+    from multiprocessing import resource_tracker
+
+    if not _SHM_TRACK_ARG:
+        resource_tracker.register(shm._name, "shared_memory")  # type: ignore[attr-defined]  # unlink() unregisters it
+    shm.unlink()
+
+
+class SharedMemoryCache(CacheBackend):
+    tier = "shm"
+
+    def __init__(self, name: str, slots: int = SHM_SLOTS, slot_bytes: int = SHM_SLOT_BYTES, ttl_s: float = 0.0,
+                 segment: Optional[str] = None) -> None:
+        super().__init__(name, ttl_s)
+        if fcntl is None:
+            raise CacheError("shared-memory tier needs fcntl (POSIX)")
+        self.segment = segment or f"{shm_prefix()}_{name}"
+        self._lock = threading.Lock()  # flock() does not exclude threads sharing the descriptor
+        self._secret = cache_secret(CACHE_DIR)
+        self._lock_path = private_dir(CACHE_DIR) / f"{self.segment}.lock"
+        try:
+            self._lock_fd = os.open(self._lock_path, os.O_RDWR | os.O_CREAT | getattr(os, "O_NOFOLLOW", 0), 0o600)
+            _check_private(os.fstat(self._lock_fd), f"shared-memory lock {self._lock_path}")
+        except OSError as exc:
+            raise CacheError(f"shared-memory lock {self._lock_path}: {exc}") from exc
+        buckets = max(1, -(-slots // SHM_WAYS))
+        size = SHM_HEADER_BYTES + buckets * SHM_WAYS * slot_bytes
+        with self._locked():  # creation and header init are atomic across workers
+            try:
+                self._shm = _open_segment(self.segment, size)
+            except (OSError, ValueError) as exc:
+                raise CacheError(f"shared-memory segment {self.segment}: {exc}") from exc
+            try:
+                _check_private(os.fstat(self._shm._fd), f"shared-memory segment {self.segment}")  # type: ignore[attr-defined]
+            except CacheError:
+                self._shm.close()
+                raise
+            buf = self._shm.buf
+            magic, b, w, sb = _SHM_HEADER.unpack_from(buf, 0)
+            if magic != SHM_MAGIC:
+                if self._shm.size < size:
+                    raise CacheError(f"shared-memory segment {self.segment} exists and is not a cache segment")
+                for i in range(buckets * SHM_WAYS):
+                    _SLOT.pack_into(buf, SHM_HEADER_BYTES + i * slot_bytes, *_EMPTY_SLOT)
+                _SHM_HEADER.pack_into(buf, 0, SHM_MAGIC, buckets, SHM_WAYS, slot_bytes)
+                b, w, sb = buckets, SHM_WAYS, slot_bytes
+        self.buckets, self.ways, self.slot_bytes = b, w, sb  # an existing segment keeps its layout
+        self.capacity = sb - _SLOT.size
+
+    @contextmanager
+    def _locked(self) -> Iterator[None]:
+        with self._lock:
+            fcntl.flock(self._lock_fd, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(self._lock_fd, fcntl.LOCK_UN)
+
+    def _offsets(self, digest: bytes) -> range:
+        first = SHM_HEADER_BYTES + (int.from_bytes(digest[:8], "little") % self.buckets) * self.ways * self.slot_bytes
+        return range(first, first + self.ways * self.slot_bytes, self.slot_bytes)
+
+    def get(self, key: Hashable) -> Any:
+        digest = key_digest(self.name, key)
+        now = time.time()
+        payload = None
+        with self._locked():
+            buf = self._shm.buf
+            for off in self._offsets(digest):
+                kd, expires, _, length, mac = _SLOT.unpack_from(buf, off)
+                if kd != digest or not length:
+                    continue
+                if expires and now >= expires:
+                    _SLOT.pack_into(buf, off, *_EMPTY_SLOT)
+                    self.stats.expirations += 1
+                    break
+                data = bytes(buf[off + _SLOT.size: off + _SLOT.size + min(length, self.capacity)])
+                if not hmac.compare_digest(payload_mac(self._secret, digest, expires, data), mac):
+                    _SLOT.pack_into(buf, off, *_EMPTY_SLOT)  # torn or not written with our key
+                    break
+                _SLOT.pack_into(buf, off, kd, expires, now, length, mac)
+                payload = data
+                break
+            if payload is None:
+                self.stats.misses += 1
+                return MISSING
+            self.stats.hits += 1
+        try:
+            return pickle.loads(payload)
+        except Exception:  # written by an incompatible version of a class
+            self.delete(key)
+            return MISSING
+
+    def set(self, key: Hashable, value: Any, ttl_s: Optional[float] = None) -> bool:
+        data = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        if len(data) > self.capacity:
+            with self._lock:
+                self.stats.rejections += 1
+            return False
+        digest = key_digest(self.name, key)
+        now = time.time()
+        with self._locked():
+            buf = self._shm.buf
+            target, evict, oldest = None, False, None
+            for off in self._offsets(digest):
+                kd, expires, last_used, length, _ = _SLOT.unpack_from(buf, off)
+                if kd == digest or not length or (expires and now >= expires):
+                    target = off
+                    break
+                if oldest is None or last_used < oldest[0]:
+                    oldest = (last_used, off)
+            if target is None:
+                target, evict = oldest[1], True  # type: ignore[index]
+            expires = self._expiry(ttl_s, now)
+            buf[target + _SLOT.size: target + _SLOT.size + len(data)] = data
+            _SLOT.pack_into(buf, target, digest, expires, now, len(data), payload_mac(self._secret, digest, expires, data))
+            self.stats.evictions += evict
+        return True
+
+    def delete(self, key: Hashable) -> None:
+        digest = key_digest(self.name, key)
+        with self._locked():
+            for off in self._offsets(digest):
+                if _SLOT.unpack_from(self._shm.buf, off)[0] == digest:
+                    _SLOT.pack_into(self._shm.buf, off, *_EMPTY_SLOT)
+
+    def clear(self) -> None:
+        with self._locked():
+            for i in range(self.buckets * self.ways):
+                _SLOT.pack_into(self._shm.buf, SHM_HEADER_BYTES + i * self.slot_bytes, *_EMPTY_SLOT)
+            self.stats.reset()
+
+    def stats_dict(self) -> Dict[str, int]:
+        """Counters are this process's; entries/bytes are the segment's (all processes)."""
+        now = time.time()
+        with self._locked():
+            entries = size = 0
+            for i in range(self.buckets * self.ways):
+                _, expires, _, length, _ = _SLOT.unpack_from(self._shm.buf, SHM_HEADER_BYTES + i * self.slot_bytes)
+                if length and not (expires and now >= expires):
+                    entries += 1
+                    size += length
+            self.stats.entries, self.stats.bytes = entries, size
+            return self.stats.as_dict()
+
+    def unlink(self) -> None:
+        """Remove the segment from the host (workers still attached keep their mapping)."""
+        _unlink_segment(self._shm)
+        self._lock_path.unlink(missing_ok=True)
+
+
+# ─── Disk ────────────────────────────────────────────────────────────────────
+DISK_MAGIC = b"CCCDSK02"
+_DISK_HEADER = struct.Struct(f"<8sd{MAC_BYTES}s")  # magic, expires_at (epoch s, 0 = never), MAC
+
+
+class DiskCache(CacheBackend):
+    tier = "disk"
+
+    def __init__(self, name: str, root: Path = CACHE_DIR, max_bytes: int = DISK_MAX_BYTES, ttl_s: float = 0.0) -> None:
+        super().__init__(name, ttl_s)
+        self.root = Path(root) / name
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._secret = cache_secret(Path(root))
+        private_dir(self.root)
+        self._scan()
+
+    def _path(self, digest: bytes) -> Path:
+        return self.root / f"{digest.hex()}.bin"
+
+    def _scan(self) -> List[os.DirEntry]:
+        """Entries on disk (all processes), oldest use first; refreshes entries/bytes."""
+        files = []
+        try:
+            with os.scandir(self.root) as it:
+                files = [e for e in it if e.name.endswith(".bin")]
+        except OSError:
+            pass
+        stats = []
+        for e in files:
+            try:
+                stats.append((e.stat().st_mtime, e.stat().st_size, e))
+            except OSError:
+                continue
+        stats.sort(key=lambda s: s[0])
+        with self._lock:
+            self.stats.entries = len(stats)
+            self.stats.bytes = sum(s[1] for s in stats)
+        return [s[2] for s in stats]
+
+    def get(self, key: Hashable) -> Any:
+        digest = key_digest(self.name, key)
+        path = self._path(digest)
+        try:
+            raw = read_private(path)
+        except FileNotFoundError:
+            raw = b""
+        except (OSError, CacheError):
+            raw = b"\0"  # not ours to trust: dropped below
+        value = MISSING
+        expired = False
+        if len(raw) >= _DISK_HEADER.size:
+            magic, expires, mac = _DISK_HEADER.unpack_from(raw, 0)
+            expired = bool(expires) and time.time() >= expires
+            data = raw[_DISK_HEADER.size:]
+            if magic == DISK_MAGIC and not expired and hmac.compare_digest(payload_mac(self._secret, digest, expires, data), mac):
+                try:
+                    value = pickle.loads(data)
+                except Exception:
+                    value = MISSING
+        if raw and value is MISSING:
+            path.unlink(missing_ok=True)  # expired, torn, foreign or from an incompatible version
+        elif value is not MISSING:
+            try:
+                os.utime(path)  # mtime is the LRU clock
+            except OSError:
+                pass
+        with self._lock:
+            self.stats.expirations += expired
+            if value is MISSING:
+                self.stats.misses += 1
+            else:
+                self.stats.hits += 1
+        return value
+
+    def set(self, key: Hashable, value: Any, ttl_s: Optional[float] = None) -> bool:
+        digest = key_digest(self.name, key)
+        expires = self._expiry(ttl_s, time.time())
+        payload = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        data = _DISK_HEADER.pack(DISK_MAGIC, expires, payload_mac(self._secret, digest, expires, payload)) + payload
+        if self.max_bytes and len(data) > self.max_bytes:
+            with self._lock:
+                self.stats.rejections += 1
+            return False
+        path = self._path(digest)
+        tmp = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            write_private(tmp, data)
+            tmp.replace(path)  # a racing replica writes identical content
+        except OSError:
+            tmp.unlink(missing_ok=True)  # best-effort tier
+            return False
+        with self._lock:
+            self.stats.bytes += len(data)
+            self.stats.entries += 1
+            over = self.max_bytes and self.stats.bytes > self.max_bytes
+        if over:
+            self._evict()
+        return True
+
+    def _evict(self) -> None:
+        files = self._scan()  # authoritative: counts other processes' files too
+        target = self.max_bytes * DISK_LOW_WATER
+        total = self.stats.bytes
+        removed = 0
+        for e in files:
+            if total <= target:
+                break
+            try:
+                size = e.stat().st_size
+                os.unlink(e.path)
+            except OSError:
+                continue
+            total -= size
+            removed += 1
+        with self._lock:
+            self.stats.evictions += removed
+            self.stats.bytes = total
+            self.stats.entries -= removed
+
+    def delete(self, key: Hashable) -> None:
+        self._path(key_digest(self.name, key)).unlink(missing_ok=True)
+
+    def clear(self) -> None:
+        for e in self._scan():
+            try:
+                os.unlink(e.path)
+            except OSError:
+                pass
+        with self._lock:
+            self.stats.reset()
+
+    def stats_dict(self) -> Dict[str, int]:
+        """Counters are this process's; entries/bytes are the directory's (all processes)."""
+        self._scan()
+        with self._lock:
+            return self.stats.as_dict()
+
+
+# ─── Tiered cache and registry ───────────────────────────────────────────────
+class TieredCache:
+    """Read-through over tiers (fastest first); set() writes every tier."""
+
+    __slots__ = ("name", "tiers")
+
+    def __init__(self, name: str, tiers: Sequence[CacheBackend]) -> None:
+        self.name = name
+        self.tiers = tuple(tiers)
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        for i, tier in enumerate(self.tiers):
+            value = tier.get(key)
+            if value is not MISSING:
+                for upper in self.tiers[:i]:
+                    upper.set(key, value)
+                return value
+        return default
+
+    def set(self, key: Hashable, value: Any, ttl_s: Optional[float] = None) -> None:
+        for tier in self.tiers:
+            tier.set(key, value, ttl_s)
+
+    def get_or_build(self, key: Hashable, build: Callable[[], Any], ttl_s: Optional[float] = None) -> Any:
+        """Cached value for key, else build() stored in every tier (built outside any lock; a racing duplicate is identical)."""
+        value = self.get(key, MISSING)
+        if value is MISSING:
+            value = build()
+            self.set(key, value, ttl_s)
+        return value
+
+    def delete(self, key: Hashable) -> None:
+        for tier in self.tiers:
+            tier.delete(key)
+
+    def clear(self) -> None:
+        for tier in self.tiers:
+            tier.clear()
+
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        return {tier.tier: tier.stats_dict() for tier in self.tiers}
+
+
+def parse_tiers(raw: str) -> List[str]:
+    names = [t.strip().lower() for t in raw.split(",") if t.strip()]
+    unknown = [t for t in names if t not in TIER_NAMES]
+    if unknown:
+        raise ValueError(f"CCC_CACHE_TIERS: unknown tier(s) {unknown} (choose from {', '.join(TIER_NAMES)})")
+    return names
+
+
+_registry_lock = threading.Lock()
+_caches: Dict[str, TieredCache] = {}
+
+
+def get_cache(
+    name: str,
+    max_entries: int = 256,
+    max_bytes: int = 0,
+    ttl_s: float = 0.0,
+    shared: bool = False,
+    disk_max_bytes: int = DISK_MAX_BYTES,
+    shm_slots: int = SHM_SLOTS,
+    shm_slot_bytes: int = SHM_SLOT_BYTES,
+) -> TieredCache:
+    """
+    Process-wide cache `name`, built on first use from these limits (later calls return it as is).
+    max_entries/max_bytes bound the memory tier (max_entries 0 drops it); shared=True adds the
+    CCC_CACHE_TIERS tiers beyond memory.
+    """
+    cache = _caches.get(name)
+    if cache is not None:
+        return cache
+    with _registry_lock:
+        cache = _caches.get(name)
+        if cache is None:
+            tiers: List[CacheBackend] = []
+            for tier in parse_tiers(CACHE_TIERS) if shared else ["memory"]:
+                try:
+                    if tier == "memory":
+                        if max_entries > 0:
+                            tiers.append(MemoryCache(name, max_entries, max_bytes, ttl_s))
+                    elif tier == "shm":
+                        tiers.append(SharedMemoryCache(name, shm_slots, shm_slot_bytes, ttl_s))
+                    else:
+                        tiers.append(DiskCache(name, CACHE_DIR, disk_max_bytes, ttl_s))
+                except CacheError as exc:
+                    print(f"[cache] {name}: {tier} tier unavailable ({exc})", file=sys.stderr)
+            cache = _caches[name] = TieredCache(name, tiers)
+    return cache
+
+
+def cache_stats() -> Dict[str, Dict[str, Dict[str, int]]]:
+    """cache name → tier → counters (hits, misses, evictions, expirations, rejections, entries, bytes)."""
+    return {name: cache.stats() for name, cache in sorted(_caches.items())}
+
+
+def prometheus_lines() -> List[str]:
+    """ccc_cache_* series for metrics.render_prometheus()."""
+    stats = cache_stats()
+    if not stats:
+        return []
+    series = [
+        ("ccc_cache_hits_total", "counter", "hits", "Cache lookups served by the tier."),
+        ("ccc_cache_misses_total", "counter", "misses", "Cache lookups the tier could not serve."),
+        ("ccc_cache_evictions_total", "counter", "evictions", "Entries evicted to stay within size limits."),
+        ("ccc_cache_expirations_total", "counter", "expirations", "Entries dropped after their TTL."),
+        ("ccc_cache_rejections_total", "counter", "rejections", "Values too large for the tier."),
+        ("ccc_cache_entries", "gauge", "entries", "Entries held by the tier."),
+        ("ccc_cache_bytes", "gauge", "bytes", "Bytes held by the tier."),
+    ]
+    lines: List[str] = []
+    for metric, kind, field, help_text in series:
+        lines.append(f"# HELP {metric} {help_text}")
+        lines.append(f"# TYPE {metric} {kind}")
+        for name, tiers in stats.items():
+            for tier, counters in tiers.items():
+                lines.append(f'{metric}{{cache="{name}",tier="{tier}"}} {counters[field]}')
+    return lines
+
+
+def unlink_shared() -> List[str]:
+    """Remove this checkout's shared-memory segments (and lock files) from the host."""
+    removed = []
+    prefix = shm_prefix()
+    shm_dir = Path("/dev/shm")
+    names = sorted(p.name for p in shm_dir.glob(f"{prefix}_*")) if shm_dir.is_dir() else []
+    for segment in names:
+        try:
+            _unlink_segment(_open_segment(segment))
+        except OSError:
+            continue
+        (CACHE_DIR / f"{segment}.lock").unlink(missing_ok=True)
+        removed.append(segment)
+    return removed
+
+
+if __name__ == "__main__":
+    import subprocess
+
+    if "--unlink" in sys.argv:
+        for segment in unlink_shared():
+            print(f"unlinked {segment}")
+        sys.exit(0)
+
+    # Memory: LRU by entries and bytes, TTL
+    mem = MemoryCache("selftest", max_entries=2, max_bytes=10, ttl_s=0.05)
+    mem.set("a", b"12345")
+    mem.set("b", b"12345")
+    mem.get("a")
+    mem.set("c", b"1")  # over 2 entries → evicts b (least recently used)
+    assert mem.get("b") is MISSING and mem.get("a") == b"12345"
+    assert not mem.set("big", b"x" * 11)
+    time.sleep(0.06)
+    assert mem.get("a") is MISSING and mem.stats.expirations >= 1
+    print(f"memory  ok  {mem.stats_dict()}")
+
+    # Shared memory: visible from another process, bucket eviction, oversize rejection, TTL
+    segment = f"{shm_prefix()}_selftest_{os.getpid()}"
+    shm = SharedMemoryCache("selftest", slots=8, slot_bytes=512, ttl_s=0.0, segment=segment)
+    try:
+        shm.set(("dossier", 1), {"pdf": b"%PDF" * 10})
+        child = (
+            "import sys; sys.path.insert(0, sys.argv[1])\n"
+            "from cyber_career_compass.cache import SharedMemoryCache\n"
+            "c = SharedMemoryCache('selftest', slots=8, slot_bytes=512, segment=sys.argv[2])\n"
+            "v = c.get(('dossier', 1)); c.set('from-child', 42)\n"
+            "print('ok' if v == {'pdf': b'%PDF' * 10} else 'bad')\n"
+        )
+        out = subprocess.run([sys.executable, "-c", child, str(Path(__file__).resolve().parent.parent), segment],
+                             capture_output=True, text=True, timeout=60)
+        assert out.stdout.strip() == "ok", out.stderr
+        assert shm.get("from-child") == 42
+        for i in range(40):  # 2 buckets × 4 ways
+            shm.set(("fill", i), i)
+        assert shm.stats.evictions > 0
+        assert not shm.set("big", b"x" * 1024)
+        shm.set("tamper", "original")
+        for off in shm._offsets(key_digest("selftest", "tamper")):  # flip a payload byte: the MAC rejects it
+            if _SLOT.unpack_from(shm._shm.buf, off)[0] == key_digest("selftest", "tamper"):
+                shm._shm.buf[off + _SLOT.size] ^= 0xFF
+        assert shm.get("tamper") is MISSING
+        shm.set("short", 1, ttl_s=0.05)
+        time.sleep(0.06)
+        assert shm.get("short") is MISSING
+        t0 = time.perf_counter()
+        for _ in range(1000):
+            shm.get(("fill", 39))
+        per_get = (time.perf_counter() - t0) * 1000.0
+        print(f"shm     ok  {shm.stats_dict()}  get {per_get:.1f} us")
+    finally:
+        shm.unlink()
+
+    # Disk: round trip, TTL, size eviction down to the low-water mark
+    with tempfile.TemporaryDirectory() as root:
+        disk = DiskCache("selftest", Path(root), max_bytes=4096)
+        disk.set("k", {"v": 1})
+        assert disk.get("k") == {"v": 1}
+        disk.set("short", 1, ttl_s=0.05)
+        time.sleep(0.06)
+        assert disk.get("short") is MISSING
+        for i in range(20):
+            disk.set(("blob", i), b"x" * 400)
+        st = disk.stats_dict()
+        assert st["bytes"] <= 4096 and st["evictions"] > 0, st
+        assert disk.get(("blob", 19)) == b"x" * 400
+        disk.set("tamper", "original")
+        forged = DiskCache("selftest", Path(root) / "other-key")  # same layout, different directory key
+        forged.set("tamper", "forged")
+        os.replace(forged._path(key_digest("selftest", "tamper")), disk._path(key_digest("selftest", "tamper")))
+        assert disk.get("tamper") is MISSING
+        os.chmod(disk.root, 0o755)
+        try:
+            DiskCache("selftest", Path(root))
+            raise AssertionError("a group/other-readable cache directory was accepted")
+        except CacheError:
+            pass
+        print(f"disk    ok  {st}")
+
+    # Tiered: a lower-tier hit fills the tiers above it
+    with tempfile.TemporaryDirectory() as root:
+        tiered = TieredCache("selftest", [MemoryCache("selftest", 8), DiskCache("selftest", Path(root))])
+        tiered.tiers[1].set("x", "from-disk")
+        assert tiered.get("x") == "from-disk" and tiered.tiers[0].get("x") == "from-disk"
+        assert tiered.get_or_build("y", lambda: 7) == 7 and tiered.tiers[1].get("y") == 7
+        print(f"tiered  ok  {tiered.stats()['memory']}")
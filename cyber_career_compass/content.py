@@ -3,19 +3,9 @@ Proving Grounds content: TKS Validation pool and Calibration (20 Personality + 1
 Aligned to NIST NICE Task/Knowledge/Skill statements. Used by Proving Grounds and scoring.
 """
 
-import random
-import sys
-from pathlib import Path
 from typing import Dict, List, Optional, Any
 
-# Questions module moved to workspace root (Cyber Career Builder)
-_here = Path(__file__).resolve().parent
-_root = _here.parent
-_cc_root = _root / "Cyber Career Builder"
-if _cc_root.exists() and str(_cc_root) not in sys.path:
-    sys.path.insert(0, str(_cc_root))
-from questions import Question, Choice, get_explorer_instinct_questions, get_technical_questions
-
+from .questions import Question, Choice, get_explorer_instinct_questions, get_technical_questions
 from .nice_framework import (
     CATEGORY_SP,
     CATEGORY_PR,
@@ -90,7 +80,6 @@ TKS_VALIDATION_WEIGHTS: List[List[Dict[str, float]]] = [
     [_w(CATEGORY_OV, 0.5, CATEGORY_AN, 0.3), _w(CATEGORY_PR, 0.5, CATEGORY_OM, 0.3), _w(CATEGORY_SP, 0.4, CATEGORY_OM, 0.3)],
     [_w(CATEGORY_OV, 0.5, CATEGORY_PR, 0.3), _w(CATEGORY_AN, 0.5, CATEGORY_OV, 0.3), _w(CATEGORY_SP, 0.4, CATEGORY_OM, 0.3)],
     [_w(CATEGORY_PR, 0.5, CATEGORY_AN, 0.3), _w(CATEGORY_SP, 0.5, CATEGORY_OM, 0.3), _w(CATEGORY_AN, 0.5, CATEGORY_OV, 0.3)],
-    [_w(CATEGORY_OM, 0.5, CATEGORY_PR, 0.3), _w(CATEGORY_PR, 0.6, CATEGORY_OM, 0.2), _w(CATEGORY_AN, 0.5, CATEGORY_OV, 0.3)],
 ]
 
 # 25 × 3 choice texts (correct / best answer first per row for scoring)
@@ -138,13 +127,19 @@ def get_tks_validation_pool(lang: Optional[str] = None) -> List[Question]:
     return pool
 
 
-def get_tks_validation_questions(lang: Optional[str] = None, n: int = 25, shuffle: bool = True) -> List[Question]:
-    """Return n questions from the TKS Validation pool (default 25). Optionally shuffle."""
-    pool = get_tks_validation_pool(lang)
-    if shuffle:
-        pool = list(pool)
-        random.shuffle(pool)
-    return pool[:n]
+def get_tks_validation_questions(
+    lang: Optional[str] = None, n: int = 25, shuffle: bool = True, seed: Optional[int] = None
+) -> List[Question]:
+    """
+    Return n questions from the TKS Validation pool (default 25). Optionally shuffle (seeded when seed is given).
+    Questions are the shared compiled objects; only the order is new per call.
+    """
+    from .bank_compiler import get_compiled_questions
+    from .validation_sprint import tks_permutation
+
+    pool = get_compiled_questions("tks_validation", lang or "en")
+    order = tks_permutation(seed, len(pool)) if shuffle else range(len(pool))
+    return [pool[i] for i in order[:n]]
 
 
 # ─── Calibration: 20 Personality + 10 Core = 30 questions (replaces 25-question block) ───
@@ -153,6 +148,17 @@ CALIBRATION_CORE_COUNT = 10
 CALIBRATION_TOTAL = CALIBRATION_PERSONALITY_COUNT + CALIBRATION_CORE_COUNT  # 30
 
 
+def get_calibration_pool(lang: Optional[str] = None) -> List[Question]:
+    """
+    Return the 45-question pool that every Calibration run draws from:
+    10 Explorer Instinct, then the 25-question TKS Validation pool, then 10 Core Technical.
+    Sessions keep only an index order into this pool (see validation_sprint.draw_sprint).
+    """
+    instinct = get_explorer_instinct_questions(lang)[:10]
+    core = get_technical_questions(lang)[:CALIBRATION_CORE_COUNT]
+    return list(instinct) + get_tks_validation_pool(lang) + list(core)
+
+
 def get_calibration_questions(lang: Optional[str] = None, shuffle_personality: bool = True) -> List[Question]:
     """
     Return exactly 30 questions for Proving Ground Calibration:
@@ -160,19 +166,7 @@ def get_calibration_questions(lang: Optional[str] = None, shuffle_personality: b
     - 10 Core Technical Scenarios.
     Order: 20 personality first, then 10 core. Personality block can be shuffled.
     """
-    personality: List[Question] = []
-    # 10 from Explorer Instinct (personality)
-    instinct = get_explorer_instinct_questions(lang)
-    personality.extend(instinct[:10])
-    # 10 more from TKS Validation pool (scenario/personality-style)
-    tks_pool = list(get_tks_validation_pool(lang))
-    if shuffle_personality:
-        random.shuffle(tks_pool)
-    for q in tks_pool:
-        if len(personality) >= CALIBRATION_PERSONALITY_COUNT:
-            break
-        personality.append(q)
-    personality = personality[:CALIBRATION_PERSONALITY_COUNT]
+    from .validation_sprint import draw_sprint
 
-    core = get_technical_questions(lang)[:CALIBRATION_CORE_COUNT]
-    return personality + core
+    pool = get_calibration_pool(lang)
+    return [pool[i] for i in draw_sprint(shuffle=shuffle_personality)]
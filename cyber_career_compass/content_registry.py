@@ -0,0 +1,237 @@
+"""
+Content registry — versioned, hot-reloadable snapshots of the assessment content.
+
+A ContentSnapshot pairs the compiled question banks and display texts (built from questions.py,
+content.py, translations.py, nice_framework.py, operator_tree.py; see bank_compiler.source_files)
+with the Ares catalog (data/ares_catalog.json). Its `version` is a digest of both, and every derived cache
+keys on it or on the snapshot object (session.get_shared_bank, training_plan coverage index).
+
+- start_content_watcher() polls the source files' mtime/size every CONTENT_POLL_S
+  (CCC_CONTENT_POLL_S; "0" disables). Changed bank sources are recompiled in a fresh interpreter
+  (python -m cyber_career_compass.bank_compiler, which validates and writes the artifact
+  atomically), so this process never imports half-edited modules; a failed build keeps the
+  current version. The new snapshot is published with one assignment.
+- Sessions hold a reference to the snapshot they started on and pin it per script run (pin);
+  get_content() / ares_catalog.get_catalog() then resolve to it, so an in-flight assessment
+  finishes on its version. Old snapshots are freed once no session references them.
+- Texts: UI strings and labels (translations.get_ui & co.) and the NICE work role / certification
+  / category label lookups read loaded_texts(), the pinned (else latest) snapshot's tables, so
+  edits to translations.py and nice_framework.py hot-reload too. Constants imported by value
+  (category codes, ROLE_CATEGORY_WEIGHTS, SUPPORTED_LANGUAGES) still need a worker restart.
+Check: python -m cyber_career_compass.content_registry [--watch]
+"""
+
+import hashlib
+import os
+import subprocess
+import sys
+import threading
+import time
+import weakref
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from .ares_catalog import CATALOG_PATH, AresCatalog, CatalogError, pin_catalog, reload_catalog
+
+CONTENT_POLL_S = float(os.environ.get("CCC_CONTENT_POLL_S", "2.0") or 0)
+BANK_BUILD_TIMEOUT_S = 300.0
+
+
+@dataclass(frozen=True, eq=False)
+class ContentSnapshot:
+    """One immutable content version. Hashes by identity."""
+
+    version: str
+    banks: Dict[Tuple[str, str], Any]  # (bank, lang) → CompiledBank
+    texts: Any  # bank_compiler.ContentTexts
+    bank_digest: str  # bank_compiler.source_digest() of the sources the banks were built from
+    catalog: AresCatalog
+    published_at: float
+
+
+def _version(bank_digest: str, catalog: AresCatalog) -> str:
+    return hashlib.blake2b(f"{bank_digest}:{catalog.version}".encode(), digest_size=6).hexdigest()
+
+
+_lock = threading.RLock()
+_current: Optional[ContentSnapshot] = None
+_by_version: "weakref.WeakValueDictionary[str, ContentSnapshot]" = weakref.WeakValueDictionary()
+_pinned: ContextVar[Optional[ContentSnapshot]] = ContextVar("ccc_content", default=None)
+_failed_digest: Optional[str] = None  # bank sources that last failed to compile (not retried until edited)
+
+
+def _publish(artifact: Any, bank_digest: str, catalog: AresCatalog) -> ContentSnapshot:
+    global _current
+    snapshot = ContentSnapshot(_version(bank_digest, catalog), artifact.banks, artifact.texts, bank_digest, catalog, time.time())
+    with _lock:
+        _by_version[snapshot.version] = snapshot
+        _current = snapshot
+    return snapshot
+
+
+def latest_content() -> ContentSnapshot:
+    """Newest published snapshot (ignores pins). The first call loads the artifact and catalog."""
+    current = _current
+    if current is not None:
+        return current
+    with _lock:
+        if _current is not None:
+            return _current
+        from .bank_compiler import load_compiled_artifact, source_digest
+
+        return _publish(load_compiled_artifact(), source_digest(), reload_catalog())
+
+
+def get_content(version: Optional[str] = None) -> ContentSnapshot:
+    """Snapshot for version when still referenced, else the pinned snapshot, else the latest."""
+    if version is not None:
+        snapshot = _by_version.get(version)
+        if snapshot is not None:
+            return snapshot
+    pinned = _pinned.get()
+    return pinned if pinned is not None else latest_content()
+
+
+def loaded_texts() -> Any:
+    """Texts of the pinned, else latest, snapshot without loading content (None before the first load)."""
+    snapshot = _pinned.get() or _current
+    return snapshot.texts if snapshot is not None else None
+
+
+def content_version() -> str:
+    return get_content().version
+
+
+def pin(snapshot: Optional[ContentSnapshot]) -> None:
+    """Resolve get_content() / get_catalog() to snapshot in the current context (None: latest)."""
+    _pinned.set(snapshot)
+    pin_catalog(snapshot.catalog if snapshot is not None else None)
+
+
+@contextmanager
+def pinned(snapshot: Optional[ContentSnapshot]) -> Iterator[None]:
+    token = _pinned.set(snapshot)
+    try:
+        pin_catalog(snapshot.catalog if snapshot is not None else None)
+        yield
+    finally:
+        _pinned.reset(token)
+        restored = _pinned.get()
+        pin_catalog(restored.catalog if restored is not None else None)
+
+
+# ─── Rebuild ─────────────────────────────────────────────────────────────────
+def _build_banks(digest: str) -> Any:
+    """Compile banks and texts in a fresh interpreter (sees the edited sources) and load the artifact (None on failure)."""
+    from .bank_compiler import ARTIFACT_PATH, read_artifact
+
+    artifact = read_artifact(ARTIFACT_PATH, digest)  # another worker may have built it already
+    if artifact is not None:
+        return artifact
+    package_root = Path(__file__).resolve().parent.parent
+    try:
+        proc = subprocess.run(
+            [sys.executable, "-m", "cyber_career_compass.bank_compiler"],
+            cwd=package_root,
+            capture_output=True,
+            text=True,
+            timeout=BANK_BUILD_TIMEOUT_S,
+        )
+    except (OSError, subprocess.TimeoutExpired) as exc:
+        print(f"[content] bank build failed: {exc!r}", file=sys.stderr)
+        return None
+    if proc.returncode != 0:
+        print(f"[content] bank build failed, keeping current content:\n{proc.stderr.strip()}", file=sys.stderr)
+        return None
+    return read_artifact(ARTIFACT_PATH, digest)
+
+
+def refresh() -> Optional[ContentSnapshot]:
+    """Rebuild whatever changed on disk and publish a new snapshot. Returns it, or None when unchanged/failed."""
+    global _failed_digest
+    from .bank_compiler import source_digest
+
+    with _lock:
+        current = latest_content()
+        digest = source_digest()
+        built = None
+        if digest != current.bank_digest and digest != _failed_digest:
+            built = _build_banks(digest)
+            _failed_digest = digest if built is None else None
+        artifact = built or current  # a snapshot has .banks / .texts like a CompiledArtifact
+        bank_digest = digest if built is not None else current.bank_digest
+        try:
+            catalog = reload_catalog()
+        except (CatalogError, OSError):
+            catalog = current.catalog
+        if built is None and catalog is current.catalog:
+            return None
+        return _publish(artifact, bank_digest, catalog)
+
+
+# ─── Watcher ─────────────────────────────────────────────────────────────────
+def content_sources() -> List[Path]:
+    from .bank_compiler import source_files
+
+    return source_files() + [CATALOG_PATH]
+
+
+def _stamps(paths: List[Path]) -> Tuple[Tuple[int, int], ...]:
+    out = []
+    for path in paths:
+        try:
+            st = path.stat()
+            out.append((st.st_mtime_ns, st.st_size))
+        except OSError:
+            out.append((0, 0))
+    return tuple(out)
+
+
+_watcher_started = False
+
+
+def start_content_watcher(poll_s: float = CONTENT_POLL_S) -> bool:
+    """Poll the content sources on a daemon thread (once per process) and refresh() on change."""
+    global _watcher_started
+    with _lock:
+        if _watcher_started or poll_s <= 0:
+            return False
+        _watcher_started = True
+    paths = content_sources()
+
+    def _watch() -> None:
+        seen = _stamps(paths)
+        while True:
+            time.sleep(poll_s)
+            stamps = _stamps(paths)
+            if stamps == seen:
+                continue
+            seen = stamps
+            try:
+                refresh()
+            except Exception as exc:  # the watcher must outlive a bad edit
+                print(f"[content] refresh failed: {exc!r}", file=sys.stderr)
+
+    threading.Thread(target=_watch, name="ccc-content-watcher", daemon=True).start()
+    return True
+
+
+if __name__ == "__main__":
+    t0 = time.perf_counter()
+    snap = latest_content()
+    print(f"content {snap.version}: {len(snap.banks)} banks, Ares catalog {snap.catalog.version} ({(time.perf_counter() - t0) * 1000:.0f} ms)")
+    for p in content_sources():
+        print(f"  watching {p}")
+    if "--watch" in sys.argv:
+        start_content_watcher(CONTENT_POLL_S or 2.0)
+        try:
+            while True:
+                time.sleep(1.0)
+                if _current is not snap:
+                    snap = _current
+                    print(f"content {snap.version} published")
+        except KeyboardInterrupt:
+            pass
@@ -0,0 +1,148 @@
+"""
+Dossier identity and artifact cache.
+
+dossier_id() is a BLAKE2b digest of a canonical encoding of the outcome: category scores rounded
+to SCORE_DECIMALS (keys sorted, -0.0 folded to 0.0), technical correct/total, tier, lang, the Ares
+catalog version and DOSSIER_FORMAT. The same outcome gets the same id in every process and replica
+(unlike hash(), which is salted per process); it is shown as the dossier's VERIFICATION_HASH.
+
+get_dossier() returns the DossierArtifacts for that id: top gaps, Ares recommendation cards and
+PDF bytes, built once from the canonical scores (so every artifact is a pure function of the id)
+and kept in the shared "dossier" cache (cache.get_cache): the memory tier holds
+DOSSIER_CACHE_SIZE artifacts (override with CCC_DOSSIER_CACHE; "0" drops it), and the
+CCC_CACHE_TIERS shm/disk tiers let workers on a host, or replicas sharing CCC_CACHE_DIR (and its cache.key), build
+each outcome once. Artifacts are shared between sessions: treat them as read-only.
+Check: python -m cyber_career_compass.dossier
+"""
+
+import hashlib
+import json
+import os
+from dataclasses import dataclass
+from typing import Any, Dict, Optional, Tuple
+
+from .cache import TieredCache, get_cache
+from .metrics import timed
+from .scoring import ScoreState
+
+DOSSIER_FORMAT = 1  # bump when DossierArtifacts or the encoding changes
+SCORE_DECIMALS = 6
+DOSSIER_CACHE_SIZE = 256
+DOSSIER_TTL_S = 24 * 3600.0  # ids carry the content version; the TTL only bounds disk growth
+DOSSIER_SLOT_BYTES = 32 * 1024  # shm slot: pickled artifacts incl. PDF (~6 KB)
+
+
+@dataclass(frozen=True)
+class DossierArtifacts:
+    dossier_id: str
+    gaps: Tuple[Tuple[str, float, str], ...]  # results.get_top_gaps: (category, gap, label)
+    ares_recommendations: Tuple[Dict[str, str], ...]  # scoring.get_ares_recommendations, 4 per category
+    deployments: Tuple[Dict[str, str], ...]  # project_ares.get_recommended_deployments, 4 cards
+    top_category_deployments: Tuple[Dict[str, str], ...]
+    pdf: Optional[bytes]  # None when fpdf2 is not installed or its core fonts cannot render lang
+
+    @property
+    def verification_hash(self) -> str:
+        return self.dossier_id[:12]
+
+
+# ─── Identity ────────────────────────────────────────────────────────────────
+def _canonical(score_state: Any, tier: Optional[str], lang: Optional[str]) -> Dict[str, Any]:
+    from .ares_catalog import get_catalog
+
+    scores = score_state.get_category_scores()
+    return {
+        "format": DOSSIER_FORMAT,
+        "scores": {c: round(float(v), SCORE_DECIMALS) + 0.0 for c, v in sorted(scores.items())},
+        "technical": [int(score_state.technical_correct), int(score_state.technical_total)],
+        "tier": tier or "",
+        "lang": lang or "en",
+        "content": get_catalog().version,
+    }
+
+
+def _digest(canonical: Dict[str, Any]) -> str:
+    encoded = json.dumps(canonical, sort_keys=True, separators=(",", ":")).encode()
+    return hashlib.blake2b(encoded, digest_size=16, person=b"ccc-dossier").hexdigest()
+
+
+def dossier_id(score_state: Any, tier: Optional[str] = None, lang: Optional[str] = None) -> str:
+    """Stable, content-addressed id of this outcome (32 hex chars)."""
+    return _digest(_canonical(score_state, tier, lang))
+
+
+# ─── Build ───────────────────────────────────────────────────────────────────
+def _build_pdf(state: ScoreState, lang: str) -> Optional[bytes]:
+    from .results import build_dossier_pdf
+
+    try:
+        from fpdf.errors import FPDFException
+    except ImportError:
+        return None
+    try:
+        return build_dossier_pdf(state, lang)
+    except FPDFException:  # core fonts are Latin-1 only (ja / zh-TW labels)
+        return None
+
+
+@timed("dossier.build")
+def build_dossier(canonical: Dict[str, Any], did: str) -> DossierArtifacts:
+    from .project_ares import get_recommended_deployments, get_recommended_deployments_by_top_category
+    from .results import PROFESSIONAL_BASELINE, get_top_gaps
+    from .scoring import get_ares_recommendations
+
+    state = ScoreState(dict(canonical["scores"]), *canonical["technical"])
+    lang = canonical["lang"]
+    return DossierArtifacts(
+        dossier_id=did,
+        gaps=tuple(get_top_gaps(state.get_normalized_radar_scores(), PROFESSIONAL_BASELINE, n=3)),
+        ares_recommendations=tuple(get_ares_recommendations(state, max_per_category=4)),
+        deployments=tuple(get_recommended_deployments(state, lang=lang, max_cards=4)),
+        top_category_deployments=tuple(get_recommended_deployments_by_top_category(state, lang=lang, max_cards=4)),
+        pdf=_build_pdf(state, lang),
+    )
+
+
+# ─── Cache ───────────────────────────────────────────────────────────────────
+def _cache() -> TieredCache:
+    raw = os.environ.get("CCC_DOSSIER_CACHE")
+    size = DOSSIER_CACHE_SIZE if raw is None else max(0, int(raw))
+    return get_cache("dossier", max_entries=size, ttl_s=DOSSIER_TTL_S, shared=True, shm_slot_bytes=DOSSIER_SLOT_BYTES)
+
+
+def get_dossier(score_state: Any, tier: Optional[str] = None, lang: Optional[str] = None) -> DossierArtifacts:
+    """Artifacts for this outcome, from the cache tiers or built once (and stored in every tier)."""
+    canonical = _canonical(score_state, tier, lang)
+    did = _digest(canonical)
+    return _cache().get_or_build(did, lambda: build_dossier(canonical, did))
+
+
+def get_dossier_cache_stats() -> Dict[str, Dict[str, int]]:
+    return _cache().stats()
+
+
+def clear_dossier_cache() -> None:
+    """Drop cached artifacts in every tier (shared tiers included)."""
+    _cache().clear()
+
+
+if __name__ == "__main__":
+    import time
+
+    a = ScoreState()
+    for cat, v in (("PR", 2.4), ("AN", 1.1), ("SP", 0.7)):
+        a.add_weights({cat: v})
+    b = ScoreState(dict(reversed(list(a.category_scores.items()))), a.technical_correct, a.technical_total)
+    assert dossier_id(a, "specialist", "en") == dossier_id(b, "specialist", "en"), "id depends on key order"
+    assert dossier_id(a, "specialist", "en") != dossier_id(a, "explorer", "en")
+    assert dossier_id(a, "specialist", "en") != dossier_id(a, "specialist", "ja")
+    t0 = time.perf_counter()
+    first = get_dossier(a, "specialist", "en")
+    t1 = time.perf_counter()
+    again = get_dossier(b, "specialist", "en")
+    t2 = time.perf_counter()
+    assert again == first
+    print(f"dossier {first.dossier_id}: build {(t1 - t0) * 1000:.1f} ms, cached {(t2 - t1) * 1000:.3f} ms")
+    print(f"  {len(first.gaps)} gaps, {len(first.ares_recommendations)} Ares recs, "
+          f"{len(first.deployments) + len(first.top_category_deployments)} deployment cards, PDF {len(first.pdf or b'')} B")
+    print(f"  cache {get_dossier_cache_stats()}")
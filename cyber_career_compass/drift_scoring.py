@@ -0,0 +1,162 @@
+"""
+Nobel drift scoring (Stockholm Math) — vectorized over Proving Ground rounds.
+
+Per round: score = base_ksa · accuracy / (max(time, min_time) / reference_time), capped at
+intel_cap · base_ksa when the [INTEL] brief was used, × sluggish_multiplier above the sluggish
+threshold, × the round's geometry multiplier (Boundary Purge proximity). Penalty constants live in
+DriftConstants, so historical rounds can be rescored under new ones in one pass.
+
+Input is a RoundLog: parallel arrays (run_id, module, base_ksa, correct, time_taken, used_intel,
+multiplier) for one Identity/Boundary/Integrity triad or a whole cohort.
+Benchmark: python -m cyber_career_compass.drift_scoring --rounds 1000000
+"""
+
+import argparse
+import time
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+
+PROVING_MODULES = ("identity_strike", "boundary_purge", "integrity_sync")
+MODULE_CODES: Dict[str, int] = {m: i for i, m in enumerate(PROVING_MODULES)}
+MODULE_BASE_KSA: Dict[str, float] = {"identity_strike": 0.06, "boundary_purge": 0.05, "integrity_sync": 0.06}
+TRIAD_BASE_KSA = 1.0
+
+
+@dataclass(frozen=True)
+class DriftConstants:
+    reference_time_s: float = 3.0
+    min_time_s: float = 0.1
+    intel_cap: float = 0.2
+    sluggish_threshold_s: float = 3.0
+    sluggish_multiplier: float = 0.6
+
+
+DEFAULT_DRIFT = DriftConstants()
+
+
+def drift_scores(
+    base_ksa: np.ndarray,
+    correct: np.ndarray,
+    time_taken: np.ndarray,
+    used_intel: np.ndarray,
+    constants: DriftConstants = DEFAULT_DRIFT,
+) -> np.ndarray:
+    """Vectorized drift per round (0.0 for incorrect rounds)."""
+    base = np.asarray(base_ksa, dtype=np.float64)
+    t = np.maximum(np.asarray(time_taken, dtype=np.float64), constants.min_time_s)
+    score = base / (t / constants.reference_time_s)
+    score = np.where(np.asarray(used_intel, dtype=bool), np.minimum(score, base * constants.intel_cap), score)
+    score = np.where(t > constants.sluggish_threshold_s, score * constants.sluggish_multiplier, score)
+    return np.where(np.asarray(correct, dtype=bool), np.maximum(score, 0.0), 0.0)
+
+
+def drift_score(base_ksa: float, is_correct: bool, time_taken: float, used_intel: bool, constants: DriftConstants = DEFAULT_DRIFT) -> float:
+    """Scalar drift for one round (render path); same rule as drift_scores."""
+    if not is_correct:
+        return 0.0
+    t = max(time_taken, constants.min_time_s)
+    score = base_ksa / (t / constants.reference_time_s)
+    if used_intel:
+        score = min(score, base_ksa * constants.intel_cap)
+    if t > constants.sluggish_threshold_s:
+        score *= constants.sluggish_multiplier
+    return max(0.0, score)
+
+
+@dataclass
+class RoundLog:
+    """Parallel per-round arrays; one row per answered round."""
+
+    run_id: np.ndarray
+    module: np.ndarray
+    base_ksa: np.ndarray
+    correct: np.ndarray
+    time_taken: np.ndarray
+    used_intel: np.ndarray
+    multiplier: np.ndarray
+
+    @classmethod
+    def from_rows(cls, rows: Sequence[Sequence[float]]) -> "RoundLog":
+        """Rows of (run_id, module code, base_ksa, correct, time_taken, used_intel, multiplier)."""
+        a = np.asarray(rows, dtype=np.float64).reshape(-1, 7)
+        return cls(
+            a[:, 0].astype(np.int64), a[:, 1].astype(np.int8), a[:, 2], a[:, 3].astype(bool),
+            a[:, 4], a[:, 5].astype(bool), a[:, 6],
+        )
+
+    def __len__(self) -> int:
+        return int(self.run_id.size)
+
+
+@dataclass
+class DriftReport:
+    """Per-round deltas, per-(run, module) breakdown and the triad drift per run (runs sorted by id)."""
+
+    deltas: np.ndarray
+    runs: np.ndarray
+    module_drift: np.ndarray  # [run, module] summed deltas
+    module_rounds: np.ndarray  # [run, module] rounds answered
+    module_correct: np.ndarray  # [run, module] rounds correct
+    triad_drift: np.ndarray  # [run] aggregate drift (base 1.0 over the run's total time)
+    constants: DriftConstants = field(default=DEFAULT_DRIFT)
+
+    def breakdown(self, run_index: int = 0) -> Dict[str, Dict[str, float]]:
+        return {
+            m: {
+                "drift": float(self.module_drift[run_index, k]),
+                "rounds": int(self.module_rounds[run_index, k]),
+                "correct": int(self.module_correct[run_index, k]),
+            }
+            for k, m in enumerate(PROVING_MODULES)
+        }
+
+
+def score_rounds(log: RoundLog, constants: DriftConstants = DEFAULT_DRIFT, elapsed_s: Optional[np.ndarray] = None) -> DriftReport:
+    """
+    Score every round in one pass, then group by (run, module). The triad drift per run uses the
+    summed round times unless elapsed_s (wall time per run, in run-id order) is given.
+    """
+    deltas = drift_scores(log.base_ksa, log.correct, log.time_taken, log.used_intel, constants) * log.multiplier
+    runs, r = np.unique(log.run_id, return_inverse=True)
+    n_runs, n_mod = runs.size, len(PROVING_MODULES)
+    cell = r * n_mod + log.module.astype(np.int64)
+    size = n_runs * n_mod
+    module_drift = np.bincount(cell, weights=deltas, minlength=size).reshape(n_runs, n_mod)
+    module_rounds = np.bincount(cell, minlength=size).reshape(n_runs, n_mod)
+    module_correct = np.bincount(cell, weights=log.correct, minlength=size).reshape(n_runs, n_mod).astype(np.int64)
+    if elapsed_s is None:
+        elapsed_s = np.bincount(r, weights=log.time_taken, minlength=n_runs)
+    any_correct = module_correct.sum(axis=1) > 0
+    any_intel = np.bincount(r, weights=log.used_intel, minlength=n_runs) > 0
+    triad = drift_scores(np.full(n_runs, TRIAD_BASE_KSA), any_correct, elapsed_s, any_intel, constants)
+    return DriftReport(deltas, runs, module_drift, module_rounds, module_correct, triad, constants)
+
+
+def synthetic_rounds(n_rounds: int, seed: int = 0) -> RoundLog:
+    """Random triads (4/3/3 rounds per run) for benchmarking."""
+    rng = np.random.default_rng(seed)
+    pattern = np.array([0, 0, 0, 0, 1, 1, 1, 2, 2, 2], dtype=np.int8)
+    n_runs = max(1, n_rounds // pattern.size)
+    module = np.tile(pattern, n_runs)
+    base = np.array([MODULE_BASE_KSA[m] for m in PROVING_MODULES])[module]
+    mult = np.where(module == MODULE_CODES["boundary_purge"], rng.uniform(0.4, 1.0, module.size), 1.0)
+    return RoundLog(
+        np.repeat(np.arange(n_runs), pattern.size), module, base, rng.random(module.size) < 0.8,
+        rng.lognormal(0.8, 0.6, module.size), rng.random(module.size) < 0.1, mult,
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Vectorized drift scoring benchmark")
+    parser.add_argument("--rounds", type=int, default=1_000_000)
+    args = parser.parse_args()
+    log = synthetic_rounds(args.rounds)
+    timings: List[str] = []
+    for name, constants in (("default", DEFAULT_DRIFT), ("stricter", DriftConstants(intel_cap=0.1, sluggish_multiplier=0.5))):
+        t0 = time.perf_counter()
+        report = score_rounds(log, constants)
+        timings.append(f"{name}: {time.perf_counter() - t0:.3f}s (mean triad drift {report.triad_drift.mean():.3f})")
+    print(f"{len(log):,} rounds / {report.runs.size:,} runs rescored")
+    print("\n".join(timings))
@@ -0,0 +1,126 @@
+"""
+Cold-import budget — what importing the package and its core engines costs in a fresh interpreter,
+and which heavy modules those imports must not load.
+
+Each ImportCase runs in a new interpreter (repo root on sys.path, bytecode already cached): the
+median wall time of the statement over `runs` is checked against budget_ms, and one
+`-X importtime` run lists every module it loaded, which must not include the case's forbidden
+modules (Streamlit, plotly, fpdf, numpy, the translation bundles, results.py).
+Run: python -m cyber_career_compass.import_budget  (exit 1 when a case is over budget);
+enforced under pytest by tests/test_import_budget.py.
+"""
+
+import os
+import statistics
+import subprocess
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Sequence, Tuple
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+HEAVY_MODULES: Tuple[str, ...] = (
+    "streamlit",
+    "plotly",
+    "fpdf",
+    "numpy",
+    "cyber_career_compass.translations",
+    "cyber_career_compass.results",
+)
+
+
+@dataclass(frozen=True)
+class ImportCase:
+    statement: str
+    budget_ms: float
+    forbidden: Tuple[str, ...]  # module names; a trailing "." forbids every submodule
+
+
+IMPORT_BUDGETS: Tuple[ImportCase, ...] = (
+    ImportCase("import cyber_career_compass", 5.0, HEAVY_MODULES + ("cyber_career_compass.",)),
+    ImportCase("import translations, nice_framework, content, project_ares", 5.0, ("cyber_career_compass.",)),
+    ImportCase("from cyber_career_compass import ScoreState", 40.0, HEAVY_MODULES),
+    ImportCase("from cyber_career_compass import calculate_gaps, plan_deployments, get_catalog", 60.0, HEAVY_MODULES),
+)
+
+
+@dataclass(frozen=True)
+class ImportProfile:
+    statement: str
+    wall_ms: float  # median over runs
+    modules: Dict[str, Tuple[int, int]]  # module → (self us, cumulative us), from -X importtime
+
+
+def _run(statement: str, importtime: bool) -> subprocess.CompletedProcess:
+    code = f"import time\n_t0 = time.perf_counter()\n{statement}\nprint((time.perf_counter() - _t0) * 1000.0)"
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(filter(None, [str(REPO_ROOT), os.environ.get("PYTHONPATH", "")])))
+    cmd = [sys.executable] + (["-X", "importtime"] if importtime else []) + ["-c", code]
+    proc = subprocess.run(cmd, cwd=REPO_ROOT, env=env, capture_output=True, text=True, timeout=120)
+    if proc.returncode != 0:
+        raise RuntimeError(f"{statement!r} failed:\n{proc.stderr.strip()}")
+    return proc
+
+
+def parse_importtime(stderr: str) -> Dict[str, Tuple[int, int]]:
+    """`import time: self | cumulative | name` lines → {name: (self us, cumulative us)}."""
+    modules: Dict[str, Tuple[int, int]] = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        parts = line[len("import time:"):].split("|")
+        if len(parts) != 3 or not parts[0].strip().isdigit():
+            continue  # header line
+        modules[parts[2].strip()] = (int(parts[0]), int(parts[1]))
+    return modules
+
+
+def measure_import(statement: str, runs: int = 5) -> ImportProfile:
+    _run(statement, importtime=False)  # warm the bytecode cache
+    walls = [float(_run(statement, importtime=False).stdout.split()[-1]) for _ in range(runs)]
+    modules = parse_importtime(_run(statement, importtime=True).stderr)
+    return ImportProfile(statement, statistics.median(walls), modules)
+
+
+def forbidden_loaded(profile: ImportProfile, forbidden: Sequence[str]) -> List[str]:
+    hits = []
+    for name in profile.modules:
+        for f in forbidden:
+            if (name.startswith(f) if f.endswith(".") else name == f or name.startswith(f + ".")):
+                hits.append(name)
+                break
+    return sorted(hits)
+
+
+def check_import_budgets(cases: Sequence[ImportCase] = IMPORT_BUDGETS, runs: int = 5) -> List[str]:
+    """Every budget violation as a message; empty when all cases pass."""
+    problems: List[str] = []
+    for case in cases:
+        profile = measure_import(case.statement, runs)
+        if profile.wall_ms > case.budget_ms:
+            top = sorted(profile.modules.items(), key=lambda kv: -kv[1][0])[:5]
+            slowest = ", ".join(f"{name} {self_us / 1000:.1f} ms" for name, (self_us, _) in top)
+            problems.append(f"{case.statement!r}: {profile.wall_ms:.1f} ms > {case.budget_ms:.0f} ms (slowest: {slowest})")
+        loaded = forbidden_loaded(profile, case.forbidden)
+        if loaded:
+            problems.append(f"{case.statement!r} loads {', '.join(loaded[:8])}{' …' if len(loaded) > 8 else ''}")
+    return problems
+
+
+def assert_import_budgets(cases: Sequence[ImportCase] = IMPORT_BUDGETS, runs: int = 5) -> None:
+    """Raise AssertionError listing every case over its time budget or loading a forbidden module."""
+    problems = check_import_budgets(cases, runs)
+    assert not problems, "Cold-import budget exceeded:\n  " + "\n  ".join(problems)
+
+
+if __name__ == "__main__":
+    failed = False
+    for case in IMPORT_BUDGETS:
+        profile = measure_import(case.statement)
+        loaded = forbidden_loaded(profile, case.forbidden)
+        ok = profile.wall_ms <= case.budget_ms and not loaded
+        failed |= not ok
+        print(f"{'ok  ' if ok else 'FAIL'} {profile.wall_ms:6.1f} ms / {case.budget_ms:4.0f} ms  {case.statement}")
+        for name in loaded:
+            print(f"       loads {name}")
+    sys.exit(1 if failed else 0)
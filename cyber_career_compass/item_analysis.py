@@ -0,0 +1,221 @@
+"""
+Item analysis (psychometrics) — offline, NumPy-vectorized, over recorded response logs.
+
+Per item in a bank (Explorer 20, Specialist 50, Operator 10 reflex threats / Operator decision-tree nodes (operator_tree.py),
+Calibration 45-question pool incl. the 25 TKS Validation items), per tier and language:
+- choice frequencies,
+- point-biserial discrimination: per option, correlation between choosing it and the respondent's
+  rest score (total minus this item) in the option's primary NICE category; the item value is the
+  frequency-weighted mean over options,
+- weight sensitivity: share of respondents whose dominant category flips when the item is dropped
+  (leave-one-out) or its weights are scaled by ±WEIGHT_SCALE.
+
+Input rows are parallel integer arrays: session_id, tier code, lang code, question_index, choice_index
+(the columns of the response log, see response_log.py).
+Run: python -m cyber_career_compass.item_analysis <log_dir> | --synthetic 2000000
+"""
+
+import argparse
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .nice_framework import ALL_CATEGORIES
+from .scoring import normalize_question_weights
+from .translations import SUPPORTED_LANGUAGES
+
+# Integer codes used in response logs
+TIER_CODES: Dict[str, int] = {"explorer": 0, "specialist": 1, "operator": 2, "calibration": 3, "operator_branch": 4}
+TIER_NAMES: Dict[int, str] = {v: k for k, v in TIER_CODES.items()}
+LANG_CODES: Dict[str, int] = {lang: i for i, lang in enumerate(SUPPORTED_LANGUAGES)}
+
+WEIGHT_SCALE = 0.2
+N_CATEGORIES = len(ALL_CATEGORIES)
+_CATEGORY_INDEX = {c: i for i, c in enumerate(ALL_CATEGORIES)}
+
+
+def _load_bank(tier: str, lang: str) -> Sequence[Any]:
+    from .bank_compiler import get_compiled_questions
+    from .operator_tree import OPERATOR_TREE_BANK
+    from .reflex_drill import REFLEX_THREATS
+
+    if tier == "operator":
+        return REFLEX_THREATS
+    if tier == "operator_branch":
+        return get_compiled_questions(OPERATOR_TREE_BANK, lang)
+    return get_compiled_questions(tier, lang)
+
+
+def weight_tensor(bank: Sequence[Any]) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Bank → (W, n_options). W[q, c, k] is the weight option c of item q adds to category k
+    (zero-padded to the widest item). Reflex tuples (text, action, category) map the correct
+    action to {category: 1.0} and the other actions to no weight.
+    """
+    from .reflex_drill import REFLEX_ACTIONS
+
+    rows: List[List[Dict[str, float]]] = []
+    for item in bank:
+        if isinstance(item, tuple):
+            _, action, category = item
+            rows.append([{category: 1.0} if a == action else {} for a in REFLEX_ACTIONS])
+        else:
+            rows.append([normalize_question_weights(c.weights) for c in getattr(item, "choices", [])])
+    max_c = max((len(r) for r in rows), default=0)
+    W = np.zeros((len(rows), max(1, max_c), N_CATEGORIES), dtype=np.float64)
+    n_options = np.zeros(len(rows), dtype=np.int64)
+    for q, options in enumerate(rows):
+        n_options[q] = len(options)
+        for c, weights in enumerate(options):
+            for cat, w in weights.items():
+                k = _CATEGORY_INDEX.get(cat)
+                if k is not None:
+                    W[q, c, k] = w
+    return W, n_options
+
+
+def _group_sums(group: np.ndarray, n_groups: int, *values: np.ndarray) -> List[np.ndarray]:
+    return [np.bincount(group, weights=v, minlength=n_groups) for v in values]
+
+
+def analyze_items(session_ids: np.ndarray, question_idx: np.ndarray, choice_idx: np.ndarray, W: np.ndarray, scale: float = WEIGHT_SCALE) -> Dict[str, np.ndarray]:
+    """
+    Item statistics for one bank. Rows referring to items/options outside W are ignored.
+    Returns arrays indexed by item: n, choice_freq [q, c], option_rpb [q, c], discrimination,
+    flip_drop, flip_scale.
+    """
+    n_items, max_c, _ = W.shape
+    q = np.asarray(question_idx, dtype=np.int64)
+    c = np.asarray(choice_idx, dtype=np.int64)
+    ok = (q >= 0) & (q < n_items) & (c >= 0) & (c < max_c)
+    q, c = q[ok], c[ok]
+    _, s = np.unique(np.asarray(session_ids)[ok], return_inverse=True)
+    n_sessions = int(s.max()) + 1 if s.size else 0
+
+    # Respondent totals S[s, k]
+    row_w = W[q, c]  # (N, K)
+    S = np.empty((n_sessions, N_CATEGORIES))
+    for k in range(N_CATEGORIES):
+        S[:, k] = np.bincount(s, weights=row_w[:, k], minlength=n_sessions)
+
+    # Choice frequencies
+    counts = np.bincount(q * max_c + c, minlength=n_items * max_c).reshape(n_items, max_c).astype(np.float64)
+    n = counts.sum(axis=1)
+    choice_freq = counts / np.maximum(n, 1)[:, None]
+
+    # Point-biserial per (item, option): x = chose option o, y = rest score in o's primary category
+    primary = W.argmax(axis=2)  # (Q, C)
+    has_primary = W.max(axis=2) > 0
+    opts = np.arange(max_c)
+    cat_ro = primary[q]  # (N, C) category for each option of the row's item
+    rest = S[s[:, None], cat_ro] - row_w[np.arange(q.size)[:, None], cat_ro]
+    x = (c[:, None] == opts[None, :]).astype(np.float64)
+    valid = has_primary[q].astype(np.float64)
+    group = (q[:, None] * max_c + opts[None, :]).ravel()
+    n_g, sx, sy, syy, sxy = _group_sums(group, n_items * max_c, valid.ravel(), (x * valid).ravel(), (rest * valid).ravel(), (rest * rest * valid).ravel(), (x * rest * valid).ravel())
+    with np.errstate(invalid="ignore", divide="ignore"):
+        mx, my = sx / n_g, sy / n_g
+        cov = sxy / n_g - mx * my
+        sd = np.sqrt(np.clip(mx - mx * mx, 0, None) * np.clip(syy / n_g - my * my, 0, None))
+        rpb = np.where(sd > 0, cov / sd, np.nan).reshape(n_items, max_c)
+    weighted = np.where(np.isnan(rpb), 0.0, rpb * choice_freq)
+    freq_valid = np.where(np.isnan(rpb), 0.0, choice_freq).sum(axis=1)
+    discrimination = np.where(freq_valid > 0, weighted.sum(axis=1) / np.maximum(freq_valid, 1e-12), np.nan)
+
+    # Weight sensitivity: dominant-category flips when the item is dropped / rescaled
+    dominant = S.argmax(axis=1)[s]
+    S_rows = S[s]
+    flip_drop = (S_rows - row_w).argmax(axis=1) != dominant
+    flip_scale = ((S_rows + scale * row_w).argmax(axis=1) != dominant) | ((S_rows - scale * row_w).argmax(axis=1) != dominant)
+    n_q = np.maximum(np.bincount(q, minlength=n_items), 1)
+    return {
+        "n": n,
+        "choice_freq": choice_freq,
+        "option_rpb": rpb,
+        "discrimination": discrimination,
+        "flip_drop": np.bincount(q, weights=flip_drop, minlength=n_items) / n_q,
+        "flip_scale": np.bincount(q, weights=flip_scale, minlength=n_items) / n_q,
+    }
+
+
+def item_report(
+    session_ids: np.ndarray,
+    tiers: np.ndarray,
+    langs: np.ndarray,
+    question_idx: np.ndarray,
+    choice_idx: np.ndarray,
+    banks: Optional[Dict[Tuple[str, str], Sequence[Any]]] = None,
+) -> Dict[Tuple[str, str], Dict[str, np.ndarray]]:
+    """Run analyze_items for every (tier, lang) present in the log. banks overrides the built-in loaders."""
+    tiers = np.asarray(tiers)
+    langs = np.asarray(langs)
+    report: Dict[Tuple[str, str], Dict[str, np.ndarray]] = {}
+    for tier_code in np.unique(tiers):
+        tier = TIER_NAMES.get(int(tier_code))
+        if tier is None:
+            continue
+        for lang_code in np.unique(langs[tiers == tier_code]):
+            if not 0 <= int(lang_code) < len(SUPPORTED_LANGUAGES):
+                continue
+            lang = SUPPORTED_LANGUAGES[int(lang_code)]
+            bank = (banks or {}).get((tier, lang)) or _load_bank(tier, lang)
+            W, _ = weight_tensor(bank)
+            mask = (tiers == tier_code) & (langs == lang_code)
+            report[(tier, lang)] = analyze_items(
+                np.asarray(session_ids)[mask], np.asarray(question_idx)[mask], np.asarray(choice_idx)[mask], W
+            )
+    return report
+
+
+def format_report(report: Dict[Tuple[str, str], Dict[str, np.ndarray]]) -> str:
+    lines: List[str] = []
+    for (tier, lang), stats in sorted(report.items()):
+        lines.append(f"── {tier} / {lang} ──")
+        lines.append(f"{'item':>4} {'n':>9} {'r_pb':>7} {'flip_drop':>9} {'flip_scale':>10}  choice_freq")
+        for i in range(stats["n"].size):
+            freq = " ".join(f"{f:.2f}" for f in stats["choice_freq"][i])
+            lines.append(
+                f"{i:>4} {int(stats['n'][i]):>9} {stats['discrimination'][i]:>7.3f} "
+                f"{stats['flip_drop'][i]:>9.3f} {stats['flip_scale'][i]:>10.3f}  {freq}"
+            )
+    return "\n".join(lines)
+
+
+def synthetic_log(n_rows: int, tier: str = "specialist", lang: str = "en", seed: int = 0) -> Dict[str, np.ndarray]:
+    """Random full-length sessions for one bank (benchmarking)."""
+    rng = np.random.default_rng(seed)
+    W, n_options = weight_tensor(_load_bank(tier, lang))
+    n_items = W.shape[0]
+    n_sessions = max(1, n_rows // n_items)
+    q = np.tile(np.arange(n_items), n_sessions)
+    return {
+        "session_id": np.repeat(np.arange(n_sessions), n_items),
+        "tier": np.full(q.size, TIER_CODES[tier], dtype=np.int8),
+        "lang": np.full(q.size, LANG_CODES[lang], dtype=np.int8),
+        "question_index": q,
+        "choice_index": (rng.random(q.size) * n_options[q]).astype(np.int64),
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Item analysis over recorded response logs")
+    parser.add_argument("log", nargs="?", help="response log directory (response_log.py) or .npz with the same columns")
+    parser.add_argument("--synthetic", type=int, default=0, help="analyze N random Specialist responses instead")
+    args = parser.parse_args()
+    if args.synthetic:
+        data = synthetic_log(args.synthetic)
+    elif args.log and Path(args.log).is_dir():
+        from .response_log import open_log
+
+        data = open_log(args.log)
+    elif args.log:
+        data = dict(np.load(args.log))
+    else:
+        parser.error("pass a log file or --synthetic N")
+    t0 = time.perf_counter()
+    result = item_report(data["session_id"], data["tier"], data["lang"], data["question_index"], data["choice_index"])
+    elapsed = time.perf_counter() - t0
+    print(format_report(result))
+    print(f"\n{data['question_index'].size:,} responses analyzed in {elapsed:.2f}s")
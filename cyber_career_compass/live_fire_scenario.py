@@ -0,0 +1,249 @@
+"""
+Live-Fire: Breach — discrete-event simulation of an ATT&CK-style intrusion.
+
+The attacker timeline (recon → initial access → lateral movement → exfiltration) is generated once
+per seed as sorted arrays (time, phase, technique) and shared by every session on that seed.
+Defender actions are the dynamic events: each one is pushed on a per-session heap and lands
+delay_s later; landing on an active phase contains it (later events of that phase are blocked).
+advance(until) pops due heap events in time order and, between them, drains the timeline in one
+vectorized slice (searchsorted + bincount), so thousands of attacker events cost one numpy pass.
+
+Landed actions come back as ActionOutcome with NICE weights scaled by effectiveness; the page
+feeds them to ScoreState and the archetype posterior.
+Benchmark: python -m cyber_career_compass.live_fire_scenario --runs 200
+"""
+
+import argparse
+import heapq
+import time
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Dict, List, NamedTuple, Tuple
+
+import numpy as np
+
+from .nice_framework import (
+    CATEGORY_AN,
+    CATEGORY_CO,
+    CATEGORY_IN,
+    CATEGORY_OM,
+    CATEGORY_OV,
+    CATEGORY_PR,
+    CATEGORY_SP,
+)
+
+LIVE_FIRE_DURATION_S = 900.0  # simulated seconds
+LIVE_FIRE_EVENTS = 4000
+LIVE_FIRE_TIME_SCALE = 15.0  # simulated seconds per wall second → a 60 s run
+LIVE_FIRE_ACTION_WEIGHT = 0.1  # same scale as a correct Reflex answer
+LIVE_FIRE_POLL_S = 1.0  # page fragment rerun interval while a run is live
+LIVE_FIRE_SEED_POOL = 32  # sessions draw from a fixed set of seeds so timelines are shared
+
+LIVE_FIRE_PHASES = ("recon", "initial_access", "lateral_movement", "exfiltration")
+PHASE_TACTICS = ("TA0043 RECONNAISSANCE", "TA0001 INITIAL_ACCESS", "TA0008 LATERAL_MOVEMENT", "TA0010 EXFILTRATION")
+# (start, end) as a fraction of the scenario, and each phase's share of the events
+PHASE_WINDOWS = ((0.0, 0.30), (0.20, 0.45), (0.40, 0.80), (0.70, 1.0))
+PHASE_SHARE = (0.35, 0.15, 0.30, 0.20)
+PHASE_TECHNIQUES: Tuple[Tuple[Tuple[str, str], ...], ...] = (
+    (("T1595", "Active scanning"), ("T1592", "Host information gathering"), ("T1589", "Identity harvesting")),
+    (("T1566", "Phishing"), ("T1078", "Valid accounts"), ("T1190", "Exploit public-facing app")),
+    (("T1021.002", "SMB admin shares"), ("T1550.002", "Pass the hash"), ("T1021.001", "Remote desktop")),
+    (("T1048.003", "Exfiltration over DNS"), ("T1041", "Exfiltration over C2"), ("T1567", "Exfiltration to cloud storage")),
+)
+
+# Effectiveness of an action by the state of its phase when it lands
+EFFECT_CONTAIN = 1.0  # phase active and not yet contained
+EFFECT_PREMATURE = 0.3  # phase not started: hardening, no containment
+EFFECT_REDUNDANT = 0.2  # phase already contained or already over
+
+
+@dataclass(frozen=True)
+class DefenderAction:
+    label: str
+    phase: int  # index into LIVE_FIRE_PHASES
+    weights: Dict[str, float]  # NICE categories exercised
+    delay_s: float  # simulated seconds from order to effect
+
+
+DEFENDER_ACTIONS: Dict[str, DefenderAction] = {
+    "threat_hunt": DefenderAction("Hunt perimeter scanning", 0, {CATEGORY_AN: 0.6, CATEGORY_IN: 0.4}, 30.0),
+    "reset_credentials": DefenderAction("Reset credentials, enforce MFA", 1, {CATEGORY_PR: 0.6, CATEGORY_SP: 0.4}, 45.0),
+    "isolate_hosts": DefenderAction("Isolate hosts, block SMB", 2, {CATEGORY_PR: 0.5, CATEGORY_OM: 0.5}, 60.0),
+    "block_egress": DefenderAction("Block egress, sinkhole DNS", 3, {CATEGORY_CO: 0.5, CATEGORY_OM: 0.3, CATEGORY_OV: 0.2}, 20.0),
+}
+
+
+@dataclass(frozen=True)
+class Timeline:
+    """Attacker events sorted by time; shared, read-only."""
+
+    times: np.ndarray  # float64, simulated seconds
+    phase: np.ndarray  # int8 index into LIVE_FIRE_PHASES
+    technique: np.ndarray  # int8 index into PHASE_TECHNIQUES[phase]
+    phase_end: np.ndarray  # float64 per phase, time of its last event
+
+
+@lru_cache(maxsize=LIVE_FIRE_SEED_POOL)
+def build_timeline(seed: int, n_events: int = LIVE_FIRE_EVENTS, duration_s: float = LIVE_FIRE_DURATION_S) -> Timeline:
+    rng = np.random.default_rng(seed)
+    counts = np.floor(np.asarray(PHASE_SHARE) * n_events).astype(np.int64)
+    counts[0] += n_events - counts.sum()
+    phase = np.repeat(np.arange(len(LIVE_FIRE_PHASES), dtype=np.int8), counts)
+    lo = np.array([w[0] for w in PHASE_WINDOWS])[phase] * duration_s
+    hi = np.array([w[1] for w in PHASE_WINDOWS])[phase] * duration_s
+    times = rng.uniform(lo, hi)
+    technique = rng.integers(0, 3, size=n_events, dtype=np.int8)
+    order = np.argsort(times, kind="stable")
+    phase_end = np.zeros(len(LIVE_FIRE_PHASES))
+    np.maximum.at(phase_end, phase, times)
+    arrays = (times[order], phase[order], technique[order], phase_end)
+    for a in arrays:
+        a.setflags(write=False)
+    return Timeline(*arrays)
+
+
+class ActionOutcome(NamedTuple):
+    at: float
+    action: str
+    effectiveness: float
+    weights: Dict[str, float]
+
+
+class LiveFireSim:
+    """One defender's run against a seeded timeline. Per-session state is a few small arrays."""
+
+    __slots__ = ("seed", "n_events", "duration_s", "started_ts", "clock", "cursor", "contained", "landed", "blocked", "pending", "_seq")
+
+    def __init__(self, seed: int, started_ts: float = 0.0, n_events: int = LIVE_FIRE_EVENTS, duration_s: float = LIVE_FIRE_DURATION_S) -> None:
+        n = len(LIVE_FIRE_PHASES)
+        self.seed = seed
+        self.n_events = n_events
+        self.duration_s = duration_s
+        self.started_ts = started_ts  # time.monotonic() at start (wall → simulated clock)
+        self.clock = 0.0
+        self.cursor = 0  # timeline events processed
+        self.contained = np.full(n, np.inf)  # simulated time each phase was contained
+        self.landed = np.zeros(n, dtype=np.int64)
+        self.blocked = np.zeros(n, dtype=np.int64)
+        self.pending: List[Tuple[float, int, str]] = []  # heap of (at, seq, action)
+        self._seq = 0
+
+    @property
+    def timeline(self) -> Timeline:
+        return build_timeline(self.seed, self.n_events, self.duration_s)
+
+    @property
+    def finished(self) -> bool:
+        return self.clock >= self.duration_s
+
+    def sim_time(self, now_monotonic: float) -> float:
+        return (now_monotonic - self.started_ts) * LIVE_FIRE_TIME_SCALE
+
+    def is_pending(self, action: str) -> bool:
+        return any(a == action for _, _, a in self.pending)
+
+    def order(self, action: str) -> bool:
+        """Queue a defender action at the current clock. False if unknown, already pending, or over."""
+        spec = DEFENDER_ACTIONS.get(action)
+        if spec is None or self.finished or self.is_pending(action):
+            return False
+        self._seq += 1
+        heapq.heappush(self.pending, (self.clock + spec.delay_s, self._seq, action))
+        return True
+
+    def advance(self, until: float) -> List[ActionOutcome]:
+        """Run the simulation to `until` (capped at the scenario end); returns actions that landed."""
+        until = min(until, self.duration_s)
+        outcomes: List[ActionOutcome] = []
+        while self.pending and self.pending[0][0] <= until:
+            at, _, action = heapq.heappop(self.pending)
+            self._drain(at)
+            outcomes.append(self._land(action, at))
+        self._drain(until)
+        self.clock = max(self.clock, until)
+        return outcomes
+
+    def _drain(self, t: float) -> None:
+        tl = self.timeline
+        j = int(np.searchsorted(tl.times, t, side="right"))
+        if j <= self.cursor:
+            return
+        ph = tl.phase[self.cursor : j]
+        hit = tl.times[self.cursor : j] < self.contained[ph]
+        n = len(LIVE_FIRE_PHASES)
+        self.landed += np.bincount(ph[hit], minlength=n)
+        self.blocked += np.bincount(ph[~hit], minlength=n)
+        self.cursor = j
+
+    def _land(self, action: str, at: float) -> ActionOutcome:
+        spec = DEFENDER_ACTIONS[action]
+        p = spec.phase
+        if self.contained[p] <= at or self.timeline.phase_end[p] < at:
+            effect = EFFECT_REDUNDANT
+        elif self.landed[p] > 0:
+            self.contained[p] = at
+            effect = EFFECT_CONTAIN
+        else:
+            effect = EFFECT_PREMATURE
+        weights = {c: w * effect * LIVE_FIRE_ACTION_WEIGHT for c, w in spec.weights.items()}
+        return ActionOutcome(at, action, effect, weights)
+
+    def recent_events(self, k: int = 6) -> List[Tuple[float, str, str, bool]]:
+        """Last k processed attacker events: (time, tactic, technique, blocked), newest first."""
+        tl = self.timeline
+        out = []
+        for i in range(self.cursor - 1, max(self.cursor - k, 0) - 1, -1):
+            p = int(tl.phase[i])
+            tid, label = PHASE_TECHNIQUES[p][tl.technique[i]]
+            out.append((float(tl.times[i]), PHASE_TACTICS[p], f"{tid} {label}", bool(tl.times[i] >= self.contained[p])))
+        return out
+
+    def summary(self) -> Dict[str, object]:
+        total = int(self.landed.sum() + self.blocked.sum())
+        return {
+            "clock_s": self.clock,
+            "events": total,
+            "contained_pct": 100.0 * float(self.blocked.sum()) / total if total else 0.0,
+            "exfiltrated": int(self.landed[LIVE_FIRE_PHASES.index("exfiltration")]),
+            "phases": {
+                name: {"landed": int(self.landed[i]), "blocked": int(self.blocked[i]), "contained": bool(np.isfinite(self.contained[i]))}
+                for i, name in enumerate(LIVE_FIRE_PHASES)
+            },
+        }
+
+
+def _scripted_defense(sim: LiveFireSim, step_s: float, reaction_s: float) -> None:
+    """Benchmark defender: orders each phase's action reaction_s after the phase shows up."""
+    first_seen: Dict[int, float] = {}
+    t = 0.0
+    while not sim.finished:
+        t += step_s
+        sim.advance(t)
+        for key, spec in DEFENDER_ACTIONS.items():
+            if sim.landed[spec.phase] and spec.phase not in first_seen:
+                first_seen[spec.phase] = sim.clock
+            seen = first_seen.get(spec.phase)
+            if seen is not None and sim.clock - seen >= reaction_s and not np.isfinite(sim.contained[spec.phase]):
+                sim.order(key)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Live-Fire simulation benchmark")
+    parser.add_argument("--runs", type=int, default=200)
+    parser.add_argument("--events", type=int, default=LIVE_FIRE_EVENTS)
+    args = parser.parse_args()
+    build_timeline(0, args.events)
+    t0 = time.perf_counter()
+    contained: List[float] = []
+    for run in range(args.runs):
+        sim = LiveFireSim(seed=run % 32, n_events=args.events)
+        _scripted_defense(sim, step_s=LIVE_FIRE_TIME_SCALE, reaction_s=30.0)  # one advance per wall second
+        contained.append(sim.summary()["contained_pct"])
+    elapsed = time.perf_counter() - t0
+    steps = args.runs * int(LIVE_FIRE_DURATION_S / LIVE_FIRE_TIME_SCALE)
+    one = LiveFireSim(seed=0, n_events=args.events)
+    t1 = time.perf_counter()
+    one.advance(LIVE_FIRE_DURATION_S)
+    full = time.perf_counter() - t1
+    print(f"{args.runs} runs × {args.events} events: {elapsed / steps * 1e6:.1f} us per rerun step")
+    print(f"whole scenario in one advance: {full * 1e6:.0f} us; mean contained {np.mean(contained):.1f}%")
@@ -0,0 +1,215 @@
+"""
+Load harness — drives the root main.py through full assessments for N concurrent simulated
+sessions using Streamlit's AppTest (no browser, no server).
+
+Each session runs: Proving Ground Calibration (30) → Explorer (20) → Specialist (50) → Operator (10).
+Calibration goes first because the Proving Ground locks once reflex_complete is set.
+Reports p50/p95/p99 rerun latency, CPU seconds per completed assessment, script-thread occupancy
+(seconds a script thread is held per assessment, and how much of that is blocked/idle), and memory growth.
+Run: python -m cyber_career_compass.load_harness --sessions 8
+"""
+
+import argparse
+import gc
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+
+from .reflex_drill import REFLEX_ACTIONS
+from .timers import remaining
+
+MAIN_SCRIPT = Path(__file__).resolve().parent.parent / "main.py"
+DEFAULT_TIMEOUT_S = 60.0
+MISSION_TIERS = ("explorer", "specialist", "operator")
+
+
+def percentile(samples: List[float], pct: float) -> float:
+    """Nearest-rank percentile (pct in 0–100). Returns 0.0 for no samples."""
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    rank = max(0, min(len(ordered) - 1, int(round(pct / 100.0 * len(ordered) + 0.5)) - 1))
+    return ordered[rank]
+
+
+def _rss_bytes() -> int:
+    """Current resident set size (Linux /proc), falling back to peak RSS from resource."""
+    try:
+        with open("/proc/self/statm") as f:
+            pages = int(f.read().split()[1])
+        import os
+
+        return pages * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        pass
+    try:
+        import resource
+
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+    except ImportError:
+        return 0
+
+
+class SimulatedStudent:
+    """
+    One AppTest session. Every at.run() is timed and appended to latencies.
+    The flow methods are generators that yield after each rerun so the scheduler can interleave sessions;
+    they yield True while idling on a client-side timer.
+    """
+
+    def __init__(self, script: Path = MAIN_SCRIPT, timeout: float = DEFAULT_TIMEOUT_S) -> None:
+        from streamlit.testing.v1 import AppTest
+
+        self.at = AppTest.from_file(str(script), default_timeout=timeout)
+        self.latencies: List[float] = []
+        self.blocked_s = 0.0
+        self.errors: List[str] = []
+
+    def _run(self) -> None:
+        t0 = time.perf_counter()
+        c0 = time.process_time()
+        self.at.run()
+        elapsed = time.perf_counter() - t0
+        self.latencies.append(elapsed)
+        # Wall time not spent on CPU: the script thread was held but idle (sleeps, waits)
+        self.blocked_s += max(0.0, elapsed - (time.process_time() - c0))
+        if self.at.exception:
+            self.errors.append(str(self.at.exception[0].message))
+
+    def _click(self, key: str) -> bool:
+        try:
+            button = self.at.button(key=key)
+        except KeyError:
+            self.errors.append(f"missing button {key}")
+            return False
+        button.click()
+        self._run()
+        return True
+
+    @property
+    def session(self) -> Any:
+        return self.at.session_state["session"]
+
+    def run_mission(self, tier: str) -> Iterator[Optional[bool]]:
+        self.session.nav_page = "mission_hub"
+        if self.session.mission_active:
+            self._click("back_to_hub_drill")
+        else:
+            self._run()
+        yield
+        if not self._click(f"tier_{tier}"):
+            return
+        yield
+        # Adaptive tiers may end before mission_total; it is re-read after every answer.
+        idx = 0
+        while idx < self.session.mission_total:
+            current = self.session.mission_question(idx)
+            if isinstance(current, tuple):
+                ok = self._click(_REFLEX_BUTTON_KEYS[REFLEX_ACTIONS[idx % len(REFLEX_ACTIONS)]])
+            else:
+                radio = self.at.radio(key=f"mh_radio_{idx}")
+                radio.set_value(radio.options[idx % len(radio.options)])
+                ok = self._click(f"mh_submit_{idx}")
+            if not ok:
+                return
+            idx += 1
+            yield
+
+    def run_calibration(self) -> Iterator[Optional[bool]]:
+        self.session.nav_page = "proving_ground"
+        self._run()
+        yield
+        if not self._click("pg_start_validation"):
+            return
+        yield
+        for idx in range(len(self.session.validation_order)):
+            if not self._click(f"pg_val_tile_{idx}_{idx % 3}"):
+                return
+            yield
+        # Completion → Ares Bridge overlay → Cyber Archetype. The hold is client-side (timed fragment),
+        # so the student idles without a rerun until the deadline, as the browser would.
+        for _ in range(3):
+            if self.session.nav_page == "archetype":
+                break
+            while remaining(self.session.ares_bridge_until) > 0.0:
+                yield True
+            self._run()
+            yield
+
+    def run_assessment(self) -> Iterator[Optional[bool]]:
+        self._run()
+        yield
+        yield from self.run_calibration()
+        for tier in MISSION_TIERS:
+            yield from self.run_mission(tier)
+
+
+_REFLEX_BUTTON_KEYS = {"NEUTRALIZE": "mh_neutralize", "DROP": "mh_drop", "FREEZE": "mh_freeze"}
+
+
+def run_load_test(sessions: int = 4, script: Path = MAIN_SCRIPT) -> Dict[str, Any]:
+    """
+    Drive `sessions` full assessments concurrently. AppTest is not thread-safe, so live sessions are
+    interleaved one rerun at a time (round-robin) in this process — all N stay resident, as on a server node.
+    Returns a report dict; CPU is whole-process time divided by completed assessments.
+    """
+    gc.collect()
+    rss_before = _rss_bytes()
+    cpu_before = time.process_time()
+    wall_before = time.perf_counter()
+    students = [SimulatedStudent(script) for _ in range(sessions)]
+    flows = [student.run_assessment() for student in students]
+    while flows:
+        all_idle = True
+        for flow in list(flows):
+            try:
+                all_idle = bool(next(flow)) and all_idle
+            except StopIteration:
+                flows.remove(flow)
+        if flows and all_idle:
+            time.sleep(0.05)
+    wall = time.perf_counter() - wall_before
+    cpu = time.process_time() - cpu_before
+    gc.collect()
+    rss_after = _rss_bytes()
+
+    latencies = [t for student in students for t in student.latencies]
+    errors = [e for student in students for e in student.errors]
+    completed = sum(1 for student in students if not student.errors)
+    return {
+        "sessions": sessions,
+        "completed": completed,
+        "reruns": len(latencies),
+        "wall_s": wall,
+        "p50_ms": percentile(latencies, 50) * 1000,
+        "p95_ms": percentile(latencies, 95) * 1000,
+        "p99_ms": percentile(latencies, 99) * 1000,
+        "cpu_s_per_assessment": cpu / completed if completed else 0.0,
+        "thread_s_per_assessment": sum(latencies) / completed if completed else 0.0,
+        "blocked_s_per_assessment": sum(student.blocked_s for student in students) / completed if completed else 0.0,
+        "max_ms": max(latencies, default=0.0) * 1000,
+        "rss_growth_mb": (rss_after - rss_before) / (1024 * 1024),
+        "errors": errors[:10],
+    }
+
+
+def format_report(report: Dict[str, Any]) -> str:
+    lines = [
+        f"Sessions: {report['completed']}/{report['sessions']} completed · {report['reruns']} reruns · {report['wall_s']:.1f}s wall",
+        f"Rerun latency: p50 {report['p50_ms']:.1f} ms · p95 {report['p95_ms']:.1f} ms · p99 {report['p99_ms']:.1f} ms · max {report['max_ms']:.1f} ms",
+        f"CPU per assessment: {report['cpu_s_per_assessment']:.2f} s",
+        f"Script-thread occupancy per assessment: {report['thread_s_per_assessment']:.2f} s ({report['blocked_s_per_assessment']:.2f} s blocked)",
+        f"Memory growth (RSS): {report['rss_growth_mb']:.1f} MB",
+    ]
+    lines.extend(f"ERROR: {e}" for e in report["errors"])
+    return "\n".join(lines)
+
+
+if __name__ == "__main__":
+    import logging
+
+    parser = argparse.ArgumentParser(description="Multi-session AppTest load harness for main.py")
+    parser.add_argument("--sessions", type=int, default=4, help="simulated students (default 4)")
+    args = parser.parse_args()
+    logging.getLogger("streamlit").setLevel(logging.ERROR)
+    print(format_report(run_load_test(args.sessions)))
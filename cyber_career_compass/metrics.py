@@ -0,0 +1,200 @@
+"""
+Rerun timing metrics — span instrumentation for the router in streamlit_app.py and the results.py renderers.
+
+- Enable with CCC_METRICS=1. When disabled, @timed returns the function unchanged (zero overhead).
+- Spans aggregate into in-process histograms (Prometheus-style cumulative buckets, seconds).
+- Export: CCC_METRICS_PORT=9464 serves Prometheus text at /metrics;
+  CCC_METRICS_FILE=path writes Prometheus text snapshots to a rotating local file.
+"""
+
+import os
+import threading
+import time
+from contextlib import contextmanager
+from functools import wraps
+from typing import Any, Callable, Dict, Iterator, List, Tuple
+
+METRICS_ENABLED = os.environ.get("CCC_METRICS", "").strip().lower() in ("1", "true", "yes", "on")
+METRICS_PORT = int(os.environ.get("CCC_METRICS_PORT", "0") or 0)
+METRICS_FILE = os.environ.get("CCC_METRICS_FILE", "")
+METRICS_FILE_MAX_BYTES = 1024 * 1024
+METRICS_FILE_BACKUPS = 3
+METRICS_FILE_INTERVAL_S = 10.0
+
+# Upper bounds (seconds) for span histograms; +Inf is implicit
+SPAN_BUCKETS: Tuple[float, ...] = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+
+METRIC_NAME = "ccc_span_seconds"
+
+
+class Histogram:
+    """Fixed-bucket histogram: per-bucket counts (non-cumulative), total count and sum."""
+
+    __slots__ = ("buckets", "counts", "count", "total")
+
+    def __init__(self, buckets: Tuple[float, ...] = SPAN_BUCKETS) -> None:
+        self.buckets = buckets
+        self.counts: List[int] = [0] * (len(buckets) + 1)
+        self.count = 0
+        self.total = 0.0
+
+    def observe(self, value: float) -> None:
+        i = 0
+        for bound in self.buckets:
+            if value <= bound:
+                break
+            i += 1
+        self.counts[i] += 1
+        self.count += 1
+        self.total += value
+
+
+_lock = threading.Lock()
+_histograms: Dict[str, Histogram] = {}
+
+
+def observe(name: str, seconds: float) -> None:
+    with _lock:
+        hist = _histograms.get(name)
+        if hist is None:
+            hist = _histograms[name] = Histogram()
+        hist.observe(seconds)
+
+
+@contextmanager
+def span(name: str) -> Iterator[None]:
+    """Time a block into histogram `name`. No-op when metrics are disabled."""
+    if not METRICS_ENABLED:
+        yield
+        return
+    t0 = time.perf_counter()
+    try:
+        yield
+    finally:
+        observe(name, time.perf_counter() - t0)
+
+
+def timed(name: str) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+    """Decorator form of span(). Returns the function unchanged when metrics are disabled."""
+
+    def decorator(fn: Callable[..., Any]) -> Callable[..., Any]:
+        if not METRICS_ENABLED:
+            return fn
+
+        @wraps(fn)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            t0 = time.perf_counter()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                observe(name, time.perf_counter() - t0)
+
+        return wrapper
+
+    return decorator
+
+
+def snapshot() -> Dict[str, Dict[str, Any]]:
+    """Copy of all histograms: name → {buckets, counts, count, sum}."""
+    with _lock:
+        return {
+            name: {"buckets": h.buckets, "counts": list(h.counts), "count": h.count, "sum": h.total}
+            for name, h in _histograms.items()
+        }
+
+
+def reset() -> None:
+    with _lock:
+        _histograms.clear()
+
+
+def render_prometheus() -> str:
+    """Prometheus text exposition (histogram type, one `span` label per instrumented function), plus cache counters."""
+    from .cache import prometheus_lines
+
+    lines = [
+        f"# HELP {METRIC_NAME} Streamlit rerun span duration by page/renderer.",
+        f"# TYPE {METRIC_NAME} histogram",
+    ]
+    for name, h in sorted(snapshot().items()):
+        cumulative = 0
+        for bound, c in zip(h["buckets"], h["counts"]):
+            cumulative += c
+            lines.append(f'{METRIC_NAME}_bucket{{span="{name}",le="{bound}"}} {cumulative}')
+        lines.append(f'{METRIC_NAME}_bucket{{span="{name}",le="+Inf"}} {h["count"]}')
+        lines.append(f'{METRIC_NAME}_sum{{span="{name}"}} {h["sum"]:.6f}')
+        lines.append(f'{METRIC_NAME}_count{{span="{name}"}} {h["count"]}')
+    lines.extend(prometheus_lines())
+    return "\n".join(lines) + "\n"
+
+
+# ─── Export: HTTP endpoint and rotating file ─────────────────────────────────
+_server_started = False
+_file_last_write = 0.0
+
+
+def start_metrics_server(port: int = METRICS_PORT) -> bool:
+    """Serve render_prometheus() at http://0.0.0.0:<port>/metrics on a daemon thread (once per process)."""
+    global _server_started
+    if _server_started or not port:
+        return False
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+    class _Handler(BaseHTTPRequestHandler):
+        def do_GET(self) -> None:
+            if self.path.rstrip("/") not in ("", "/metrics"):
+                self.send_error(404)
+                return
+            body = render_prometheus().encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", "text/plain; version=0.0.4")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args: Any) -> None:
+            pass
+
+    try:
+        server = ThreadingHTTPServer(("0.0.0.0", port), _Handler)
+    except OSError:
+        return False
+    threading.Thread(target=server.serve_forever, name="ccc-metrics", daemon=True).start()
+    _server_started = True
+    return True
+
+
+def _rotate(path: str, backups: int) -> None:
+    for i in range(backups - 1, 0, -1):
+        src, dst = f"{path}.{i}", f"{path}.{i + 1}"
+        if os.path.exists(src):
+            os.replace(src, dst)
+    os.replace(path, f"{path}.1")
+
+
+def write_metrics_file(path: str = METRICS_FILE, max_bytes: int = METRICS_FILE_MAX_BYTES, backups: int = METRICS_FILE_BACKUPS) -> None:
+    """Append a timestamped Prometheus snapshot to path, rotating to path.1 … path.N past max_bytes."""
+    if not path:
+        return
+    text = f"# ts {time.time():.0f}\n" + render_prometheus()
+    with _lock:
+        try:
+            if os.path.exists(path) and os.path.getsize(path) + len(text) > max_bytes:
+                _rotate(path, backups)
+            with open(path, "a", encoding="utf-8") as f:
+                f.write(text)
+        except OSError:
+            pass
+
+
+def flush(force: bool = False) -> None:
+    """Called once per rerun: starts the endpoint if configured and writes the file at most every interval."""
+    global _file_last_write
+    if not METRICS_ENABLED:
+        return
+    if METRICS_PORT:
+        start_metrics_server(METRICS_PORT)
+    now = time.monotonic()
+    if METRICS_FILE and (force or now - _file_last_write >= METRICS_FILE_INTERVAL_S):
+        _file_last_write = now
+        write_metrics_file(METRICS_FILE)
@@ -1,10 +1,13 @@
 """
 NIST NICE Framework logic engine for Cyber Career Compass.
 Maps weighted category scores (SP, PR, AN, IN, OM) to work roles and certifications.
+Lookups read the active content snapshot's copy of these tables once content is loaded
+(content_registry.py), so edits to this file hot-reload like the question banks.
 """
 
+import sys
 from dataclasses import dataclass
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 
 # Seven NIST NICE categories for radar chart and weighted attribution
 CATEGORY_SP = "SP"  # Securely Provision
@@ -148,22 +151,35 @@ CERTIFICATIONS: dict = {
 }
 
 
+def _tables() -> Any:
+    """
+    The active content snapshot's texts (bank_compiler.ContentTexts) once content is loaded, so
+    edits here hot-reload; None before that (terminal game, tools): the tables in this module.
+    """
+    registry = sys.modules.get(f"{__package__}.content_registry")  # not imported → no snapshot yet
+    return registry.loaded_texts() if registry is not None else None
+
+
 def get_work_role(dominant_category: str, knowledge_level: int) -> WorkRole:
     """Return the NICE work role for the given dominant category and knowledge level."""
+    texts = _tables()
+    work_roles = texts.work_roles if texts is not None else WORK_ROLES
     aptitude = _category_to_aptitude(dominant_category)
     key = (aptitude, knowledge_level)
-    if key not in WORK_ROLES:
+    if key not in work_roles:
         key = (aptitude, KNOWLEDGE_LEVEL_0)
-    return WORK_ROLES[key]
+    return work_roles[key]
 
 
 def get_certifications(dominant_category: str, knowledge_level: int) -> List[Certification]:
     """Return the first two certifications for the roadmap (with URLs)."""
+    texts = _tables()
+    certifications = texts.certifications if texts is not None else CERTIFICATIONS
     aptitude = _category_to_aptitude(dominant_category)
     key = (aptitude, knowledge_level)
-    if key not in CERTIFICATIONS:
+    if key not in certifications:
         key = (aptitude, KNOWLEDGE_LEVEL_0)
-    return CERTIFICATIONS[key][:2]
+    return certifications[key][:2]
 
 
 # Work role IDs including 2026 NIST NICE (OG-WRL-017 Supply Chain, NF-COM-008 DevSecOps)
@@ -185,15 +201,19 @@ ROLE_CATEGORY_WEIGHTS: dict = {
 }
 
 
+# Human-readable labels for the radar chart (7 NIST NICE categories)
+CATEGORY_LABELS: Dict[str, str] = {
+    CATEGORY_SP: "Securely Provision",
+    CATEGORY_PR: "Protect & Defend",
+    CATEGORY_AN: "Analyze",
+    CATEGORY_CO: "Collect & Operate",
+    CATEGORY_IN: "Investigate",
+    CATEGORY_OM: "Operate & Maintain",
+    CATEGORY_OV: "Oversee & Govern",
+}
+
+
 def get_category_label(cat_id: str) -> str:
     """Human-readable label for radar chart (7 NIST NICE categories)."""
-    labels = {
-        CATEGORY_SP: "Securely Provision",
-        CATEGORY_PR: "Protect & Defend",
-        CATEGORY_AN: "Analyze",
-        CATEGORY_CO: "Collect & Operate",
-        CATEGORY_IN: "Investigate",
-        CATEGORY_OM: "Operate & Maintain",
-        CATEGORY_OV: "Oversee & Govern",
-    }
-    return labels.get(cat_id, cat_id)
+    texts = _tables()
+    return (texts.category_labels if texts is not None else CATEGORY_LABELS).get(cat_id, cat_id)
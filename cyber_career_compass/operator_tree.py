@@ -0,0 +1,125 @@
+"""
+Operator decision tree — the branching Operator mission compiled to a static node table per language.
+
+Node ids index CompiledBank rows (questions, weights); children[node, choice] is the next node id,
+-1 at the end of the mission. base_nodes[step] is the step's base scenario, served when the prior
+answer is missing or not a valid choice (as get_operator_texts_branch does with no prior).
+Built once by bank_compiler (bank "operator_tree") from translations.get_operator_texts_branch and
+CANONICAL_OPERATOR_WEIGHTS; identical (step, prompt, choices) texts share one node, so the table
+grows with distinct scenarios, not paths. A session needs only its current node id; traversal is
+one array lookup. bank_compiler checks the table against reference_texts() for every history.
+"""
+
+from itertools import product
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+OPERATOR_TREE_BANK = "operator_tree"
+ROOT_NODE = 0
+END_NODE = -1
+
+
+def build_operator_tree(lang: str) -> Tuple[List[Any], np.ndarray, np.ndarray, np.ndarray]:
+    """
+    (questions, children, step, base_nodes) for lang. Breadth-first over mission steps: the next
+    step's node for a choice is whatever get_operator_texts_branch returns for that prior choice;
+    each step's base node (no prior) joins the frontier too, so it has edges of its own.
+    """
+    from .questions import CANONICAL_OPERATOR_WEIGHTS, Choice, Question
+    from .translations import get_operator_texts, get_operator_texts_branch
+
+    n_steps = len(get_operator_texts(lang))
+    questions: List[Any] = []
+    steps: List[int] = []
+    edges: List[List[int]] = []
+    node_ids: Dict[Tuple[int, str, Tuple[str, ...]], int] = {}
+
+    def node_for(step: int, text: Dict[str, Any]) -> int:
+        key = (step, text["prompt"], tuple(text["choices"]))
+        if key not in node_ids:
+            weights = CANONICAL_OPERATOR_WEIGHTS[step]
+            choices = [Choice(c, weights[j]) for j, c in enumerate(text["choices"])]
+            node_ids[key] = len(questions)
+            questions.append(Question(prompt=text["prompt"], choices=choices))
+            steps.append(step)
+            edges.append([END_NODE] * len(choices))
+        return node_ids[key]
+
+    base_nodes = [node_for(step, get_operator_texts_branch(lang, step, None)) for step in range(n_steps)]
+    frontier = [base_nodes[0]]
+    for step in range(1, n_steps):
+        next_frontier: List[int] = [base_nodes[step]]
+        for node in frontier:
+            for choice in range(len(edges[node])):
+                child = node_for(step, get_operator_texts_branch(lang, step, choice))
+                edges[node][choice] = child
+                if child not in next_frontier:
+                    next_frontier.append(child)
+        frontier = next_frontier
+
+    width = max(len(e) for e in edges)
+    children = np.full((len(edges), width), END_NODE, dtype=np.int16)
+    for i, e in enumerate(edges):
+        children[i, : len(e)] = e
+    return questions, children, np.asarray(steps, dtype=np.int8), np.asarray(base_nodes, dtype=np.int16)
+
+
+def next_node(children: np.ndarray, node: int, choice: int) -> int:
+    """Child of node for choice, END_NODE when the mission is over or the choice is out of range."""
+    if not 0 <= choice < children.shape[1]:
+        return END_NODE
+    return int(children[node, choice])
+
+
+def node_for_history(children: np.ndarray, base_nodes: np.ndarray, choice_history: Sequence[int], steps: int) -> Optional[int]:
+    """
+    Node served at step `steps` after choice_history; None past the last step. A missing or invalid
+    prior answer leads to the step's base node.
+    """
+    if not 0 <= steps < len(base_nodes):
+        return None
+    node = int(base_nodes[0])
+    for i in range(steps):
+        child = next_node(children, node, choice_history[i]) if i < len(choice_history) else END_NODE
+        node = child if child != END_NODE else int(base_nodes[i + 1])
+    return node
+
+
+def reference_texts(lang: str, index: int, choice_history: Sequence[int]) -> Optional[Dict[str, Any]]:
+    """The uncompiled rule: step `index` branches on the answer just before it (translations)."""
+    from .translations import get_operator_texts_branch
+
+    prior = choice_history[index - 1] if 0 < index <= len(choice_history) else None
+    return get_operator_texts_branch(lang, index, prior)
+
+
+def tree_mismatches(lang: str, questions: Sequence[Any], children: np.ndarray, base_nodes: np.ndarray, n_choices: int = 3) -> List[str]:
+    """
+    (index, history) cases where the table serves something other than reference_texts(): every
+    index up to one past the end, every prefix of every history whose first three answers range
+    over -1..n_choices (invalid ones included), followed by a constant tail of any such answer.
+    """
+    n_steps = len(base_nodes)
+    answers = range(-1, n_choices + 1)
+    heads = [list(h) for h in product(answers, repeat=min(3, n_steps))]
+    fulls = [h + [t] * (n_steps - len(h)) for h in heads for t in answers]
+    prefixes = sorted({tuple(full[:length]) for full in fulls for length in range(n_steps + 1)})
+    problems: List[str] = []
+    for history in prefixes:
+        for index in range(n_steps + 1):
+            want = reference_texts(lang, index, history)
+            node = node_for_history(children, base_nodes, history, index)
+            got = None if node is None else questions[node]
+            if (want is None) != (got is None) or (
+                want is not None and (want["prompt"] != got.prompt or list(want["choices"]) != [c.text for c in got.choices])
+            ):
+                problems.append(f"index {index} history {list(history)}")
+    return problems
+
+
+def get_operator_tree(lang: str) -> Any:
+    """Compiled node table (CompiledBank with children) for lang, from the bank artifact."""
+    from .bank_compiler import get_compiled_bank
+
+    return get_compiled_bank(OPERATOR_TREE_BANK, lang)
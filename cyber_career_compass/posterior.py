@@ -0,0 +1,191 @@
+"""
+Bayesian archetype posterior — a confidence signal next to ScoreState's hard argmax.
+
+Category shares follow a Dirichlet posterior: alpha_k = POSTERIOR_PRIOR_ALPHA + evidence in k,
+where each answer adds one unit of evidence split by its choice weight vector (O(1) per answer,
+seven floats per session). Archetype probabilities are P(argmax category ∈ archetype group),
+with the same groups as ScoreState.get_reveal_archetype; they and the per-category credible
+intervals come from a fixed, seeded Monte Carlo sample taken only when read.
+
+EarlyStopRule turns a mission's own posterior (SessionModel.mission_posterior, reset per
+mission) into a stop decision: after min_items answers, stop once the top archetype's
+probability is at least `confidence`. It checks a closed-form lower bound on that probability
+(archetype_lower_bound: pairwise Beta tails, a few lgamma calls) instead of sampling, so it is
+cheap per answer and never stops earlier than the sampled value would allow.
+Early stopping is opt-in until validated: CCC_EARLY_STOP unset or "0" = off, "1" = the
+EARLY_STOP_RULES defaults, or "explorer:12:0.95,operator:6:0.97".
+"""
+
+import math
+import os
+from array import array
+from dataclasses import dataclass
+from typing import Dict, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .nice_framework import (
+    ALL_CATEGORIES,
+    CATEGORY_AN,
+    CATEGORY_CO,
+    CATEGORY_IN,
+    CATEGORY_OM,
+    CATEGORY_OV,
+    CATEGORY_PR,
+    CATEGORY_SP,
+)
+from .scoring import normalize_question_weights
+
+POSTERIOR_PRIOR_ALPHA = 1.0
+POSTERIOR_DRAWS = 2000
+CREDIBLE_LEVEL = 0.90
+
+# Same grouping as ScoreState.get_reveal_archetype
+ARCHETYPE_GROUPS: Dict[str, Tuple[str, ...]] = {
+    "guardian": (CATEGORY_PR, CATEGORY_CO),
+    "analyst": (CATEGORY_AN, CATEGORY_OV),
+    "ghost": (CATEGORY_IN,),
+    "architect": (CATEGORY_SP, CATEGORY_OM),
+}
+_CATEGORY_INDEX = {c: i for i, c in enumerate(ALL_CATEGORIES)}
+_ARCHETYPE_OF_CATEGORY = np.array(
+    [next(i for i, cats in enumerate(ARCHETYPE_GROUPS.values()) if c in cats) for c in ALL_CATEGORIES]
+)
+
+
+class ArchetypePosterior:
+    """Dirichlet posterior over the seven NICE category shares for one session."""
+
+    __slots__ = ("alpha", "n")
+
+    def __init__(self) -> None:
+        self.alpha: array = array("d", [POSTERIOR_PRIOR_ALPHA] * len(ALL_CATEGORIES))
+        self.n: int = 0
+
+    def observe(self, weights: Dict[str, float], strength: float = 1.0) -> None:
+        """Add one answer: `strength` units of evidence split by the choice weights."""
+        normalized = normalize_question_weights(weights)
+        total = sum(w for c, w in normalized.items() if c in _CATEGORY_INDEX and w > 0)
+        if total <= 0:
+            return
+        for cat, w in normalized.items():
+            k = _CATEGORY_INDEX.get(cat)
+            if k is not None and w > 0:
+                self.alpha[k] += strength * w / total
+        self.n += 1
+
+    def observe_evidence(self, evidence: Sequence[float], answers: int) -> None:
+        """Add pre-summed evidence (ALL_CATEGORIES order) for `answers` answers scored in one batch."""
+        for k, e in enumerate(evidence):
+            self.alpha[k] += float(e)
+        self.n += answers
+
+    def mean(self) -> Dict[str, float]:
+        s = sum(self.alpha)
+        return {c: self.alpha[i] / s for i, c in enumerate(ALL_CATEGORIES)}
+
+    def _draws(self, draws: int) -> np.ndarray:
+        # Seeded so a page shows the same numbers on every rerun for the same evidence
+        g = np.random.default_rng(self.n).standard_gamma(np.asarray(self.alpha), size=(draws, len(self.alpha)))
+        return g / g.sum(axis=1, keepdims=True)
+
+    def archetype_probabilities(self, draws: int = POSTERIOR_DRAWS) -> Dict[str, float]:
+        winners = _ARCHETYPE_OF_CATEGORY[self._draws(draws).argmax(axis=1)]
+        counts = np.bincount(winners, minlength=len(ARCHETYPE_GROUPS)) / float(draws)
+        return {a: float(counts[i]) for i, a in enumerate(ARCHETYPE_GROUPS)}
+
+    def credible_intervals(self, level: float = CREDIBLE_LEVEL, draws: int = POSTERIOR_DRAWS) -> Dict[str, Tuple[float, float]]:
+        """Equal-tailed credible interval per category share."""
+        tail = (1.0 - level) / 2.0 * 100.0
+        lo, hi = np.percentile(self._draws(draws), [tail, 100.0 - tail], axis=0)
+        return {c: (float(lo[i]), float(hi[i])) for i, c in enumerate(ALL_CATEGORIES)}
+
+    def top_archetype(self, draws: int = POSTERIOR_DRAWS) -> Tuple[str, float]:
+        probs = self.archetype_probabilities(draws)
+        best = max(probs, key=probs.get)
+        return best, probs[best]
+
+    def archetype_lower_bound(self) -> Tuple[str, float]:
+        """
+        Archetype of the highest-alpha category j and a lower bound on P(argmax category ∈ its group):
+        1 − Σ_{k outside the group} P(share_k > share_j), where share_k / (share_k + share_j) ~ Beta(α_k, α_j).
+        """
+        j = max(range(len(self.alpha)), key=self.alpha.__getitem__)
+        group = int(_ARCHETYPE_OF_CATEGORY[j])
+        miss = sum(
+            _beta_sf_half(self.alpha[k], self.alpha[j])
+            for k in range(len(self.alpha))
+            if int(_ARCHETYPE_OF_CATEGORY[k]) != group
+        )
+        return list(ARCHETYPE_GROUPS)[group], max(0.0, 1.0 - miss)
+
+
+def _beta_sf_half(a: float, b: float) -> float:
+    """P(X > 1/2) for X ~ Beta(a, b): I_{1/2}(b, a), regularized incomplete beta by continued fraction."""
+    x, p, q = 0.5, b, a  # I_{1/2}(b, a) = 1 − I_{1/2}(a, b)
+    if x >= (p + 1.0) / (p + q + 2.0):  # use the symmetric form where the fraction converges fast
+        return 1.0 - _beta_inc(q, p, 1.0 - x)
+    return _beta_inc(p, q, x)
+
+
+def _beta_inc(a: float, b: float, x: float) -> float:
+    """Regularized incomplete beta I_x(a, b) (Lentz continued fraction; x < (a + 1) / (a + b + 2))."""
+    front = math.exp(math.lgamma(a + b) - math.lgamma(a) - math.lgamma(b) + a * math.log(x) + b * math.log1p(-x)) / a
+    tiny = 1e-300
+    c, d = 1.0, 1.0 - (a + b) * x / (a + 1.0)
+    d = 1.0 / (d if abs(d) > tiny else tiny)
+    f = d
+    for m in range(1, 200):
+        for numerator in (
+            m * (b - m) * x / ((a + 2 * m - 1) * (a + 2 * m)),
+            -(a + m) * (a + b + m) * x / ((a + 2 * m) * (a + 2 * m + 1)),
+        ):
+            d = 1.0 + numerator * d
+            d = 1.0 / (d if abs(d) > tiny else tiny)
+            c = 1.0 + numerator / c
+            c = c if abs(c) > tiny else tiny
+            f *= c * d
+        if abs(c * d - 1.0) < 1e-12:
+            break
+    return min(1.0, max(0.0, front * f))
+
+
+@dataclass(frozen=True)
+class EarlyStopRule:
+    """Stop a mission after min_items answers once P(top archetype) ≥ confidence (lower bound, no sampling)."""
+
+    min_items: int
+    confidence: float = 0.95
+
+    def should_stop(self, posterior: ArchetypePosterior, answered: int) -> bool:
+        """posterior holds this mission's answers only (SessionModel.mission_posterior)."""
+        if answered < self.min_items:
+            return False
+        return posterior.archetype_lower_bound()[1] >= self.confidence
+
+
+EARLY_STOP_RULES: Dict[str, EarlyStopRule] = {
+    "explorer": EarlyStopRule(min_items=12, confidence=0.95),
+    "specialist": EarlyStopRule(min_items=22, confidence=0.95),
+    "operator": EarlyStopRule(min_items=6, confidence=0.97),
+}
+
+
+def parse_stop_rules(spec: Optional[str]) -> Dict[str, EarlyStopRule]:
+    """CCC_EARLY_STOP value → rules. None/""/"0" = none (off), "1" = defaults, else "tier:min_items:confidence,...". """
+    spec = (spec or "").strip()
+    if spec in ("", "0"):
+        return {}
+    if spec == "1":
+        return dict(EARLY_STOP_RULES)
+    rules: Dict[str, EarlyStopRule] = {}
+    for part in spec.split(","):
+        fields = part.strip().split(":")
+        if len(fields) != 3:
+            raise ValueError(f"CCC_EARLY_STOP entry {part!r} is not tier:min_items:confidence")
+        rules[fields[0]] = EarlyStopRule(int(fields[1]), float(fields[2]))
+    return rules
+
+
+def get_stop_rule(tier: str) -> Optional[EarlyStopRule]:
+    return parse_stop_rules(os.environ.get("CCC_EARLY_STOP")).get(tier)
@@ -0,0 +1,121 @@
+"""
+Proving Grounds round generation — immutable round sets per seed, cached across sessions.
+
+A run's Identity/Boundary/Integrity rounds are a pure function of proving_questions_seed
+(identity uses seed, boundary seed + 1, integrity seed + 2). get_round_set builds all three once
+per seed and keeps them in the process-wide "proving_rounds" memory cache (cache.get_cache;
+PROVING_ROUND_CACHE_SIZE entries, override with CCC_PROVING_ROUND_CACHE; "0" disables caching).
+Sessions only hold the seed; every rerun gets the same frozen ProvingRoundSet back. The Integrity hashes are constants, hashed at import.
+"""
+
+import hashlib
+import os
+import random
+from dataclasses import dataclass
+from typing import Dict, Tuple
+
+from .cache import TieredCache, get_cache
+
+PROVING_ROUND_CACHE_SIZE = 256
+
+IDENTITY_ROUNDS = 4
+BOUNDARY_ROUNDS = 3
+INTEGRITY_ROUNDS = 3
+IDENTITY_LOG_LINES = 6
+
+IDENTITY_THREATS = ("MFA_BYPASS", "DORMANT_USER", "NTLM_RELAY")
+IDENTITY_BENIGN = ("LOGIN_OK", "SESSION_ACTIVE", "AUTH_OK")
+ROGUE_PORTS = (4444, 6667, 445)
+CANONICAL_POLICY_HASH = hashlib.sha256(b"Project Ares policy v1.0\nIntegrity check.").hexdigest()
+TAMPERED_POLICY_HASH = hashlib.sha256(b"tampered").hexdigest()
+
+
+@dataclass(frozen=True)
+class IdentityRound:
+    log_lines: Tuple[str, ...]
+    correct_line_index: int
+
+
+@dataclass(frozen=True)
+class BoundaryRound:
+    port: int
+    position_pct: int
+
+
+@dataclass(frozen=True)
+class IntegrityRound:
+    hash_a: str
+    hash_b: str
+    match: bool
+
+
+@dataclass(frozen=True)
+class ProvingRoundSet:
+    seed: int
+    identity: Tuple[IdentityRound, ...]
+    boundary: Tuple[BoundaryRound, ...]
+    integrity: Tuple[IntegrityRound, ...]
+
+
+def build_identity_rounds(seed: int) -> Tuple[IdentityRound, ...]:
+    """[ IDENTITY_STRIKE ]: 0xHEX log feed, one threat line per round."""
+    rng = random.Random(seed)
+    rounds = []
+    for _ in range(IDENTITY_ROUNDS):
+        threat = rng.choice(IDENTITY_THREATS)
+        log_lines = []
+        threat_idx = rng.randint(0, IDENTITY_LOG_LINES - 1)
+        for i in range(IDENTITY_LOG_LINES):
+            hex_ts = f"0x{rng.randint(0x1A2B3C4D, 0xE5F6A7B8):08X}"
+            ip = f"10.0.0.{rng.randint(1, 50)}"
+            line_id = f"0x{rng.randint(0, 0xFFFF):04X}"  # drawn before the event so existing seeds keep their rounds
+            event = threat if i == threat_idx else rng.choice(IDENTITY_BENIGN)
+            log_lines.append(f"{line_id} {hex_ts} AUTH_EVENT {event} {ip}")
+        rng.shuffle(log_lines)
+        correct_idx = next(i for i, line in enumerate(log_lines) if any(t in line for t in IDENTITY_THREATS))
+        rounds.append(IdentityRound(tuple(log_lines), correct_idx))
+    return tuple(rounds)
+
+
+def build_boundary_rounds(seed: int) -> Tuple[BoundaryRound, ...]:
+    """[ BOUNDARY_PURGE ]: rogue port and packet position % toward egress."""
+    rng = random.Random(seed + 1)
+    return tuple(BoundaryRound(rng.choice(ROGUE_PORTS), rng.randint(25, 95)) for _ in range(BOUNDARY_ROUNDS))
+
+
+def build_integrity_rounds(seed: int) -> Tuple[IntegrityRound, ...]:
+    """[ INTEGRITY_SYNC ]: expected vs computed SHA-256, match or mismatch."""
+    rng = random.Random(seed + 2)
+    rounds = []
+    for _ in range(INTEGRITY_ROUNDS):
+        match = rng.choice([True, False])
+        computed = CANONICAL_POLICY_HASH if match else TAMPERED_POLICY_HASH
+        rounds.append(IntegrityRound(CANONICAL_POLICY_HASH, computed, match))
+    return tuple(rounds)
+
+
+def build_round_set(seed: int) -> ProvingRoundSet:
+    return ProvingRoundSet(seed, build_identity_rounds(seed), build_boundary_rounds(seed), build_integrity_rounds(seed))
+
+
+def _cache_size() -> int:
+    raw = os.environ.get("CCC_PROVING_ROUND_CACHE")
+    return PROVING_ROUND_CACHE_SIZE if raw is None else max(0, int(raw))
+
+
+def _round_cache() -> TieredCache:
+    return get_cache("proving_rounds", max_entries=_cache_size())
+
+
+def get_round_set(seed: int) -> ProvingRoundSet:
+    """Round set for seed, from the shared LRU when present."""
+    return _round_cache().get_or_build(seed, lambda: build_round_set(seed))
+
+
+def get_round_cache_stats() -> Dict[str, int]:
+    memory = _round_cache().stats().get("memory", {})
+    return {"size": memory.get("entries", 0), "hits": memory.get("hits", 0), "misses": memory.get("misses", 0)}
+
+
+def clear_round_cache() -> None:
+    _round_cache().clear()
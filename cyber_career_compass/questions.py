@@ -3,7 +3,7 @@ Instinct (Personality), Technical (Triage), and Deep-Scenario questions for Cybe
 Choices use a weighted matrix: each option contributes to multiple NIST NICE categories
 (e.g., 80% Protect and Defend, 20% Investigate).
 
-Mission-tier API (imported by main.py):
+Mission-tier API (imported by streamlit_app.py):
 - get_explorer_questions()  → 20 items (10 Instinct + 10 NIST Foundations)
 - get_specialist_questions() → 50 items (5 Instinct + 10 Technical + 16 Deep + 19 TKS)
 - get_operator_questions()  → 12 items (mission scenarios)
@@ -33,7 +33,7 @@ import random
 from dataclasses import dataclass
 from typing import List, Dict, Optional, Any, Union, Tuple
 
-from cyber_career_compass.nice_framework import (
+from .nice_framework import (
     CATEGORY_SP,
     CATEGORY_PR,
     CATEGORY_AN,
@@ -625,7 +625,7 @@ CANONICAL_OPERATOR_WEIGHTS: List[List[Dict[str, float]]] = [
 
 def get_specialist_tks_questions(lang: Optional[str] = None) -> List[Question]:
     """19 TKS gap questions for Specialist path (2026 NIST)."""
-    from cyber_career_compass.translations import get_specialist_tks_texts
+    from .translations import get_specialist_tks_texts
     l = lang or "en"
     texts = get_specialist_tks_texts(l)
     out: List[Question] = []
@@ -638,7 +638,7 @@ def get_specialist_tks_questions(lang: Optional[str] = None) -> List[Question]:
 
 def get_specialist_questions(lang: Optional[str] = None) -> List[Question]:
     """50 questions for Specialist path: 5 Instinct + 10 Technical + 16 Deep + 19 TKS.
-    Explicitly defined and exported for main.py mission hub."""
+    Explicitly defined and exported for the streamlit_app.py mission hub."""
     return (
         get_instinct_questions(lang)
         + get_technical_questions(lang)
@@ -649,8 +649,8 @@ def get_specialist_questions(lang: Optional[str] = None) -> List[Question]:
 
 def get_operator_questions(lang: Optional[str] = None) -> List[Question]:
     """12 mission scenario questions for Operator path (2026 AI/Supply Chain).
-    Explicitly defined and exported for main.py mission hub. Linear order; use get_operator_question_branch for branching."""
-    from cyber_career_compass.translations import get_operator_texts
+    Explicitly defined and exported for the streamlit_app.py mission hub. Linear order; use get_operator_question_branch for branching."""
+    from .translations import get_operator_texts
     l = lang or "en"
     texts = get_operator_texts(l)
     out: List[Question] = []
@@ -662,25 +662,21 @@ def get_operator_questions(lang: Optional[str] = None) -> List[Question]:
 
 
 def get_operator_question_branch(lang: Optional[str], index: int, choice_history: List[int]) -> Optional[Question]:
-    """Return Operator question at index; for index 1 and 2 use branch variant from prior choice (decision tree)."""
-    from cyber_career_compass.translations import get_operator_texts_branch
-    l = lang or "en"
-    prior = choice_history[index - 1] if index > 0 and index <= len(choice_history) else None
-    if index in (1, 2):
-        prior = choice_history[index - 1] if len(choice_history) >= index else None
-    t = get_operator_texts_branch(l, index, prior)
-    if not t:
+    """Return Operator question at index along choice_history (decision tree); missions 2 and 3 branch on the prior choice.
+    Served from the compiled node table (cyber_career_compass.operator_tree) — one array lookup per step."""
+    from .operator_tree import get_operator_tree, node_for_history
+    if index < 0:
         return None
-    weights = CANONICAL_OPERATOR_WEIGHTS[index] if index < len(CANONICAL_OPERATOR_WEIGHTS) else CANONICAL_OPERATOR_WEIGHTS[0]
-    choices = [Choice(t["choices"][j], weights[j]) for j in range(len(t["choices"]))]
-    return Question(prompt=t["prompt"], choices=choices)
+    tree = get_operator_tree(lang or "en")
+    node = node_for_history(tree.children, tree.base_nodes, choice_history, index)
+    return None if node is None else tree.questions[node]
 
 
 def get_instinct_questions(lang: Optional[str] = None) -> List[Question]:
     """Return Instinct questions; text from translations if lang given, else built-in EN."""
     if lang is None:
         return INSTINCT_QUESTIONS
-    from cyber_career_compass.translations import get_instinct_texts
+    from .translations import get_instinct_texts
     texts = get_instinct_texts(lang)
     out: List[Question] = []
     for i, t in enumerate(texts):
@@ -699,7 +695,7 @@ def get_technical_questions(lang: Optional[str] = None) -> List[Question]:
     """Return Technical questions; text from translations if lang given."""
     if lang is None:
         return TECHNICAL_QUESTIONS
-    from cyber_career_compass.translations import get_technical_texts
+    from .translations import get_technical_texts
     texts = get_technical_texts(lang)
     out = []
     for i, t in enumerate(texts):
@@ -713,7 +709,7 @@ def get_deep_scenario_questions(lang: Optional[str] = None) -> List[Question]:
     """Return 16 Deep Scenario questions (5 trend + 10 NIST + 1 regional, e.g. METI for JA)."""
     if lang is None:
         return DEEP_SCENARIO_QUESTIONS
-    from cyber_career_compass.translations import get_deep_texts
+    from .translations import get_deep_texts
     texts = get_deep_texts(lang)
     out = []
     for i, t in enumerate(texts):
@@ -725,7 +721,7 @@ def get_deep_scenario_questions(lang: Optional[str] = None) -> List[Question]:
 
 def get_explorer_instinct_questions(lang: Optional[str] = None) -> List[Question]:
     """10 Instinct questions for Explorer path (5 base + 5 extra). Text from cyber_career_compass.translations."""
-    from cyber_career_compass.translations import get_explorer_instinct_texts
+    from .translations import get_explorer_instinct_texts
     l = lang or "en"
     texts = get_explorer_instinct_texts(l)
     out: List[Question] = []
@@ -743,7 +739,7 @@ def get_explorer_foundations_questions(lang: Optional[str] = None) -> List[Quest
 
 def get_explorer_questions(lang: Optional[str] = None) -> List[Question]:
     """Return exactly 20 foundational NIST questions: 10 Instinct + 10 NIST Foundations.
-    Explicitly defined and exported for main.py mission hub. All text via cyber_career_compass.translations."""
+    Explicitly defined and exported for the streamlit_app.py mission hub. All text via cyber_career_compass.translations."""
     instinct = get_explorer_instinct_questions(lang)
     foundations = get_explorer_foundations_questions(lang)
     result = instinct + foundations
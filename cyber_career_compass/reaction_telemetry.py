@@ -0,0 +1,129 @@
+"""
+Reaction-time telemetry for the Reflex drills — log-bucketed latency histograms per user and per threat.
+
+Latencies come from monotonic clocks: the sprint's answer log is timed in the browser with
+performance.now() (sprint_timer.py derives per-threat reaction times from it); the button-driven
+drills use time.monotonic() from threat render to click on the server.
+
+Buckets are logarithmic, REACTION_BUCKETS_PER_OCTAVE per doubling from REACTION_MIN_MS up to
+REACTION_MIN_MS · 2^REACTION_OCTAVES, plus an underflow and an overflow bucket: a fixed 42-counter
+array per histogram, O(1) per sample, percentiles within ±9% (geometric bucket midpoint).
+Per-user histograms live in the SessionModel; per-threat histograms (REFLEX_THREATS index) are
+process-wide, guarded by one lock.
+"""
+
+import math
+import threading
+from array import array
+from typing import Any, Dict, List, Optional, Tuple
+
+REACTION_MIN_MS = 64.0
+REACTION_BUCKETS_PER_OCTAVE = 4
+REACTION_OCTAVES = 10  # 64 ms … 65.5 s
+REACTION_N_BUCKETS = REACTION_OCTAVES * REACTION_BUCKETS_PER_OCTAVE + 2
+
+
+def bucket_index(latency_ms: float) -> int:
+    """0 = below REACTION_MIN_MS, REACTION_N_BUCKETS - 1 = overflow."""
+    if latency_ms < REACTION_MIN_MS:
+        return 0
+    i = 1 + int(REACTION_BUCKETS_PER_OCTAVE * math.log2(latency_ms / REACTION_MIN_MS))
+    return min(i, REACTION_N_BUCKETS - 1)
+
+
+def bucket_bounds(i: int) -> Tuple[float, float]:
+    """[lower, upper) latency in ms covered by bucket i."""
+    if i <= 0:
+        return 0.0, REACTION_MIN_MS
+    lo = REACTION_MIN_MS * 2.0 ** ((i - 1) / REACTION_BUCKETS_PER_OCTAVE)
+    if i >= REACTION_N_BUCKETS - 1:
+        return lo, math.inf
+    return lo, REACTION_MIN_MS * 2.0 ** (i / REACTION_BUCKETS_PER_OCTAVE)
+
+
+class LatencyHistogram:
+    """Fixed log-bucket latency histogram (uint32 counters)."""
+
+    __slots__ = ("counts", "n", "total_ms")
+
+    def __init__(self) -> None:
+        self.counts: array = array("I", bytes(4 * REACTION_N_BUCKETS))
+        self.n = 0
+        self.total_ms = 0.0
+
+    def add(self, latency_ms: float) -> None:
+        self.counts[bucket_index(latency_ms)] += 1
+        self.n += 1
+        self.total_ms += latency_ms
+
+    def merge(self, other: "LatencyHistogram") -> None:
+        for i, c in enumerate(other.counts):
+            self.counts[i] += c
+        self.n += other.n
+        self.total_ms += other.total_ms
+
+    @property
+    def mean_ms(self) -> float:
+        return self.total_ms / self.n if self.n else 0.0
+
+    def percentile(self, pct: float) -> float:
+        """Approximate percentile: geometric midpoint of the bucket holding the pct-th sample."""
+        if self.n == 0:
+            return 0.0
+        rank = max(1, math.ceil(pct / 100.0 * self.n))
+        seen = 0
+        for i, c in enumerate(self.counts):
+            seen += c
+            if seen >= rank:
+                lo, hi = bucket_bounds(i)
+                if i == 0:
+                    return hi / 2.0
+                return lo if math.isinf(hi) else math.sqrt(lo * hi)
+        return 0.0
+
+    def summary(self) -> Dict[str, Any]:
+        return {
+            "n": self.n,
+            "mean_ms": self.mean_ms,
+            "p50_ms": self.percentile(50),
+            "p90_ms": self.percentile(90),
+            "buckets": {i: c for i, c in enumerate(self.counts) if c},
+        }
+
+
+_lock = threading.Lock()
+_threat_histograms: Dict[int, LatencyHistogram] = {}
+
+
+def record_reaction(threat_index: int, latency_ms: float, user_histogram: Optional[LatencyHistogram] = None) -> None:
+    """One reaction: into the per-threat histogram and, if given, the user's histogram."""
+    if latency_ms < 0:
+        return
+    if user_histogram is not None:
+        user_histogram.add(latency_ms)
+    with _lock:
+        hist = _threat_histograms.get(threat_index)
+        if hist is None:
+            hist = _threat_histograms[threat_index] = LatencyHistogram()
+        hist.add(latency_ms)
+
+
+def get_threat_reaction_summary() -> Dict[int, Dict[str, Any]]:
+    """Per-threat summaries keyed by REFLEX_THREATS index."""
+    with _lock:
+        return {i: h.summary() for i, h in sorted(_threat_histograms.items())}
+
+
+def format_threat_report(threats: Optional[List[Tuple[str, str, str]]] = None) -> str:
+    if threats is None:
+        from .reflex_drill import REFLEX_THREATS as threats
+    lines = [f"{'threat':<48} {'n':>6} {'p50':>8} {'p90':>8}"]
+    for i, s in get_threat_reaction_summary().items():
+        label = threats[i][0][:46] if 0 <= i < len(threats) else str(i)
+        lines.append(f"{label:<48} {s['n']:>6} {s['p50_ms']:>6.0f}ms {s['p90_ms']:>6.0f}ms")
+    return "\n".join(lines)
+
+
+def reset_reaction_telemetry() -> None:
+    with _lock:
+        _threat_histograms.clear()
@@ -17,12 +17,15 @@ from .nice_framework import (
     CATEGORY_OM,
     CATEGORY_OV,
 )
+from .reaction_telemetry import record_reaction
 from .scoring import ScoreState
 from .translations import get_ui
 
 
 # 10 NIST-mapped threats: (threat_text, correct_action_key, nice_category).
 # Action = "NEUTRALIZE" | "DROP" | "FREEZE". Telemetry maps each to one NICE category.
+# Responses are stored as the action's index in REFLEX_ACTIONS.
+REFLEX_ACTIONS: Tuple[str, str, str] = ("NEUTRALIZE", "DROP", "FREEZE")
 REFLEX_THREATS: List[Tuple[str, str, str]] = [
     ("DETECTED: MFA_BYPASS req=0x7f", "NEUTRALIZE", CATEGORY_PR),   # 1 Protect and Defend
     ("DETECTED: DORMANT_USER_LOGIN uid=admin", "NEUTRALIZE", CATEGORY_CO),  # 2 Collect and Operate
@@ -168,6 +171,27 @@ def _trigger_fail_state() -> None:
     st.session_state.reflex_ui_lockout_until = time.time() + 1.0
 
 
+def _mark_threat_shown(idx: int) -> None:
+    """Start the reaction clock when threat idx is first rendered (reruns of the same threat keep it)."""
+    import streamlit as st
+
+    if st.session_state.get("reflex_shown_idx") != idx:
+        st.session_state.reflex_shown_idx = idx
+        st.session_state.reflex_shown_mono = time.monotonic()
+
+
+def _record_click_reaction(idx: int) -> None:
+    """Threat render → click latency into the reaction histograms; a retry after a miss is timed afresh."""
+    import streamlit as st
+
+    now = time.monotonic()
+    shown = st.session_state.get("reflex_shown_mono")
+    if shown is not None:
+        sess = st.session_state.get("session")
+        record_reaction(idx, (now - shown) * 1000.0, getattr(sess, "reaction_hist", None))
+    st.session_state.reflex_shown_mono = now
+
+
 def render_reflex_drill_page() -> None:
     import streamlit as st
 
@@ -220,7 +244,7 @@ def render_reflex_drill_page() -> None:
             st.session_state.sync_level = 100
             st.session_state.reflex_complete = True
             st.session_state.proving_grounds_module = None
-            for k in ("reflex_drill_index", "checks_cleared", "reflex_chromatic_glitch_until", "reflex_ui_lockout_until"):
+            for k in ("reflex_drill_index", "checks_cleared", "reflex_chromatic_glitch_until", "reflex_ui_lockout_until", "reflex_shown_idx", "reflex_shown_mono"):
                 st.session_state.pop(k, None)
             st.markdown(
                 f'<p style="font-family:\'Share Tech Mono\',monospace;color:#39ff14;">'
@@ -241,6 +265,7 @@ def render_reflex_drill_page() -> None:
     question_weight = {nice_category: 0.1}
 
     current_display = idx + 1
+    _mark_threat_shown(idx)
     st.markdown(
         f'<div class="reflex-single-container">'
         f'<div class="reflex-system-health-wrap">'
@@ -254,6 +279,7 @@ def render_reflex_drill_page() -> None:
     c1, c2, c3 = st.columns(3)
     with c1:
         if st.button(f" [ {neutralize_btn} ] ", key="reflex_act_neutralize", type="secondary", disabled=locked):
+            _record_click_reaction(idx)
             if correct_action == "NEUTRALIZE":
                 st.session_state.reflex_drill_index = idx + 1
                 _set_pulse_amber()
@@ -268,6 +294,7 @@ def render_reflex_drill_page() -> None:
                 )
     with c2:
         if st.button(f" [ {drop_btn} ] ", key="reflex_act_drop", type="secondary", disabled=locked):
+            _record_click_reaction(idx)
             if correct_action == "DROP":
                 st.session_state.reflex_drill_index = idx + 1
                 _set_pulse_amber()
@@ -282,6 +309,7 @@ def render_reflex_drill_page() -> None:
                 )
     with c3:
         if st.button(f" [ {freeze_btn} ] ", key="reflex_act_freeze", type="secondary", disabled=locked):
+            _record_click_reaction(idx)
             if correct_action == "FREEZE":
                 st.session_state.reflex_drill_index = idx + 1
                 _set_pulse_amber()
@@ -0,0 +1,149 @@
+"""
+Columnar append-only response log.
+
+One fixed-width binary file per column (session_id, tier, lang, question_index, choice_index,
+latency_ms, ts) in a log directory, plus index.bin with one record per flushed chunk
+(row_start, rows, ts_min, ts_max). Appends from all sessions go to an in-memory buffer and are
+flushed in bulk (every FLUSH_ROWS rows or FLUSH_INTERVAL_S seconds, and at exit). A chunk is
+committed only once its index record is written, so readers never see a partial flush.
+
+Reading needs no parsing: open_log(path) memory-maps each column as a NumPy array.
+Enable in the app with CCC_RESPONSE_LOG_DIR=/path/to/log. One writer process per directory.
+"""
+
+import atexit
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Optional, Union
+
+import numpy as np
+
+COLUMNS: Dict[str, np.dtype] = {
+    "session_id": np.dtype("<u8"),
+    "tier": np.dtype("i1"),
+    "lang": np.dtype("i1"),
+    "question_index": np.dtype("<i2"),
+    "choice_index": np.dtype("i1"),
+    "latency_ms": np.dtype("<u4"),
+    "ts": np.dtype("<f8"),
+}
+INDEX_DTYPE = np.dtype([("row_start", "<u8"), ("rows", "<u4"), ("ts_min", "<f8"), ("ts_max", "<f8")])
+INDEX_FILE = "index.bin"
+
+FLUSH_ROWS = 4096
+FLUSH_INTERVAL_S = 5.0
+
+LOG_DIR_ENV = "CCC_RESPONSE_LOG_DIR"
+
+
+def _column_path(root: Path, name: str) -> Path:
+    return root / f"{name}.{COLUMNS[name].str.lstrip('<|')}"
+
+
+class ResponseLogWriter:
+    """Buffered, thread-safe appender. append() is O(1); flush() writes one chunk per column."""
+
+    def __init__(self, path: Union[str, Path], flush_rows: int = FLUSH_ROWS, flush_interval_s: float = FLUSH_INTERVAL_S) -> None:
+        self.path = Path(path)
+        self.path.mkdir(parents=True, exist_ok=True)
+        self.flush_rows = flush_rows
+        self.flush_interval_s = flush_interval_s
+        self._lock = threading.Lock()
+        self._buf = {name: np.empty(flush_rows, dtype=dt) for name, dt in COLUMNS.items()}
+        self._n = 0
+        self._last_flush = time.monotonic()
+        self._committed = int(read_index(self.path)["rows"].sum())
+
+    def append(
+        self,
+        session_id: int,
+        tier: int,
+        lang: int,
+        question_index: int,
+        choice_index: int,
+        latency_ms: int,
+        ts: Optional[float] = None,
+    ) -> None:
+        with self._lock:
+            i = self._n
+            buf = self._buf
+            buf["session_id"][i] = session_id
+            buf["tier"][i] = tier
+            buf["lang"][i] = lang
+            buf["question_index"][i] = question_index
+            buf["choice_index"][i] = choice_index
+            buf["latency_ms"][i] = max(0, min(int(latency_ms), 0xFFFFFFFF))
+            buf["ts"][i] = time.time() if ts is None else ts
+            self._n = i + 1
+            due = self._n >= self.flush_rows or time.monotonic() - self._last_flush >= self.flush_interval_s
+            if due:
+                self._flush_locked()
+
+    def flush(self) -> None:
+        with self._lock:
+            self._flush_locked()
+
+    def _flush_locked(self) -> None:
+        self._last_flush = time.monotonic()
+        n = self._n
+        if n == 0:
+            return
+        # Column files may hold rows past the committed count after a crash; trim them first.
+        for name in COLUMNS:
+            col = _column_path(self.path, name)
+            with open(col, "ab") as f:
+                if f.tell() != self._committed * COLUMNS[name].itemsize:
+                    f.truncate(self._committed * COLUMNS[name].itemsize)
+                f.write(self._buf[name][:n].tobytes())
+        ts = self._buf["ts"][:n]
+        record = np.array([(self._committed, n, ts.min(), ts.max())], dtype=INDEX_DTYPE)
+        with open(self.path / INDEX_FILE, "ab") as f:
+            f.write(record.tobytes())
+        self._committed += n
+        self._n = 0
+
+
+def read_index(path: Union[str, Path]) -> np.ndarray:
+    """Chunk index (row_start, rows, ts_min, ts_max); empty when the log has no committed chunks."""
+    index_path = Path(path) / INDEX_FILE
+    if not index_path.exists():
+        return np.zeros(0, dtype=INDEX_DTYPE)
+    raw = index_path.read_bytes()
+    usable = len(raw) - len(raw) % INDEX_DTYPE.itemsize
+    return np.frombuffer(raw[:usable], dtype=INDEX_DTYPE)
+
+
+def open_log(path: Union[str, Path]) -> Dict[str, np.ndarray]:
+    """Memory-map every column (read-only), truncated to committed rows. No parsing step."""
+    root = Path(path)
+    rows = int(read_index(root)["rows"].sum())
+    columns: Dict[str, np.ndarray] = {}
+    for name, dt in COLUMNS.items():
+        col = _column_path(root, name)
+        if rows == 0 or not col.exists():
+            columns[name] = np.zeros(0, dtype=dt)
+        else:
+            columns[name] = np.memmap(col, dtype=dt, mode="r", shape=(rows,))
+    return columns
+
+
+# ─── Process-wide writer for the app ─────────────────────────────────────────
+_writer: Optional[ResponseLogWriter] = None
+_writer_lock = threading.Lock()
+
+
+def get_response_log() -> Optional[ResponseLogWriter]:
+    """Shared writer for CCC_RESPONSE_LOG_DIR, or None when logging is not configured."""
+    global _writer
+    if _writer is not None:
+        return _writer
+    path = os.environ.get(LOG_DIR_ENV, "")
+    if not path:
+        return None
+    with _writer_lock:
+        if _writer is None:
+            _writer = ResponseLogWriter(path)
+            atexit.register(_writer.flush)
+    return _writer
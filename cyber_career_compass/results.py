@@ -11,20 +11,32 @@ from .nice_framework import (
     ALL_ROLE_IDS,
 )
 
-# Reflex Telemetry Guard: default the Reflex drill state to False until
-# the drill explicitly flips it, so downstream rendering logic can safely
-# rely on st.session_state.reflex_complete.
+from .cache import get_cache
+from .metrics import timed
+from .session import get_session
+
+# Reflex Telemetry Guard: reflex_complete lives on the SessionModel (False until
+# the drill explicitly flips it), so downstream rendering logic can safely rely on it.
 try:  # pragma: no cover
     import streamlit as st  # type: ignore
-
-    if "reflex_complete" not in st.session_state:
-        st.session_state.reflex_complete = False
 except Exception:
     # Safe no-op when imported outside a Streamlit session.
     pass
 
+
+def _reflex_complete() -> bool:
+    return get_session(st.session_state).reflex_complete
+
+
+def _dossier(score_state: Any, lang: Optional[str]) -> Any:
+    """Cached DossierArtifacts for this session's outcome (dossier.get_dossier)."""
+    from .dossier import get_dossier
+
+    return get_dossier(score_state, get_session(st.session_state).mission_tier, lang)
+
 # Professional baseline (0–100) per category for Skill Gap comparison
 PROFESSIONAL_BASELINE: Dict[str, float] = {c: 70.0 for c in ALL_CATEGORIES}
+RADAR_FIGURE_CACHE_SIZE = 256  # radar figures keyed by their inputs; shared read-only across sessions
 READINESS_THRESHOLD = 70.0  # Below this = show Professional Development Roadmap
 ELITE_BASELINE = 70.0
 
@@ -104,6 +116,7 @@ def _html_escape(s: str) -> str:
     return s.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;").replace('"', "&quot;")
 
 
+@timed("results.render_ares_deployment_cards")
 def render_ares_deployment_cards(
     deployments: List[Dict[str, str]],
     lang: Optional[str] = None,
@@ -149,6 +162,7 @@ def render_ares_deployment_cards(
         )
 
 
+@timed("results.render_ares_roadmap_summary")
 def render_ares_roadmap_summary(
     deployments: List[Dict[str, str]],
     lang: Optional[str] = None,
@@ -162,12 +176,13 @@ def render_ares_roadmap_summary(
     If skip_anchor_nodes=True, only render the provided deployments (e.g. 3 BRs for Reveal Level Up)."""
     import streamlit as st
     from .translations import get_ui, get_ares_scenario_title
-    from .project_ares import ARES_SCENARIOS
+    from .ares_catalog import get_catalog
 
     lang_key = lang or "en"
     ui = get_ui(lang_key)
     node_map_title = title_override if title_override is not None else ui.get("ares_node_map_title", "Mission Node Map")
 
+    scenarios = get_catalog().scenarios
     seen: set = set()
     ordered: List[Dict[str, str]] = []
     if not skip_anchor_nodes:
@@ -175,10 +190,10 @@ def render_ares_roadmap_summary(
             if sid in seen:
                 continue
             seen.add(sid)
-            info = ARES_SCENARIOS.get(sid)
-            if info:
-                title = get_ares_scenario_title(lang_key, sid) or info.get("title", sid)
-                tv = info.get("training_value", "")
+            scenario = scenarios.get(sid)
+            if scenario:
+                title = get_ares_scenario_title(lang_key, sid) or scenario.title
+                tv = scenario.training_value
                 ordered.append({
                     "id": sid,
                     "title": title,
@@ -227,6 +242,7 @@ def render_ares_roadmap_summary(
         )
 
 
+@timed("results.render_development_roadmap")
 def render_development_roadmap(score_state: Any, lang: Optional[str] = None) -> bool:
     """
     Reflex-gated Professional Development Roadmap.
@@ -237,14 +253,13 @@ def render_development_roadmap(score_state: Any, lang: Optional[str] = None) ->
     """
     import streamlit as st
     from .translations import get_ui, get_category_labels, get_learning_objectives
-    from .project_ares import COMPETENCY_THRESHOLD, get_recommended_deployments, get_recommended_deployments_by_top_category
+    from .project_ares import COMPETENCY_THRESHOLD
 
     lang_key = lang or "en"
     ui = get_ui(lang_key)
     category_labels = get_category_labels(lang_key)
     learning_objectives = get_learning_objectives(lang_key)
     user_scores = score_state.get_normalized_radar_scores()
-    baseline = PROFESSIONAL_BASELINE
 
     # Require at least one category below readiness threshold for roadmap relevance.
     below = [c for c in ALL_CATEGORIES if user_scores.get(c, 0) < READINESS_THRESHOLD]
@@ -253,21 +268,20 @@ def render_development_roadmap(score_state: Any, lang: Optional[str] = None) ->
 
     avg_score = sum(user_scores.get(c, 0) for c in ALL_CATEGORIES) / len(ALL_CATEGORIES)
     # Reflex Telemetry State-Lock: Mission Node Map and Recommended Training Deployments ONLY when reflex_complete
-    if not st.session_state.get("reflex_complete", False):
+    if not _reflex_complete():
         return False
     if avg_score <= 0:
         return False
 
+    dossier = _dossier(score_state, lang_key)
     st.markdown("---")
     st.markdown("#### " + ui.get("roadmap_title", "Professional Development Roadmap"))
     st.caption(ui.get("ares_guide_ref", "Battle Room descriptions (BR1, BR8, etc.) from Project Ares NIST NICE Guide, Page 47."))
 
     # Zone C: Mission Node Map + Recommended Training Deployments (state-locked behind reflex_complete)
-    if st.session_state.get("reflex_complete", False):
+    if _reflex_complete():
         # Ares Logic Synchronization: Mission Node Map driven by get_ares_recommendations() (2 lowest NIST categories → BR8, etc.)
-        from .scoring import get_ares_recommendations
-
-        ares_deployments = get_ares_recommendations(score_state, max_per_category=4)
+        ares_deployments = dossier.ares_recommendations
         # Convert to roadmap summary format: id, title, learning_path, type
         deployments_for_node_map: List[Dict[str, str]] = []
         for r in ares_deployments:
@@ -287,7 +301,7 @@ def render_development_roadmap(score_state: Any, lang: Optional[str] = None) ->
             metadata_str="SYS_REF: 800-181 // AUTH: DISA_CSSP",
         )
 
-        deployments = get_recommended_deployments(score_state, lang=lang_key, max_cards=4) if avg_score < COMPETENCY_THRESHOLD else []
+        deployments = list(dossier.deployments) if avg_score < COMPETENCY_THRESHOLD else []
 
         if deployments:
             st.markdown("**" + ui.get("ares_deployments_title", "Recommended Training Deployments") + "**")
@@ -295,7 +309,7 @@ def render_development_roadmap(score_state: Any, lang: Optional[str] = None) ->
             st.markdown("")
 
         # Project Ares by highest NIST category (strength-based, dynamic)
-        top_category_deployments = get_recommended_deployments_by_top_category(score_state, lang=lang_key, max_cards=4)
+        top_category_deployments = list(dossier.top_category_deployments)
         if top_category_deployments:
             st.markdown("**" + ui.get("ares_top_category_title", "Recommended for your top category") + "**")
             st.caption(ui.get("ares_top_category_caption", "Training aligned with your strongest NIST category."))
@@ -303,7 +317,7 @@ def render_development_roadmap(score_state: Any, lang: Optional[str] = None) ->
             st.markdown("")
 
     # Top 3 NIST K/S gaps + credential mapping.
-    top_gaps = get_top_gaps(user_scores, baseline, n=3)
+    top_gaps = dossier.gaps
     if top_gaps:
         st.markdown("**" + ui.get("gap_identification_title", "Top 3 NIST K/S Gaps") + "**")
         for cat, gap_size, _ in top_gaps:
@@ -327,6 +341,7 @@ def render_development_roadmap(score_state: Any, lang: Optional[str] = None) ->
     return True
 
 
+@timed("results.render_radar_chart")
 def render_radar_chart(
     category_scores: Dict[str, float],
     category_labels: Dict[str, str],
@@ -347,53 +362,60 @@ def render_radar_chart(
         cats = list(category_scores.keys())
     values = [category_scores.get(c, 0) for c in cats]
     labels = [category_labels.get(c, c) for c in cats]
-    values_loop = values + [values[0]]
-    labels_loop = labels + [labels[0]]
-    line_color = "#ffffff" if hud_style else accent_color
-    fill = fill_color if not hud_style else "rgba(0, 242, 255, 0.12)"
-    line_width = 3 if neon_glow else 2
-    grid_color = "rgba(0,0,0,0)" if hud_style else ("rgba(0, 242, 255, 0.35)" if ghost else "rgba(0, 242, 255, 0.15)")
-    fig = go.Figure(
-        data=go.Scatterpolar(
-            r=values_loop,
-            theta=labels_loop,
-            fill="toself",
-            line=dict(color=line_color, width=line_width),
-            fillcolor=fill,
+
+    def build() -> Any:
+        values_loop = values + [values[0]]
+        labels_loop = labels + [labels[0]]
+        line_color = "#ffffff" if hud_style else accent_color
+        fill = fill_color if not hud_style else "rgba(0, 242, 255, 0.12)"
+        line_width = 3 if neon_glow else 2
+        grid_color = "rgba(0,0,0,0)" if hud_style else ("rgba(0, 242, 255, 0.35)" if ghost else "rgba(0, 242, 255, 0.15)")
+        fig = go.Figure(
+            data=go.Scatterpolar(
+                r=values_loop,
+                theta=labels_loop,
+                fill="toself",
+                line=dict(color=line_color, width=line_width),
+                fillcolor=fill,
+            )
         )
-    )
-    fig.update_layout(
-        polar=dict(
-            bgcolor="rgba(0,0,0,0)",
-            radialaxis=dict(
-                visible=True,
-                range=[0, 100],
-                tickfont=dict(color="#a0a0a0"),
-                gridcolor=grid_color,
-                showgrid=not hud_style,
-            ),
-            angularaxis=dict(
-                tickfont=dict(color="#00FF00", size=11, family="'Share Tech Mono', monospace"),
-                gridcolor=grid_color,
-                showgrid=not hud_style,
+        fig.update_layout(
+            polar=dict(
+                bgcolor="rgba(0,0,0,0)",
+                radialaxis=dict(
+                    visible=True,
+                    range=[0, 100],
+                    tickfont=dict(color="#a0a0a0"),
+                    gridcolor=grid_color,
+                    showgrid=not hud_style,
+                ),
+                angularaxis=dict(
+                    tickfont=dict(color="#00FF00", size=11, family="'Share Tech Mono', monospace"),
+                    gridcolor=grid_color,
+                    showgrid=not hud_style,
+                ),
             ),
-        ),
-        paper_bgcolor="rgba(0,0,0,0)",
-        plot_bgcolor="rgba(0,0,0,0)",
-        showlegend=False,
-        margin=dict(t=30, b=30, l=50, r=50),
-        height=420,
-        font=dict(family="'Share Tech Mono', 'Inter', 'Hiragino Sans', sans-serif", color="#e0e0e0"),
-    )
-    if neon_glow:
-        fig.update_traces(
-            line=dict(width=line_width, color=line_color),
-            selector=dict(type="scatterpolar"),
+            paper_bgcolor="rgba(0,0,0,0)",
+            plot_bgcolor="rgba(0,0,0,0)",
+            showlegend=False,
+            margin=dict(t=30, b=30, l=50, r=50),
+            height=420,
+            font=dict(family="'Share Tech Mono', 'Inter', 'Hiragino Sans', sans-serif", color="#e0e0e0"),
         )
+        if neon_glow:
+            fig.update_traces(
+                line=dict(width=line_width, color=line_color),
+                selector=dict(type="scatterpolar"),
+            )
+        return fig
+
+    key = ("full", tuple(values), tuple(labels), accent_color, fill_color, neon_glow, ghost, hud_style)
+    fig = get_cache("radar_figures", max_entries=RADAR_FIGURE_CACHE_SIZE).get_or_build(key, build)
     st.markdown('<div class="radar-hud-frame" aria-hidden="true"></div>', unsafe_allow_html=True)
     st.plotly_chart(fig, use_container_width=True, config=dict(displayModeBar=True))
 
 
+@timed("results.render_radar_chart_compact")
 def render_radar_chart_compact(
     category_scores: Dict[str, float],
     category_labels: Dict[str, str],
@@ -413,47 +435,54 @@ def render_radar_chart_compact(
         cats = list(category_scores.keys())
     values = [category_scores.get(c, 0) for c in cats]
     labels = [category_labels.get(c, c) for c in cats]
-    values_loop = values + [values[0]]
-    labels_loop = labels + [labels[0]]
-    line_color = "#ffffff" if hud_style else accent_color
-    fill = fill_color if not hud_style else "rgba(0, 242, 255, 0.12)"
-    grid_color = "rgba(0,0,0,0)" if hud_style else "rgba(0, 242, 255, 0.15)"
-    fig = go.Figure(
-        data=go.Scatterpolar(
-            r=values_loop,
-            theta=labels_loop,
-            fill="toself",
-            line=dict(color=line_color, width=2),
-            fillcolor=fill,
+
+    def build() -> Any:
+        values_loop = values + [values[0]]
+        labels_loop = labels + [labels[0]]
+        line_color = "#ffffff" if hud_style else accent_color
+        fill = fill_color if not hud_style else "rgba(0, 242, 255, 0.12)"
+        grid_color = "rgba(0,0,0,0)" if hud_style else "rgba(0, 242, 255, 0.15)"
+        fig = go.Figure(
+            data=go.Scatterpolar(
+                r=values_loop,
+                theta=labels_loop,
+                fill="toself",
+                line=dict(color=line_color, width=2),
+                fillcolor=fill,
+            )
         )
-    )
-    fig.update_layout(
-        polar=dict(
-            bgcolor="rgba(0,0,0,0)",
-            radialaxis=dict(
-                visible=True,
-                range=[0, 100],
-                tickfont=dict(size=8, color="#a0a0a0"),
-                gridcolor=grid_color,
-                showgrid=not hud_style,
-            ),
-            angularaxis=dict(
-                tickfont=dict(color="#00FF00", size=9, family="'Share Tech Mono', monospace"),
-                gridcolor=grid_color,
-                showgrid=not hud_style,
+        fig.update_layout(
+            polar=dict(
+                bgcolor="rgba(0,0,0,0)",
+                radialaxis=dict(
+                    visible=True,
+                    range=[0, 100],
+                    tickfont=dict(size=8, color="#a0a0a0"),
+                    gridcolor=grid_color,
+                    showgrid=not hud_style,
+                ),
+                angularaxis=dict(
+                    tickfont=dict(color="#00FF00", size=9, family="'Share Tech Mono', monospace"),
+                    gridcolor=grid_color,
+                    showgrid=not hud_style,
+                ),
             ),
-        ),
-        paper_bgcolor="rgba(0,0,0,0)",
-        plot_bgcolor="rgba(0,0,0,0)",
-        showlegend=False,
-        margin=dict(t=20, b=20, l=30, r=30),
-        height=height,
-        font=dict(family="'Share Tech Mono', sans-serif", color="#e0e0e0", size=10),
-    )
+            paper_bgcolor="rgba(0,0,0,0)",
+            plot_bgcolor="rgba(0,0,0,0)",
+            showlegend=False,
+            margin=dict(t=20, b=20, l=30, r=30),
+            height=height,
+            font=dict(family="'Share Tech Mono', sans-serif", color="#e0e0e0", size=10),
+        )
+        return fig
+
+    key = ("compact", tuple(values), tuple(labels), height, accent_color, fill_color, hud_style)
+    fig = get_cache("radar_figures", max_entries=RADAR_FIGURE_CACHE_SIZE).get_or_build(key, build)
     st.markdown('<div class="radar-hud-frame" aria-hidden="true"></div>', unsafe_allow_html=True)
     st.plotly_chart(fig, use_container_width=True, config=dict(displayModeBar=False))
 
 
+@timed("results.render_skill_gap_radar")
 def render_skill_gap_radar(
     user_scores: Dict[str, float],
     category_labels: Dict[str, str],
@@ -517,6 +546,7 @@ def render_skill_gap_radar(
     st.plotly_chart(fig, use_container_width=True, config=dict(displayModeBar=True))
 
 
+@timed("results.render_role_probability_radar")
 def render_role_probability_radar(
     role_scores: Dict[str, float],
     role_labels: Dict[str, str],
@@ -569,6 +599,7 @@ def render_role_probability_radar(
     st.plotly_chart(fig, use_container_width=True, config=dict(displayModeBar=True))
 
 
+@timed("results.build_dossier_pdf")
 def build_dossier_pdf(score_state: Any, lang: Optional[str] = None) -> Optional[bytes]:
     """Build Career Dossier as PDF bytes for download. Returns None if fpdf2 not available."""
     try:
@@ -614,6 +645,7 @@ def build_dossier_pdf(score_state: Any, lang: Optional[str] = None) -> Optional[
     return bytes(pdf.output())
 
 
+@timed("results.render_dossier_explorer")
 def render_dossier_explorer(score_state: Any, lang: Optional[str] = None) -> None:
     """Render Explorer results: report engine ONLY after Question 10 (reflex_complete)."""
     import streamlit as st
@@ -622,7 +654,7 @@ def render_dossier_explorer(score_state: Any, lang: Optional[str] = None) -> Non
     lang_key = lang or "en"
     ui = get_ui(lang_key)
     # Telemetry Guard: strictly gate Archetype (The Reveal) behind reflex_complete
-    if not st.session_state.get("reflex_complete", False):
+    if not _reflex_complete():
         st.markdown("#### " + ui.get("explorer_results_title", "Your Cyber Archetype"))
         st.markdown(
             f'<p style="font-family:\'Share Tech Mono\',monospace;color:#39ff14;">'
@@ -665,6 +697,7 @@ def render_dossier_explorer(score_state: Any, lang: Optional[str] = None) -> Non
     render_development_roadmap(score_state, lang)
 
 
+@timed("results.render_dossier_operator")
 def render_dossier_operator(score_state: Any, lang: Optional[str] = None) -> None:
     """Render Operator mission complete: Mission Summary + category radar + top role match."""
     import streamlit as st
@@ -704,6 +737,7 @@ def render_dossier_operator(score_state: Any, lang: Optional[str] = None) -> Non
     st.markdown("---")
 
 
+@timed("results.render_dossier")
 def render_dossier(score_state: Any, lang: Optional[str] = None) -> None:
     """Render Specialist High-Security Dossier: Work Role, NIST 2026, Skill Gap Radar, PDF."""
     import streamlit as st
@@ -795,7 +829,7 @@ def render_dossier(score_state: Any, lang: Optional[str] = None) -> None:
 
     st.markdown("---")
     st.markdown("#### " + ui.get("download_dossier", "Download PDF"))
-    pdf_bytes = build_dossier_pdf(score_state, lang)
+    pdf_bytes = _dossier(score_state, lang_key).pdf
     if pdf_bytes is not None:
         st.download_button(
             label=ui.get("download_pdf", "Download High-Security Dossier (PDF)"),
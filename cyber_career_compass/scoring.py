@@ -7,10 +7,11 @@ Scoring module — rebuilt from Project Ares NIST NICE Guide v1.0.0 and Gemini P
 - Reflex State-Lock Foundation: reflex_complete = False at init; prepared for st.rerun() to reveal Ares nodes.
 """
 
+from array import array
 from dataclasses import dataclass, field
 from typing import Dict, Optional, Any, List, Tuple
 
-from nice_framework import (
+from .nice_framework import (
     CATEGORY_SP,
     CATEGORY_PR,
     CATEGORY_AN,
@@ -28,7 +29,7 @@ from nice_framework import (
 
 # ─── Reflex State-Lock Foundation ───────────────────────────────────────────
 # Hard-code default so Mission Node Map and Recommended Training Deployments
-# only render after Reflex loop completes. main.py sets st.session_state.reflex_complete = False
+# only render after Reflex loop completes. streamlit_app.py sets st.session_state.reflex_complete = False
 # at initialization; st.rerun() after the 10-threat Reflex loop sets reflex_complete = True
 # to instantly reveal the Ares nodes.
 REFLEX_COMPLETE_DEFAULT = False
@@ -66,36 +67,18 @@ def normalize_question_weights(weights: QuestionWeights) -> Dict[str, float]:
 
 
 # ─── NICE-Ares Master Dictionary (Project Ares NIST NICE Guide v1.0.0, Page 47 and full guide) ─
-# Maps NIST Work Role IDs (and app IDs e.g. PR-CDA-001, AN-TWA-001) to Project Ares Battle Room / Mission IDs.
-# Example: PR-CDA-001 → PD-WRL-001 (Defensive Cybersecurity) → BR1, BR8, M4E, ...; AN-TWA-001 → PD-WRL-006 (Threat Analysis) → BR2, BR8, BR5, ...
-NICE_ARES_MASTER: Dict[str, List[str]] = {
-    # App role IDs (PR-CDA-001 style) and NICE PD-WRL / IO-WRL / IN-WRL
-    "PR-CDA-001": ["BR8", "M4E", "M10E", "M5E", "BR11", "BR2"],
-    "PD-WRL-001": ["BR8", "M4E", "M10E", "M5E", "BR11", "BR2"],
-    "PD-WRL-002": ["BR9", "M4E", "M5E", "M10E", "M8E", "BR1001", "BR1003"],
-    "PD-WRL-003": ["M10E", "M4E", "M5E", "M8E", "BR8", "BR2", "BR11", "M1E"],
-    "PD-WRL-004": ["BR6", "BR21", "BR1004", "M8E", "M10E"],
-    "AN-TWA-001": ["BR2", "BR8", "BR5", "M4E", "M5E", "M10E"],
-    "PD-WRL-006": ["BR2", "BR8", "BR5", "M4E", "M5E", "M10E"],
-    "PD-WRL-007": ["BR1", "BR8", "M8E", "M5E", "M10E", "M3E"],
-    "IO-WRL-004": ["BR1004", "BR2", "BR8", "BR6", "M4E", "M8E"],
-    "IO-WRL-005": ["BR1001", "BR1002", "BR1003", "BR1004", "BR6", "BR21", "BR10"],
-    "IO-WRL-006": ["BR11", "BR21", "BR1004", "M8E", "M10E"],
-    "IN-WRL-001": ["BR9", "BR2", "M4E", "M5E", "M10E", "M2E", "M1E"],
-    "IN-WRL-002": ["BR9", "BR1001", "M2E", "M4E", "M5E", "BR1003", "BR1004"],
-    "IN-CLI-001": ["BR9", "BR2", "M4E", "M5E", "M10E", "M2E", "M1E"],
-}
+# NICE_ARES_MASTER: NIST Work Role IDs (and app IDs e.g. PR-CDA-001, AN-TWA-001) → Ares Battle Room / Mission IDs.
+# NIST_CATEGORY_TO_ARES_SCENARIOS: NIST category → scenario IDs of its primary role (Deployment Engine).
+# Both are views of data/ares_catalog.json (ares_catalog.py), served by module __getattr__.
+_CATALOG_VIEWS = frozenset({"NICE_ARES_MASTER", "NIST_CATEGORY_TO_ARES_SCENARIOS"})
 
-# NIST category → Ares scenario IDs for Deployment Engine (2 lowest categories)
-NIST_CATEGORY_TO_ARES_SCENARIOS: Dict[str, List[str]] = {
-    CATEGORY_PR: ["BR8", "M4E", "M10E", "M5E", "BR11", "BR2"],
-    CATEGORY_SP: ["BR1", "BR8", "M8E", "M5E", "M10E", "M3E"],
-    CATEGORY_AN: ["BR2", "BR8", "BR5", "M4E", "M5E", "M10E"],
-    CATEGORY_CO: ["BR1001", "BR1002", "BR1003", "BR1004", "BR6", "BR21", "BR10"],
-    CATEGORY_IN: ["BR9", "BR2", "M4E", "M5E", "M10E", "M2E", "M1E"],
-    CATEGORY_OM: ["BR1004", "BR2", "BR8", "BR6", "M4E", "M8E"],
-    CATEGORY_OV: ["BR8", "M4E", "M10E", "M5E", "BR11", "BR2"],
-}
+
+def __getattr__(name: str) -> Any:
+    if name in _CATALOG_VIEWS:
+        from .ares_catalog import get_catalog
+
+        return get_catalog().legacy_view(name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 # ─── ScoreState: Weighted Attribution Matrix & Always-Live Radar ─────────────
@@ -142,6 +125,26 @@ class ScoreState:
         """Return current raw category scores (aggregated fractional points)."""
         return dict(self.category_scores)
 
+    def snapshot(self) -> array:
+        """Compact copy of the totals for since(): ALL_CATEGORIES scores, then technical correct/total."""
+        values = [self.category_scores.get(c, INITIAL_CATEGORY_BASELINE) for c in ALL_CATEGORIES]
+        return array("d", values + [self.technical_correct, self.technical_total])
+
+    def since(self, snapshot: array) -> "ScoreState":
+        """
+        What was scored after snapshot() as its own ScoreState (categories restart at the baseline pulse),
+        e.g. one assessment out of a session's cumulative score. An empty snapshot means "from the start".
+        """
+        if not snapshot:
+            return ScoreState(dict(self.category_scores), self.technical_correct, self.technical_total)
+        n = len(ALL_CATEGORIES)
+        return ScoreState(
+            {c: INITIAL_CATEGORY_BASELINE + self.category_scores.get(c, INITIAL_CATEGORY_BASELINE) - snapshot[i]
+             for i, c in enumerate(ALL_CATEGORIES)},
+            self.technical_correct - int(snapshot[n]),
+            self.technical_total - int(snapshot[n + 1]),
+        )
+
     def get_dominant_aptitude(self) -> str:
         """Return the dominant NICE category."""
         if not self.category_scores:
@@ -245,7 +248,7 @@ def get_ares_recommendations(
     Title, and Relevance description (from Project Ares NIST NICE Guide v1.0.0 PDF text).
     Relevance is the 'Training Value' text from the guide.
     """
-    from project_ares import ARES_SCENARIOS
+    from .ares_catalog import get_catalog
 
     raw = score_state.get_category_scores()
     if not raw:
@@ -255,21 +258,19 @@ def get_ares_recommendations(
     sorted_cats = sorted(raw.items(), key=lambda x: x[1])
     lowest_two = [sorted_cats[0][0], sorted_cats[1][0]] if len(sorted_cats) >= 2 else [sorted_cats[0][0]]
 
+    catalog = get_catalog()
     result: List[Dict[str, str]] = []
     seen: set = set()
     for cat in lowest_two:
-        scenario_ids = NIST_CATEGORY_TO_ARES_SCENARIOS.get(cat, [])
-        for sid in scenario_ids[:max_per_category]:
+        for sid in catalog.by_category.get(cat, ())[:max_per_category]:
             if sid in seen:
                 continue
             seen.add(sid)
-            info = ARES_SCENARIOS.get(sid)
-            if not info:
-                continue
+            scenario = catalog.scenarios[sid]
             result.append({
                 "mission_id": sid,
-                "title": info.get("title", sid),
-                "relevance": info.get("training_value", ""),
+                "title": scenario.title,
+                "relevance": scenario.training_value,
             })
     return result
 
@@ -282,6 +283,7 @@ XP_EXPLORER_COMPLETE = 50
 XP_SPECIALIST_COMPLETE = 100
 XP_OPERATOR_COMPLETE = 75
 XP_REFLEX_LAB_COMPLETE = 40
+XP_LIVE_FIRE_COMPLETE = 60
 
 AGENT_RANK_THRESHOLDS = [
     (0, "Security Initiate"),
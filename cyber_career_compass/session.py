@@ -0,0 +1,351 @@
+"""
+Session model — one typed, slotted object per Streamlit user instead of ~25 ad-hoc st.session_state keys.
+
+- Question banks are built once per (bank, lang, content version) and shared by every session
+  (get_shared_bank, held in the "banks" memory cache). A session stores only the bank key plus
+  small integer arrays (calibration order, responses) and a reference to the content snapshot
+  it runs on (content_registry.py).
+- SessionModel uses __slots__ and array('b'/'B') so an in-flight assessment stays a few KB.
+- measure_session_footprint() / assert_session_budget(): tracemalloc check of the per-session
+  memory budget (SESSION_MEMORY_BUDGET_BYTES) so a 2,000-student class fits on one node.
+  Run: python -m cyber_career_compass.session
+"""
+
+import functools
+import secrets
+import time
+from array import array
+from typing import Any, Callable, Dict, Optional, Sequence, Tuple
+
+from .cache import TieredCache, get_cache
+from .content_registry import ContentSnapshot, get_content, latest_content, pin, pinned
+from .live_fire_scenario import LiveFireSim
+from .posterior import ArchetypePosterior
+from .reaction_telemetry import LatencyHistogram
+from .scoring import ScoreState, xp_to_rank
+from .validation_sprint import draw_sprint, new_preview_sum
+
+# Per-session budget (bytes) measured with tracemalloc over a fully answered Specialist run
+# plus a finished 30-step Calibration. 2,000 sessions × 4 KB ≈ 8 MB of session state.
+SESSION_MEMORY_BUDGET_BYTES = 4 * 1024
+
+# st.session_state key that holds the SessionModel
+SESSION_KEY = "session"
+
+# ─── Shared question banks: one immutable tuple per (bank name, lang, content version) ─────
+_BANK_LOADERS: Dict[str, Callable[[str], Sequence[Any]]] = {}
+SHARED_BANK_CACHE_SIZE = 64  # a few content versions × banks × languages
+
+
+def register_bank(name: str, loader: Callable[[str], Sequence[Any]]) -> None:
+    """Register a bank loader (lang → questions). Re-registering a name drops its cached copies."""
+    _BANK_LOADERS[name] = loader
+    _bank_cache().clear()
+
+
+def get_shared_bank(name: str, lang: str, version: Optional[str] = None) -> Tuple[Any, ...]:
+    """Return the shared, read-only bank for (name, lang) at a content version (default: active). Sessions never copy these objects."""
+    snapshot = get_content(version)
+    return _bank_cache().get_or_build((name, lang, snapshot.version), lambda: _load_bank(name, lang, snapshot))
+
+
+def _bank_cache() -> TieredCache:
+    return get_cache("banks", max_entries=SHARED_BANK_CACHE_SIZE)  # live objects: memory tier only
+
+
+def _load_bank(name: str, lang: str, snapshot: ContentSnapshot) -> Tuple[Any, ...]:
+    loader = _BANK_LOADERS.get(name)
+    if loader is None:
+        return ()
+    with pinned(snapshot):  # loaders read banks through the content registry
+        return tuple(loader(lang))
+
+
+class SessionModel:
+    """
+    Typed per-user state for the Mission Hub, Proving Ground, and Cyber Archetype pages.
+    Mission questions are resolved from the shared bank (bank_name, bank_lang); responses are
+    stored as choice indices (0 = NEUTRALIZE / first choice, 1 = DROP, 2 = FREEZE).
+    """
+
+    __slots__ = (
+        "session_id",
+        "score",
+        "posterior",
+        "mission_posterior",
+        "nav_page",
+        "lang",
+        "cohort",
+        "xp",
+        "reflex_complete",
+        "css_refreshed",
+        # Mission Hub
+        "mission_tier",
+        "mission_total",
+        "mission_active",
+        "bank_name",
+        "bank_lang",
+        "question_index",
+        "question_shown_ts",
+        "responses",
+        "item_order",
+        "mission_baseline",
+        # Proving Ground: 60s Reflex sprint (clock runs client-side; see sprint_timer.py)
+        "sprint_active",
+        "sprint_id",
+        "sprint_started_ts",
+        "sprint_index",
+        "sprint_correct",
+        "sprint_rejected",
+        "sprint_time_left_s",
+        "reaction_hist",
+        # Proving Ground: 30-step Calibration
+        "validation_active",
+        "validation_lang",
+        "validation_order",
+        "validation_index",
+        "validation_responses",
+        "validation_preview",
+        "validation_baseline",
+        "last_tks_log",
+        "ares_bridge_until",
+        # Proving Ground: Live-Fire: Breach (live_fire_scenario.py)
+        "live_fire",
+        "live_fire_baseline",
+        # Content version this session's assessments run on (content_registry.py)
+        "content",
+    )
+
+    def __init__(self, lang: str = "en") -> None:
+        self.session_id: int = secrets.randbits(63)  # anonymous id for the response log
+        self.score: ScoreState = ScoreState()
+        self.posterior: ArchetypePosterior = ArchetypePosterior()  # confidence next to score's argmax
+        self.mission_posterior: ArchetypePosterior = ArchetypePosterior()  # current mission only (early stop)
+        self.nav_page: str = "mission_hub"
+        self.lang: str = lang
+        self.cohort: str = "default"  # class/cohort id for analytics (?cohort= query param)
+        self.xp: int = 0
+        self.reflex_complete: bool = False
+        self.css_refreshed: bool = False
+        self.mission_tier: Optional[str] = None
+        self.mission_total: int = 0
+        self.mission_active: bool = False
+        self.bank_name: str = "operator"
+        self.bank_lang: str = lang
+        self.question_index: int = 0
+        self.question_shown_ts: float = 0.0
+        self.responses: array = array("b")
+        self.item_order: array = array("B")  # adaptive missions: bank index served at each step
+        self.mission_baseline: array = array("d")  # score.snapshot() at mission start (analytics delta)
+        self.sprint_active: bool = False
+        self.sprint_id: int = 0
+        self.sprint_started_ts: float = 0.0
+        self.sprint_index: int = 0
+        self.sprint_correct: int = 0
+        self.sprint_rejected: int = 0  # log events the server replay refused (score_sprint)
+        self.sprint_time_left_s: float = 0.0
+        self.reaction_hist: LatencyHistogram = LatencyHistogram()  # Reflex reaction times (reaction_telemetry.py)
+        self.validation_active: bool = False
+        self.validation_lang: str = lang
+        self.validation_order: array = array("B")
+        self.validation_index: int = 0
+        self.validation_responses: array = array("b")  # choice per answered step; scored at sprint end
+        self.validation_preview: array = new_preview_sum()  # running weight sum for the live radar
+        self.validation_baseline: array = array("d")  # score.snapshot() at Calibration start
+        self.last_tks_log: Optional[str] = None
+        self.ares_bridge_until: float = 0.0  # Ares Bridge overlay deadline (0 = not shown)
+        self.live_fire: Optional[LiveFireSim] = None  # timeline itself is shared per seed
+        self.live_fire_baseline: array = array("d")  # score.snapshot() at Live-Fire start
+        self.content: ContentSnapshot = latest_content()
+
+    # ─── Derived values (not stored) ───────────────────────────────────────
+    @property
+    def agent_rank(self) -> str:
+        return xp_to_rank(self.xp)
+
+    @property
+    def questions(self) -> Tuple[Any, ...]:
+        """Current mission questions — a reference into the shared bank."""
+        return get_shared_bank(self.bank_name, self.bank_lang, self.content.version)
+
+    @property
+    def validation_questions(self) -> Tuple[Any, ...]:
+        """Calibration questions in this session's order, resolved from the shared pool."""
+        pool = get_shared_bank("calibration", self.validation_lang, self.content.version)
+        return tuple(pool[i] for i in self.validation_order)
+
+    def mission_question(self, index: int) -> Any:
+        """Mission question at step index: bank order, or the adaptive order when one is set."""
+        bank = get_shared_bank(self.bank_name, self.bank_lang, self.content.version)
+        return bank[self.item_order[index]] if self.item_order else bank[index]
+
+    def validation_question(self, index: int) -> Any:
+        """Single Calibration question at position index (no tuple built)."""
+        pool = get_shared_bank("calibration", self.validation_lang, self.content.version)
+        return pool[self.validation_order[index]]
+
+    # ─── Transitions ───────────────────────────────────────────────────────
+    def start_mission(self, tier: str, mission_total: int, bank_name: str) -> None:
+        """Point the session at a shared bank and reset mission progress. Score is kept."""
+        if not self.validation_active:
+            self._adopt_latest_content()
+        self.mission_tier = tier
+        self.bank_name = bank_name
+        self.bank_lang = self.lang
+        self.mission_total = min(mission_total, len(self.questions))
+        self.question_index = 0
+        self.question_shown_ts = time.monotonic()
+        self.responses = array("b")
+        self.item_order = array("B")
+        self.mission_posterior = ArchetypePosterior()
+        self.mission_baseline = self.score.snapshot()
+        self.mission_active = True
+
+    def observe_mission_answer(self, weights: Dict[str, float]) -> None:
+        """One mission answer as posterior evidence: the session-wide posterior and this mission's."""
+        self.posterior.observe(weights)
+        self.mission_posterior.observe(weights)
+
+    def record_response(self, choice_index: int) -> int:
+        """Append the answer and advance. Returns answer latency (ms) since the question was shown."""
+        now = time.monotonic()
+        latency_ms = int((now - self.question_shown_ts) * 1000) if self.question_shown_ts else 0
+        self.responses.append(choice_index if 0 <= choice_index < 128 else -1)
+        self.question_index += 1
+        self.question_shown_ts = now
+        if self.question_index >= self.mission_total:
+            self.reflex_complete = True
+        return latency_ms
+
+    def end_mission_early(self) -> None:
+        """Adaptive stop: the answers so far are the whole mission."""
+        self.mission_total = self.question_index
+        self.reflex_complete = True
+
+    def start_validation(self, order: Sequence[int]) -> None:
+        if not (self.mission_active and self.question_index < self.mission_total):
+            self._adopt_latest_content()
+        self.validation_active = True
+        self.validation_lang = self.lang
+        self.validation_order = array("B", order)
+        self.validation_index = 0
+        self.validation_responses = array("b")
+        self.validation_preview = new_preview_sum()
+        self.validation_baseline = self.score.snapshot()
+        self.question_shown_ts = time.monotonic()
+        self.last_tks_log = None
+        self.ares_bridge_until = 0.0
+
+    def start_live_fire(self, sim: LiveFireSim) -> None:
+        self.live_fire = sim
+        self.live_fire_baseline = self.score.snapshot()
+
+    # Per-assessment scores for analytics: what each assessment added on top of the session's score.
+    def mission_score(self) -> ScoreState:
+        return self.score.since(self.mission_baseline)
+
+    def validation_score(self) -> ScoreState:
+        return self.score.since(self.validation_baseline)
+
+    def live_fire_score(self) -> ScoreState:
+        return self.score.since(self.live_fire_baseline)
+
+    def add_xp(self, delta: int) -> None:
+        self.xp += delta
+
+    def _adopt_latest_content(self) -> None:
+        """Move to the newest content version; called only when no assessment is in flight."""
+        self.content = latest_content()
+        pin(self.content)
+
+
+def get_session(state: Any) -> SessionModel:
+    """
+    Return the SessionModel stored in a st.session_state-like mapping, creating it on first use.
+    Pins the session's content snapshot for the calling context (script run or fragment).
+    """
+    model = state.get(SESSION_KEY) if hasattr(state, "get") else None
+    if model is None:
+        model = SessionModel()
+        state[SESSION_KEY] = model
+    pin(model.content)
+    return model
+
+
+# ─── Memory budget (tracemalloc) ─────────────────────────────────────────────
+SIM_SPECIALIST_ITEMS = 50
+SIM_CALIBRATION_ITEMS = 30
+
+
+def _ensure_compiled_banks() -> None:
+    """Register the compiled specialist/calibration banks unless the app already registered loaders."""
+    from .bank_compiler import get_compiled_questions
+
+    for name in ("specialist", "calibration"):
+        if name not in _BANK_LOADERS:
+            register_bank(name, functools.partial(get_compiled_questions, name))
+
+
+def _simulate_full_session(lang: str) -> SessionModel:
+    """Build a session that has finished a Specialist run (50 answers) and a 30-step Calibration."""
+    _ensure_compiled_banks()
+    model = SessionModel(lang)
+    model.start_mission("specialist", SIM_SPECIALIST_ITEMS, "specialist")
+    for q in model.questions:
+        choices = getattr(q, "choices", None) or ()
+        if choices:
+            model.score.add_weights(choices[0].weights)
+            model.observe_mission_answer(choices[0].weights)
+        model.add_xp(16)
+        model.record_response(0)
+    model.start_validation(draw_sprint(0))
+    model.validation_responses = array("b", bytes(len(model.validation_order)))
+    model.validation_index = len(model.validation_order)
+    model.last_tks_log = "[SYSTEM] TKS METADATA EXTRACTED... CATEGORY: [ANALYZE], [INVESTIGATE] UPDATED."
+    answered = (len(model.responses), len(model.validation_responses))
+    assert answered == (SIM_SPECIALIST_ITEMS, SIM_CALIBRATION_ITEMS), f"simulated session answered {answered} items"
+    return model
+
+
+def measure_session_footprint(n_sessions: int = 200, lang: str = "en") -> float:
+    """
+    Average bytes retained per session, measured with tracemalloc.
+    Shared banks are warmed first so only per-session allocations are counted.
+    """
+    import gc
+    import tracemalloc
+
+    for name in ("specialist", "calibration"):
+        get_shared_bank(name, lang)
+    _simulate_full_session(lang)
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before, _ = tracemalloc.get_traced_memory()
+        sessions = [_simulate_full_session(lang) for _ in range(n_sessions)]
+        gc.collect()
+        after, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del sessions
+    return (after - before) / float(n_sessions)
+
+
+def assert_session_budget(budget_bytes: int = SESSION_MEMORY_BUDGET_BYTES, n_sessions: int = 200) -> float:
+    """Raise AssertionError when the measured per-session footprint exceeds budget_bytes."""
+    per_session = measure_session_footprint(n_sessions)
+    assert per_session <= budget_bytes, (
+        f"Session footprint {per_session:.0f} B exceeds budget {budget_bytes} B"
+    )
+    return per_session
+
+
+if __name__ == "__main__":
+    import sys
+
+    try:
+        used = assert_session_budget()
+    except AssertionError as exc:
+        print(exc)
+        sys.exit(1)
+    print(f"Session footprint: {used:.0f} B (budget {SESSION_MEMORY_BUDGET_BYTES} B)")
@@ -0,0 +1,151 @@
+"""
+Reflex sprint — client-side countdown component plus server-side authoritative scoring.
+
+The browser runs the 60s clock (frontend/sprint_timer/index.html) and sends its answer log
+[{i, action, t_ms}] (relative to its own start) after every answer, then a final report. It only
+receives the threat texts — never the answer key. Each answer triggers a fragment rerun in which
+score_sprint() replays the log and the component gets back the authoritative deadline (60s with
+the +2s / -5s adjustments applied so far), so its countdown matches the server's. The final
+replay runs against the server's start timestamp, so a client cannot claim answers after its real
+deadline, out of order, or faster than wall-clock allows.
+"""
+
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from .reflex_drill import REFLEX_ACTIONS
+
+SPRINT_DURATION_S = 60
+SPRINT_CORRECT_BONUS_S = 2
+SPRINT_WRONG_PENALTY_S = 5
+# Allowance for client/server clock skew and network latency between Engage and the component's start
+SPRINT_CLOCK_TOLERANCE_MS = 1500
+# Answers closer together than this are not humanly possible; such an answer is rejected (threat missed)
+SPRINT_MIN_REACTION_MS = 120
+# Report reasons that end the sprint; "answer" reports are progress updates
+SPRINT_FINAL_REASONS = frozenset({"complete", "timeout"})
+
+_FRONTEND_DIR = Path(__file__).resolve().parent / "frontend" / "sprint_timer"
+_component_func = None
+
+
+def sprint_max_duration_s(n_threats: int) -> float:
+    """Longest a sprint can legitimately run: every answer correct, each adding the bonus."""
+    return SPRINT_DURATION_S + SPRINT_CORRECT_BONUS_S * n_threats
+
+
+def sprint_timer_key(sprint_id: int) -> str:
+    """Widget key of a sprint's component; st.session_state[key] holds its latest report."""
+    return f"pg_sprint_timer_{sprint_id}"
+
+
+def is_final_report(report: Optional[Dict[str, Any]], sprint_id: int) -> bool:
+    return bool(report) and report.get("sprint_id") == sprint_id and report.get("reason") in SPRINT_FINAL_REASONS
+
+
+def _component() -> Any:
+    global _component_func
+    if _component_func is None:
+        import streamlit.components.v1 as components
+
+        _component_func = components.declare_component("sprint_timer", path=str(_FRONTEND_DIR))
+    return _component_func
+
+
+def render_sprint_timer(
+    sprint_id: int,
+    threats: Sequence[Tuple[str, str, str]],
+    labels: Optional[Dict[str, str]] = None,
+    live: Optional["SprintResult"] = None,
+    key: Optional[str] = None,
+) -> Optional[Dict[str, Any]]:
+    """
+    Render the sprint component. live is the server's replay of the latest report: its deadline and
+    replayed count go back to the browser clock. Returns the latest report {sprint_id, reason,
+    events, ended_ms} (reason "answer" while running), or None before the first answer.
+    """
+    live = live or SprintResult()
+    return _component()(
+        sprint_id=sprint_id,
+        threats=[text for text, _, _ in threats],  # texts only: grading stays on the server
+        actions=list(REFLEX_ACTIONS),
+        labels=labels or {},
+        max_duration_s=sprint_max_duration_s(len(threats)),
+        deadline_ms=live.deadline_ms,
+        acked=live.replayed,
+        key=key or sprint_timer_key(sprint_id),
+        default=None,
+    )
+
+
+@dataclass
+class SprintResult:
+    """
+    Authoritative outcome of one sprint. accepted holds (threat index, action) in answer order;
+    reaction_ms the matching reaction times (client performance.now() deltas from threat shown to answer).
+    deadline_ms is the sprint deadline after the adjustments; replayed the number of log events read.
+    """
+
+    accepted: List[Tuple[int, str]] = field(default_factory=list)
+    reaction_ms: List[int] = field(default_factory=list)
+    correct: int = 0
+    rejected: int = 0
+    time_left_s: float = float(SPRINT_DURATION_S)
+    deadline_ms: float = SPRINT_DURATION_S * 1000.0
+    replayed: int = 0
+
+    @property
+    def answered(self) -> int:
+        return len(self.accepted)
+
+
+def score_sprint(
+    report: Optional[Dict[str, Any]],
+    threats: Sequence[Tuple[str, str, str]],
+    started_ts: float,
+    now: Optional[float] = None,
+) -> SprintResult:
+    """
+    Replay the client's answer log under server rules. Event n must answer threat n (the one the
+    client showed), with a known action, at least SPRINT_MIN_REACTION_MS after the previous answer,
+    before the deadline (60s ± adjustments replayed here), and no later than server elapsed time +
+    tolerance. An invalid event is rejected on its own (its threat counts as missed, no adjustment);
+    the events after it are still replayed.
+    """
+    result = SprintResult()
+    events = (report or {}).get("events") or []
+    now = time.time() if now is None else now
+    server_elapsed_ms = (now - started_ts) * 1000.0 + SPRINT_CLOCK_TOLERANCE_MS
+    deadline_ms = SPRINT_DURATION_S * 1000.0
+    last_t = 0.0  # when the current threat was shown (the previous answer; the first at t=0)
+    last_accepted_t = 0.0
+    for n, event in enumerate(events):
+        try:
+            i = int(event["i"])
+            action = str(event["action"])
+            t_ms = float(event["t_ms"])
+        except (KeyError, TypeError, ValueError):
+            result.rejected += 1
+            continue
+        if i != n or i >= len(threats) or not last_t <= t_ms < deadline_ms or t_ms > server_elapsed_ms:
+            result.rejected += 1
+            continue
+        reaction = t_ms - last_t
+        last_t = t_ms  # the client moved on to the next threat either way
+        if reaction < SPRINT_MIN_REACTION_MS or action not in REFLEX_ACTIONS:
+            result.rejected += 1
+            continue
+        result.accepted.append((i, action))
+        result.reaction_ms.append(int(round(reaction)))
+        last_accepted_t = t_ms
+        if action == threats[i][1]:
+            result.correct += 1
+            deadline_ms += SPRINT_CORRECT_BONUS_S * 1000.0
+        else:
+            deadline_ms -= SPRINT_WRONG_PENALTY_S * 1000.0
+    result.replayed = len(events)
+    result.deadline_ms = deadline_ms
+    result.time_left_s = max(0.0, deadline_ms - last_accepted_t) / 1000.0
+    return result
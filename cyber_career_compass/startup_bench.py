@@ -0,0 +1,206 @@
+"""
+Startup benchmark — wall time and per-module import cost of every entry point, against a stored baseline.
+
+Each entry point runs as its own process from a cold interpreter (bytecode cached, repo root on
+PYTHONPATH); Streamlit scripts run one pass in bare mode, which covers their imports and first
+render. Wall time is the median of `runs` launches; each module's self / cumulative import time
+is the median over `runs` more launches under `-X importtime`.
+
+The baseline (data/startup_baseline.json) keeps cumulative times for top-level packages and this
+package's modules (tracked()), plus the entry's external import time: self time of every module
+outside this package (stdlib, Streamlit, plotly, ...), which this repo does not change. The ratio
+of current to baseline external time is the machine speed factor; baseline times are scaled by it
+before comparing, so a slower or busier machine does not read as a regression. A run flags:
+- modules that now load and did not before, costing ≥ EAGER_MIN_MS cumulative (something started
+  importing eagerly),
+- modules whose cumulative time grew by more than MODULE_GROWTH_RATIO and MODULE_GROWTH_MIN_MS
+  over the scaled baseline (the floor absorbs import-order and scheduling jitter on small modules),
+- wall time above WALL_GROWTH_RATIO × scaled baseline + WALL_SLACK_MS, and entry points that now fail.
+Update the baseline only in commits meant to change startup cost (--entry limits it to some entries).
+Run: python -m cyber_career_compass.startup_bench [--entry NAME] [--runs N] [--update-baseline] [--top N]
+(exit 1 on a regression).
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from .import_budget import REPO_ROOT, parse_importtime
+
+BASELINE_PATH = Path(__file__).resolve().parent / "data" / "startup_baseline.json"
+
+# name → argv after the interpreter (cwd = repo root)
+ENTRY_POINTS: Dict[str, Tuple[str, ...]] = {
+    "streamlit_app": ("main.py",),
+    "legacy_app": ("Cyber Career Builder/main.py",),
+    "demo": ("main.py", "--demo"),
+    "terminal_game": ("Cyber Career Builder/game.py",),
+}
+
+ENTRY_TIMEOUT_S = 120.0
+EAGER_MIN_MS = 5.0
+MODULE_GROWTH_RATIO = 1.5
+MODULE_GROWTH_MIN_MS = 25.0
+WALL_GROWTH_RATIO = 1.25
+WALL_SLACK_MS = 100.0
+SPEED_FACTOR_BOUNDS = (0.5, 3.0)  # machine speed factor is clamped to this range
+
+
+@dataclass
+class EntryProfile:
+    name: str
+    ok: bool
+    wall_ms: float  # median over runs
+    error: str = ""
+    modules: Dict[str, Tuple[int, int]] = field(default_factory=dict)  # module → (self us, cumulative us)
+    external_us: int = 0  # summed self time of modules outside this package (machine speed reference)
+
+
+def tracked(module: str) -> bool:
+    """Modules kept in the baseline: top-level packages and cyber_career_compass.*."""
+    return "." not in module or module.startswith("cyber_career_compass.")
+
+
+def external_us(modules: Dict[str, Tuple[int, int]]) -> int:
+    """Self time of every module outside this package (stdlib and third-party)."""
+    return sum(self_us for m, (self_us, _) in modules.items() if m != "cyber_career_compass" and not m.startswith("cyber_career_compass."))
+
+
+def _launch(argv: Sequence[str], importtime: bool) -> Tuple[float, subprocess.CompletedProcess]:
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(filter(None, [str(REPO_ROOT), os.environ.get("PYTHONPATH", "")])))
+    env.pop("CCC_RESPONSE_LOG_DIR", None)  # no side effects from benchmark runs
+    cmd = [sys.executable] + (["-X", "importtime"] if importtime else []) + list(argv)
+    t0 = time.perf_counter()
+    proc = subprocess.run(cmd, cwd=REPO_ROOT, env=env, capture_output=True, text=True, timeout=ENTRY_TIMEOUT_S)
+    return (time.perf_counter() - t0) * 1000.0, proc
+
+
+def _error_line(stderr: str) -> str:
+    lines = [line for line in stderr.splitlines() if line.strip() and not line.startswith("import time:")]
+    return lines[-1].strip() if lines else "non-zero exit"
+
+
+def profile_entry(name: str, runs: int = 3) -> EntryProfile:
+    argv = ENTRY_POINTS[name]
+    _launch(argv, importtime=False)  # warm the bytecode cache
+    walls = []
+    for _ in range(runs):
+        wall, proc = _launch(argv, importtime=False)
+        if proc.returncode != 0:
+            return EntryProfile(name, False, wall, _error_line(proc.stderr))
+        walls.append(wall)
+    samples = [parse_importtime(_launch(argv, importtime=True)[1].stderr) for _ in range(runs)]
+    modules = {
+        m: (int(statistics.median(s[m][0] for s in samples if m in s)), int(statistics.median(s[m][1] for s in samples if m in s)))
+        for m in samples[0]
+    }
+    return EntryProfile(name, True, statistics.median(walls), modules=modules, external_us=external_us(modules))
+
+
+# ─── Baseline ────────────────────────────────────────────────────────────────
+def load_baseline(path: Path = BASELINE_PATH) -> Dict[str, EntryProfile]:
+    try:
+        raw = json.loads(path.read_text())
+    except (OSError, ValueError):
+        return {}
+    return {
+        name: EntryProfile(
+            name, e["ok"], e["wall_ms"], e.get("error", ""), {m: (0, cum) for m, cum in e.get("modules", {}).items()}, e.get("external_us", 0)
+        )
+        for name, e in raw.get("entries", {}).items()
+    }
+
+
+def write_baseline(profiles: Sequence[EntryProfile], path: Path = BASELINE_PATH) -> None:
+    entries = load_baseline(path)
+    entries.update({p.name: p for p in profiles})
+    payload = {
+        "python": sys.version.split()[0],
+        "entries": {
+            name: {
+                "ok": p.ok,
+                "wall_ms": round(p.wall_ms, 1),
+                "error": p.error,
+                "external_us": p.external_us,
+                "modules": {m: cum for m, (_, cum) in p.modules.items() if tracked(m)},  # cumulative us
+            }
+            for name, p in sorted(entries.items())
+        },
+    }
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(".tmp")
+    tmp.write_text(json.dumps(payload, indent=1, sort_keys=True) + "\n")
+    tmp.replace(path)
+
+
+def speed_factor(current: EntryProfile, baseline: EntryProfile) -> float:
+    """Current / baseline external import time, clamped to SPEED_FACTOR_BOUNDS (1.0 without a reference)."""
+    if not (current.external_us and baseline.external_us):
+        return 1.0
+    lo, hi = SPEED_FACTOR_BOUNDS
+    return min(hi, max(lo, current.external_us / baseline.external_us))
+
+
+def compare(current: EntryProfile, baseline: Optional[EntryProfile]) -> List[str]:
+    """Regressions of current against baseline scaled by speed_factor (empty when none, or when there is no baseline)."""
+    if baseline is None:
+        return []
+    if not current.ok:
+        return [] if not baseline.ok else [f"now fails: {current.error}"]
+    if not baseline.ok:
+        return []
+    problems: List[str] = []
+    factor = speed_factor(current, baseline)
+    if current.wall_ms > baseline.wall_ms * factor * WALL_GROWTH_RATIO + WALL_SLACK_MS:
+        problems.append(f"wall {current.wall_ms:.0f} ms (baseline {baseline.wall_ms:.0f} ms × speed {factor:.2f})")
+    for module, (_, cum) in sorted(current.modules.items(), key=lambda kv: -kv[1][1]):
+        if not tracked(module):
+            continue
+        before = baseline.modules.get(module)
+        if before is None:
+            if cum >= EAGER_MIN_MS * 1000:
+                problems.append(f"newly loaded: {module} ({cum / 1000:.1f} ms)")
+        else:
+            scaled = before[1] * factor
+            if cum > scaled * MODULE_GROWTH_RATIO and cum - scaled > MODULE_GROWTH_MIN_MS * 1000:
+                problems.append(f"slower: {module} {before[1] / 1000:.1f} → {cum / 1000:.1f} ms (speed {factor:.2f})")
+    return problems
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Startup wall time and import cost per entry point")
+    parser.add_argument("--entry", action="append", choices=sorted(ENTRY_POINTS), help="entry point(s) to run (default: all)")
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument("--top", type=int, default=8, help="slowest modules (self time) to list per entry point")
+    parser.add_argument("--update-baseline", action="store_true", help=f"store this run as the baseline ({BASELINE_PATH.name})")
+    args = parser.parse_args(argv)
+
+    baseline = load_baseline()
+    profiles = [profile_entry(name, args.runs) for name in (args.entry or ENTRY_POINTS)]
+    regressed = False
+    for p in profiles:
+        base = baseline.get(p.name)
+        speed = f"  speed ×{speed_factor(p, base):.2f}" if p.ok and base is not None and base.ok else ""
+        status = f"{p.wall_ms:7.0f} ms  {len(p.modules):4d} modules{speed}" if p.ok else f"FAILED: {p.error}"
+        print(f"{p.name:<14} {status}")
+        for module, (self_us, cum_us) in sorted(p.modules.items(), key=lambda kv: -kv[1][0])[: args.top]:
+            print(f"    {self_us / 1000:7.1f} ms self {cum_us / 1000:8.1f} ms cumulative  {module}")
+        problems = compare(p, baseline.get(p.name))
+        for problem in problems:
+            print(f"  REGRESSION {problem}")
+        regressed |= bool(problems)
+    if args.update_baseline:
+        write_baseline(profiles)
+        print(f"Baseline written: {BASELINE_PATH}")
+    return 1 if regressed and not args.update_baseline else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,56 @@
+"""
+Non-blocking timers and transitions. Delays are resolved by timed fragment reruns driven from the
+browser (st.fragment(run_every=...)), so no script thread sleeps while an overlay or lockout is shown.
+Callers keep the deadline (epoch seconds) in their own state, e.g. SessionModel.ares_bridge_until.
+"""
+
+import time
+from typing import Callable, Optional
+
+# Fragment poll interval (s). The browser triggers these reruns; the server only compares a timestamp.
+GATE_POLL_S = 0.5
+
+# Ares Bridge overlay hold before redirecting to Cyber Archetype
+ARES_BRIDGE_DELAY_S = 2.2
+
+
+def deadline_in(delay_s: float) -> float:
+    """Epoch deadline delay_s from now."""
+    return time.time() + max(0.0, delay_s)
+
+
+def remaining(until_ts: float, now: Optional[float] = None) -> float:
+    """Seconds left until until_ts (0.0 when expired or unset)."""
+    if not until_ts:
+        return 0.0
+    return max(0.0, until_ts - (time.time() if now is None else now))
+
+
+def render_timed_gate(
+    until_ts: float,
+    on_expire: Callable[[], None],
+    render: Optional[Callable[[float], None]] = None,
+    poll_s: float = GATE_POLL_S,
+) -> None:
+    """
+    Hold until until_ts without blocking the script thread. Call on every rerun while pending.
+    render(seconds_left), if given, is redrawn inside the fragment on each poll (live countdowns).
+    When the deadline passes, on_expire() runs (it must clear the caller's deadline) and the full app reruns.
+    """
+    import streamlit as st
+
+    if remaining(until_ts) <= 0.0:
+        on_expire()
+        st.rerun()
+        return
+
+    @st.fragment(run_every=poll_s)
+    def _timed_gate() -> None:
+        left = remaining(until_ts)
+        if left <= 0.0:
+            on_expire()
+            st.rerun(scope="app")
+        if render is not None:
+            render(left)
+
+    _timed_gate()
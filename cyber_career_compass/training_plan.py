@@ -0,0 +1,183 @@
+"""
+Ares training plan optimizer — the smallest set of Battle Rooms / Missions that closes every gap.
+
+Each Ares scenario gets a bitset of the gaps it trains: NICE categories and NICE work roles
+(catalog.by_category / by_role from ares_catalog). The index is built once per catalog snapshot,
+so an edited data/ares_catalog.json is picked up on the next plan. A plan is a weighted set cover of the user's gap bits: greedy by
+(gap weight covered / scenario cost) with bitset ops, then exact branch-and-bound when the
+instance is small (EXACT_MAX_GAPS), bounded by the greedy cost.
+Benchmark: python -m cyber_career_compass.training_plan
+"""
+
+import time
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from .ares_catalog import AresCatalog, get_catalog
+from .nice_framework import ALL_CATEGORIES
+
+# Relative cost of a deployment: Missions are longer, multi-role exercises than Battle Rooms
+SCENARIO_COST: Dict[str, float] = {"BR": 1.0, "M": 1.5}
+EXACT_MAX_GAPS = 14  # gap bits above this: greedy only
+
+
+@dataclass(frozen=True)
+class CoverageIndex:
+    scenario_ids: Tuple[str, ...]
+    masks: Tuple[int, ...]  # masks[s]: gap bits scenario s trains
+    costs: Tuple[float, ...]
+    gap_bits: Dict[str, int]  # category code or NICE role id → bit
+
+
+def get_coverage_index(catalog: Optional[AresCatalog] = None) -> CoverageIndex:
+    return _coverage_index(catalog or get_catalog())
+
+
+@lru_cache(maxsize=2)  # current and previous snapshot (sessions mid-reload)
+def _coverage_index(catalog: AresCatalog) -> CoverageIndex:
+    roles = {r: catalog.by_role[r] for r in catalog.role_names}
+    gaps = list(ALL_CATEGORIES) + list(roles)
+    gap_bits = {g: i for i, g in enumerate(gaps)}
+    covers: Dict[str, int] = {sid: 0 for sid in catalog.scenarios}
+    for mapping in (catalog.by_category, roles):
+        for gap, sids in mapping.items():
+            if gap not in gap_bits:
+                continue
+            for sid in sids:
+                covers[sid] |= 1 << gap_bits[gap]
+    sids = tuple(sid for sid, mask in covers.items() if mask)
+    return CoverageIndex(
+        scenario_ids=sids,
+        masks=tuple(covers[s] for s in sids),
+        costs=tuple(SCENARIO_COST[catalog.scenarios[s].type] for s in sids),
+        gap_bits=gap_bits,
+    )
+
+
+@dataclass(frozen=True)
+class TrainingPlan:
+    scenario_ids: List[str]  # most gap weight first
+    covers: Dict[str, List[str]]  # scenario → gaps it closes in this plan
+    cost: float
+    uncovered: List[str]  # gaps no scenario trains, or left open by max_items
+    exact: bool
+
+
+def _weight(mask: int, bit_weights: Sequence[float]) -> float:
+    total = 0.0
+    while mask:
+        low = mask & -mask
+        total += bit_weights[low.bit_length() - 1]
+        mask ^= low
+    return total
+
+
+def _greedy(target: int, cands: Sequence[int], index: CoverageIndex, bit_weights: Sequence[float]) -> List[int]:
+    chosen: List[int] = []
+    covered = 0
+    while target & ~covered:
+        best, best_ratio = -1, 0.0
+        for s in cands:
+            gain = index.masks[s] & target & ~covered
+            if gain:
+                ratio = _weight(gain, bit_weights) / index.costs[s]
+                if ratio > best_ratio:
+                    best, best_ratio = s, ratio
+        if best < 0:
+            break
+        chosen.append(best)
+        covered |= index.masks[best]
+    return chosen
+
+
+def _exact(target: int, cands: Sequence[int], index: CoverageIndex, incumbent: List[int]) -> List[int]:
+    """Minimum-cost cover by branching on the uncovered gap with the fewest covering scenarios."""
+    covering: Dict[int, List[int]] = {}
+    bits = target
+    while bits:
+        low = bits & -bits
+        covering[low] = [s for s in cands if index.masks[s] & low]
+        bits ^= low
+    min_cost = min(index.costs[s] for s in cands)
+    best_cost = sum(index.costs[s] for s in incumbent)
+    best: List[int] = list(incumbent)
+    chosen: List[int] = []
+
+    def search(covered: int, cost: float) -> None:
+        nonlocal best, best_cost
+        rest = target & ~covered
+        if not rest:
+            if cost < best_cost - 1e-9:
+                best, best_cost = list(chosen), cost
+            return
+        if cost + min_cost >= best_cost - 1e-9:
+            return
+        pivot = min((b for b in covering if rest & b), key=lambda b: len(covering[b]))
+        for s in covering[pivot]:
+            chosen.append(s)
+            search(covered | index.masks[s], cost + index.costs[s])
+            chosen.pop()
+
+    search(0, 0.0)
+    return best
+
+
+def plan_deployments(
+    gaps: Sequence[str],
+    gap_weights: Optional[Dict[str, float]] = None,
+    max_items: Optional[int] = None,
+) -> TrainingPlan:
+    """
+    Smallest-cost scenario set training every gap (category codes and/or NICE role ids).
+    gap_weights (default 1.0 each) steer the greedy order and which gaps stay open under max_items.
+    """
+    index = get_coverage_index()
+    bit_weights = [0.0] * len(index.gap_bits)
+    target = 0
+    unknown: List[str] = []
+    for g in gaps:
+        bit = index.gap_bits.get(g)
+        if bit is None:
+            unknown.append(g)
+            continue
+        target |= 1 << bit
+        bit_weights[bit] = max(1e-6, (gap_weights or {}).get(g, 1.0))
+    cands = [s for s, m in enumerate(index.masks) if m & target]
+    chosen = _greedy(target, cands, index, bit_weights)
+    exact = bin(target).count("1") <= EXACT_MAX_GAPS
+    if exact and len(chosen) > 1:
+        chosen = _exact(target, cands, index, chosen)
+    chosen.sort(key=lambda s: -_weight(index.masks[s] & target, bit_weights))
+    if max_items is not None:
+        chosen = chosen[:max_items]
+    names = {bit: g for g, bit in index.gap_bits.items()}
+    covered = 0
+    covers: Dict[str, List[str]] = {}
+    for s in chosen:
+        gain = index.masks[s] & target & ~covered
+        covers[index.scenario_ids[s]] = [names[b] for b in range(len(names)) if gain >> b & 1]
+        covered |= gain
+    open_gaps = [names[b] for b in range(len(names)) if (target & ~covered) >> b & 1]
+    return TrainingPlan(
+        scenario_ids=[index.scenario_ids[s] for s in chosen],
+        covers=covers,
+        cost=sum(index.costs[s] for s in chosen),
+        uncovered=open_gaps + unknown,
+        exact=exact,
+    )
+
+
+if __name__ == "__main__":
+    import random
+
+    index = get_coverage_index()
+    every_gap = list(index.gap_bits)
+    rng = random.Random(0)
+    cases = [rng.sample(every_gap, rng.randint(1, len(every_gap))) for _ in range(2000)]
+    plan_deployments(every_gap)
+    t0 = time.perf_counter()
+    plans = [plan_deployments(c, {g: rng.random() for g in c}) for c in cases]
+    elapsed = (time.perf_counter() - t0) / len(cases)
+    print(f"{len(index.scenario_ids)} scenarios × {len(every_gap)} gaps: {elapsed * 1e6:.0f} us per plan")
+    print(f"mean plan size {sum(len(p.scenario_ids) for p in plans) / len(plans):.2f}; all gaps: {plan_deployments(every_gap).scenario_ids}")
@@ -3,6 +3,7 @@ Full multi-language support: English, 日本語 (Japanese), 繁體中文 (Tradit
 All UI strings and question/choice texts keyed by language for instant reload on toggle.
 """
 
+import sys
 from typing import Dict, List, Any, Optional
 
 # Language codes and sidebar display names
@@ -1441,47 +1442,63 @@ LANG_MAP: Dict[str, Dict[str, Any]] = {
 }
 
 
+def _lang_map() -> Dict[str, Dict[str, Any]]:
+    """
+    LANG_MAP of the active content snapshot once content is loaded (content_registry.py), so UI
+    strings and labels hot-reload with the banks; before that (terminal game, tools) this module's.
+    """
+    registry = sys.modules.get(f"{__package__}.content_registry")  # not imported → no snapshot yet
+    texts = registry.loaded_texts() if registry is not None else None
+    return texts.lang_map if texts is not None else LANG_MAP
+
+
 def get_ui(lang: str) -> Dict[str, str]:
     """Return UI strings for the given language. Falls back to English if unknown."""
-    if lang not in LANG_MAP:
+    lang_map = _lang_map()
+    if lang not in lang_map:
         lang = "en"
-    return LANG_MAP[lang]["ui"]
+    return lang_map[lang]["ui"]
 
 
 def get_category_labels(lang: str) -> Dict[str, str]:
     """Radar chart axis labels (e.g. 'Analyze' → '分析'). From LANG_MAP."""
-    if lang not in LANG_MAP:
+    lang_map = _lang_map()
+    if lang not in lang_map:
         lang = "en"
-    return dict(LANG_MAP[lang]["categories"])
+    return dict(lang_map[lang]["categories"])
 
 
 def get_role_display(lang: str, role_id: str) -> Optional[Dict[str, str]]:
     """Translated work role: title, definition, strengths, category. From LANG_MAP."""
-    if lang not in LANG_MAP:
+    lang_map = _lang_map()
+    if lang not in lang_map:
         lang = "en"
-    return LANG_MAP[lang]["roles"].get(role_id)
+    return lang_map[lang]["roles"].get(role_id)
 
 
 def get_learning_objectives(lang: str) -> Dict[str, List[str]]:
     """Learning objectives per NICE category for Suggested Improvements / Gap Analysis. From LANG_MAP."""
-    if lang not in LANG_MAP:
+    lang_map = _lang_map()
+    if lang not in lang_map:
         lang = "en"
-    return dict(LANG_MAP[lang].get("learning_objectives", _learning_objectives_en()))
+    return dict(lang_map[lang].get("learning_objectives", _learning_objectives_en()))
 
 
 def get_ares_learning_path(lang: str, path_key: str) -> str:
     """Localized Project Ares learning path name. path_key e.g. 'computer_networking', 'advanced_networking'."""
-    if lang not in LANG_MAP:
+    lang_map = _lang_map()
+    if lang not in lang_map:
         lang = "en"
-    ares = LANG_MAP[lang].get("ares", {})
+    ares = lang_map[lang].get("ares", {})
     paths = ares.get("learning_paths", _ares_learning_paths_en())
     return paths.get(path_key, path_key.replace("_", " ").title())
 
 
 def get_ares_scenario_title(lang: str, scenario_id: str) -> str:
     """Localized Project Ares Battle Room / Mission title. scenario_id e.g. 'BR8', 'M10E'."""
-    if lang not in LANG_MAP:
+    lang_map = _lang_map()
+    if lang not in lang_map:
         lang = "en"
-    ares = LANG_MAP[lang].get("ares", {})
+    ares = lang_map[lang].get("ares", {})
     titles = ares.get("scenario_titles", _ares_scenario_titles_en())
     return titles.get(scenario_id, scenario_id)
@@ -13,7 +13,8 @@ from typing import Dict, List
 from rich.console import Console
 from rich.text import Text
 
-from cyber_career_compass.nice_framework import (
+from .cache import get_cache
+from .nice_framework import (
     CATEGORY_AN,
     CATEGORY_CO,
     CATEGORY_IN,
@@ -63,11 +64,13 @@ TARGET_READINESS_VALUES = [75, 78, 65, 70, 55, 50, 70, 75]
 # Exact colors from reference (clone identically)
 RADAR_CYAN = "#61D9EE"   # light blue-green/cyan: grid, axis labels, "You" series
 RADAR_GREEN = "#7CEB8D"  # vibrant lime green: "Target Readiness (Project A)" dashed line
+ARES_RADAR_CACHE_SIZE = 256  # figures keyed by the 8 plotted values; shared read-only across sessions
 
 
 def build_ares_radar_figure(category_scores: Dict[str, float]):
     """
     Radar clone: 8 axes, dark background. #61D9EE light blue-green (grid + "You"), #7CEB8D lime green ("Target Readiness" dashed). Scale 0–100 in white.
+    Figures come from the "ares_radar" memory cache: do not mutate the returned figure.
     """
     try:
         import plotly.graph_objects as go
@@ -82,70 +85,73 @@ def build_ares_radar_figure(category_scores: Dict[str, float]):
     m = max(you_values) if you_values else 0.0
     if m < 1.0 and m >= 0:
         you_values = [max(10.0, v * 100.0) if v > 0 else 10.0 for v in you_values]
-    you_loop = you_values + [you_values[0]]
-    target_loop = TARGET_READINESS_VALUES + [TARGET_READINESS_VALUES[0]]
-    labels_loop = RADAR_8_LABELS + [RADAR_8_LABELS[0]]
-
-    fig = go.Figure(
-        data=[
-            go.Scatterpolar(
-                r=you_loop,
-                theta=labels_loop,
-                fill="toself",
-                name="You",
-                line=dict(color=RADAR_CYAN, width=2),
-                fillcolor="rgba(97, 217, 238, 0.12)",
-                marker=dict(size=7, color=RADAR_CYAN, symbol="circle", line=dict(width=0)),
-            ),
-            go.Scatterpolar(
-                r=target_loop,
-                theta=labels_loop,
-                fill="toself",
-                name="Target Readiness (Project A)",
-                line=dict(color=RADAR_GREEN, width=2.5, dash="dash"),
-                fillcolor="rgba(124, 235, 141, 0.06)",
-                marker=dict(size=7, color=RADAR_GREEN, symbol="circle", line=dict(width=0)),
-            ),
-        ]
-    )
+    def build():
+        you_loop = you_values + [you_values[0]]
+        target_loop = TARGET_READINESS_VALUES + [TARGET_READINESS_VALUES[0]]
+        labels_loop = RADAR_8_LABELS + [RADAR_8_LABELS[0]]
+
+        fig = go.Figure(
+            data=[
+                go.Scatterpolar(
+                    r=you_loop,
+                    theta=labels_loop,
+                    fill="toself",
+                    name="You",
+                    line=dict(color=RADAR_CYAN, width=2),
+                    fillcolor="rgba(97, 217, 238, 0.12)",
+                    marker=dict(size=7, color=RADAR_CYAN, symbol="circle", line=dict(width=0)),
+                ),
+                go.Scatterpolar(
+                    r=target_loop,
+                    theta=labels_loop,
+                    fill="toself",
+                    name="Target Readiness (Project A)",
+                    line=dict(color=RADAR_GREEN, width=2.5, dash="dash"),
+                    fillcolor="rgba(124, 235, 141, 0.06)",
+                    marker=dict(size=7, color=RADAR_GREEN, symbol="circle", line=dict(width=0)),
+                ),
+            ]
+        )
 
-    fig.update_layout(
-        polar=dict(
-            bgcolor="#1a1a1a",
-            radialaxis=dict(
-                visible=True,
-                range=[0, 100],
-                tickvals=[0, 20, 40, 60, 80, 100],
-                tickfont=dict(color="#ffffff", size=11, family="'Share Tech Mono', 'JetBrains Mono', monospace"),
-                gridcolor=RADAR_CYAN,
-                linecolor=RADAR_CYAN,
-                showgrid=True,
-                dtick=20,
+        fig.update_layout(
+            polar=dict(
+                bgcolor="#1a1a1a",
+                radialaxis=dict(
+                    visible=True,
+                    range=[0, 100],
+                    tickvals=[0, 20, 40, 60, 80, 100],
+                    tickfont=dict(color="#ffffff", size=11, family="'Share Tech Mono', 'JetBrains Mono', monospace"),
+                    gridcolor=RADAR_CYAN,
+                    linecolor=RADAR_CYAN,
+                    showgrid=True,
+                    dtick=20,
+                ),
+                angularaxis=dict(
+                    tickfont=dict(color=RADAR_CYAN, size=10, family="'Share Tech Mono', 'JetBrains Mono', monospace"),
+                    gridcolor=RADAR_CYAN,
+                    linecolor=RADAR_CYAN,
+                    showgrid=True,
+                ),
             ),
-            angularaxis=dict(
-                tickfont=dict(color=RADAR_CYAN, size=10, family="'Share Tech Mono', 'JetBrains Mono', monospace"),
-                gridcolor=RADAR_CYAN,
-                linecolor=RADAR_CYAN,
-                showgrid=True,
+            paper_bgcolor="#1a1a1a",
+            plot_bgcolor="#1a1a1a",
+            showlegend=True,
+            legend=dict(
+                x=0.02,
+                y=0.98,
+                xanchor="left",
+                yanchor="top",
+                font=dict(family="'Share Tech Mono', monospace", color=RADAR_CYAN, size=10),
+                bgcolor="rgba(0,0,0,0)",
+                bordercolor="rgba(0,0,0,0)",
             ),
-        ),
-        paper_bgcolor="#1a1a1a",
-        plot_bgcolor="#1a1a1a",
-        showlegend=True,
-        legend=dict(
-            x=0.02,
-            y=0.98,
-            xanchor="left",
-            yanchor="top",
-            font=dict(family="'Share Tech Mono', monospace", color=RADAR_CYAN, size=10),
-            bgcolor="rgba(0,0,0,0)",
-            bordercolor="rgba(0,0,0,0)",
-        ),
-        margin=dict(t=40, b=40, l=40, r=40),
-        height=420,
-        font=dict(family="'Share Tech Mono', monospace", color="#ffffff"),
-    )
-    return fig
+            margin=dict(t=40, b=40, l=40, r=40),
+            height=420,
+            font=dict(family="'Share Tech Mono', monospace", color="#ffffff"),
+        )
+        return fig
+
+    return get_cache("ares_radar", max_entries=ARES_RADAR_CACHE_SIZE).get_or_build(tuple(you_values), build)
 
 
 def render_ares_radar_streamlit(category_scores: Dict[str, float]) -> None:
@@ -0,0 +1,102 @@
+"""
+Validation Sprint — the Proving Ground's 30-step Calibration (Validation: NICE) as an engine.
+
+Item pools are preassembled per language by bank_compiler (bank "calibration": 10 Explorer
+Instinct, 25 TKS Validation, 10 Core Technical) and shared read-only. A session's sprint is an
+array('B') of pool indices drawn from a seeded permutation; questions are looked up by index,
+never copied. Answers are stored as choice indices, and the whole sprint is scored once at the
+end: one gather of weights[item, choice] and one sum (score_validation_sprint). The live radar
+preview reads a running per-category sum instead, updated once per answer (add_preview_answer).
+"""
+
+from array import array
+from dataclasses import dataclass
+from typing import Any, Dict, Optional, Sequence
+
+import numpy as np
+
+from .nice_framework import ALL_CATEGORIES
+
+VALIDATION_SPRINT_BANK = "calibration"
+INSTINCT_ITEMS = 10  # pool[0:10], always first and in order
+TKS_POOL_START = 10
+TKS_POOL_SIZE = 25
+TKS_SPRINT_ITEMS = 10  # drawn from the 25 TKS items
+CORE_ITEMS = 10  # pool[35:45], always last
+
+
+def get_sprint_pool(lang: str) -> Any:
+    """Preassembled CompiledBank for lang (shared by every session)."""
+    from .bank_compiler import get_compiled_bank
+
+    return get_compiled_bank(VALIDATION_SPRINT_BANK, lang)
+
+
+def tks_permutation(seed: Optional[int], n: int = TKS_POOL_SIZE) -> np.ndarray:
+    """Seeded permutation of range(n); seed None draws fresh entropy."""
+    return np.random.default_rng(seed).permutation(n)
+
+
+def draw_sprint(seed: Optional[int] = None, shuffle: bool = True) -> array:
+    """
+    Pool indices for one sprint: 10 Instinct, 10 TKS (seeded permutation when shuffle), 10 Core.
+    The same seed always yields the same sequence.
+    """
+    tks = tks_permutation(seed) if shuffle else np.arange(TKS_POOL_SIZE)
+    core_start = TKS_POOL_START + TKS_POOL_SIZE
+    order = np.concatenate((
+        np.arange(INSTINCT_ITEMS),
+        TKS_POOL_START + tks[:TKS_SPRINT_ITEMS],
+        np.arange(core_start, core_start + CORE_ITEMS),
+    ))
+    return array("B", order.astype(np.uint8).tobytes())
+
+
+@dataclass(frozen=True)
+class ValidationSprintScore:
+    category_weights: Dict[str, float]  # summed choice weights, ready for ScoreState.add_weights
+    evidence: np.ndarray  # per-category posterior evidence (each answer split to one unit)
+    answered: int
+    keyed: int  # answered items that have a correct_index
+    correct: int
+
+
+def new_preview_sum() -> array:
+    """Running choice-weight sum per category (ALL_CATEGORIES order) for the live preview."""
+    return array("d", bytes(8 * len(ALL_CATEGORIES)))
+
+
+def add_preview_answer(preview: array, pool: Any, item: int, choice: int) -> None:
+    """Add weights[item, choice] to the running sum (invalid choices skipped, as in score_validation_sprint)."""
+    if 0 <= choice < pool.n_options[item]:
+        for k, w in enumerate(pool.weights[item, choice]):
+            preview[k] += float(w)
+
+
+def preview_weights(preview: array) -> Dict[str, float]:
+    """Running sum as category weights, ready for ScoreState.add_weights."""
+    return {c: preview[k] for k, c in enumerate(ALL_CATEGORIES) if preview[k]}
+
+
+def score_validation_sprint(pool: Any, order: Sequence[int], responses: Sequence[int]) -> ValidationSprintScore:
+    """Score answered items (responses[i] is the choice for order[i]; -1 = unanswered) in one pass."""
+    n = min(len(order), len(responses))
+    items = np.asarray(order[:n], dtype=np.intp)
+    choice = np.asarray(responses[:n], dtype=np.intp)
+    ok = (choice >= 0) & (choice < pool.n_options[items])
+    items, choice = items[ok], choice[ok]
+    rows = pool.weights[items, choice]  # (answered, 7)
+    positive = np.clip(rows, 0.0, None)
+    totals = positive.sum(axis=1)
+    has = totals > 0
+    evidence = (positive[has] / totals[has, None]).sum(axis=0) if has.any() else np.zeros(len(ALL_CATEGORIES))
+    summed = rows.sum(axis=0)
+    key = pool.correct_index[items]
+    keyed = key >= 0
+    return ValidationSprintScore(
+        category_weights={c: float(summed[k]) for k, c in enumerate(ALL_CATEGORIES) if summed[k]},
+        evidence=evidence,
+        answered=int(items.size),
+        keyed=int(keyed.sum()),
+        correct=int((choice[keyed] == key[keyed]).sum()),
+    )
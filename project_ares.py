@@ -6,5 +6,18 @@ Ensures `from project_ares import ...` resolves to the
 Streamlit app or other package-based entrypoints.
 """
 
-from cyber_career_compass.project_ares import *  # noqa: F401,F403
+import importlib
+from typing import Any, List
 
+_TARGET = "cyber_career_compass.project_ares"
+
+
+def __getattr__(name: str) -> Any:
+    # Resolved on first use, so importing the shim does not load the target module.
+    if name.startswith("__"):
+        raise AttributeError(name)
+    return getattr(importlib.import_module(_TARGET), name)
+
+
+def __dir__() -> List[str]:
+    return dir(importlib.import_module(_TARGET))
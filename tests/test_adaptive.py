@@ -0,0 +1,7 @@
+"""Adaptive Specialist stop rule: agreement with full-length runs on simulated respondents."""
+
+from cyber_career_compass.adaptive import AGREEMENT_TARGET, assert_adaptive_agreement
+
+
+def test_adaptive_stop_meets_agreement_target():
+    assert_adaptive_agreement(n_students=500, seed=0, target=AGREEMENT_TARGET)
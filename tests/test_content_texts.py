@@ -0,0 +1,26 @@
+"""Display texts come from the pinned content snapshot, so translations/NICE edits hot-reload per session."""
+
+import dataclasses
+
+from cyber_career_compass import content_registry
+from cyber_career_compass.nice_framework import get_category_label, get_work_role
+from cyber_career_compass.translations import get_ui
+
+
+def test_texts_follow_the_pinned_snapshot():
+    current = content_registry.latest_content()
+    texts = current.texts
+    lang_map = {lang: dict(entry, ui=dict(entry["ui"], app_title="EDITED")) for lang, entry in texts.lang_map.items()}
+    work_roles = {key: dataclasses.replace(role, title="EDITED") for key, role in texts.work_roles.items()}
+    edited = dataclasses.replace(
+        current,
+        texts=dataclasses.replace(texts, lang_map=lang_map, work_roles=work_roles, category_labels={"AN": "EDITED"}),
+    )
+    with content_registry.pinned(edited):
+        assert get_ui("en")["app_title"] == "EDITED"
+        assert get_work_role("AN", 0).title == "EDITED"
+        assert get_category_label("AN") == "EDITED"
+    with content_registry.pinned(current):
+        assert get_ui("en")["app_title"] != "EDITED"
+        assert get_work_role("AN", 0).title != "EDITED"
+        assert get_category_label("AN") != "EDITED"
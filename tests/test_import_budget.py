@@ -0,0 +1,7 @@
+"""Cold-import budget: the package and its core engines import fast and without heavy modules."""
+
+from cyber_career_compass.import_budget import assert_import_budgets
+
+
+def test_cold_import_budget():
+    assert_import_budgets()
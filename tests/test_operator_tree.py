@@ -0,0 +1,13 @@
+"""Compiled Operator decision tree: same scenario as the uncompiled branching rule for every history."""
+
+import pytest
+
+from cyber_career_compass.bank_compiler import get_compiled_bank
+from cyber_career_compass.operator_tree import OPERATOR_TREE_BANK, tree_mismatches
+from cyber_career_compass.translations import SUPPORTED_LANGUAGES
+
+
+@pytest.mark.parametrize("lang", SUPPORTED_LANGUAGES)
+def test_compiled_tree_matches_branching_rule(lang):
+    bank = get_compiled_bank(OPERATOR_TREE_BANK, lang)
+    assert tree_mismatches(lang, bank.questions, bank.children, bank.base_nodes) == []
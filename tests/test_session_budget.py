@@ -0,0 +1,7 @@
+"""Per-session memory budget: a finished Specialist run plus Calibration stays within SESSION_MEMORY_BUDGET_BYTES."""
+
+from cyber_career_compass.session import SESSION_MEMORY_BUDGET_BYTES, assert_session_budget
+
+
+def test_session_budget():
+    assert assert_session_budget() <= SESSION_MEMORY_BUDGET_BYTES
@@ -6,5 +6,18 @@ Allows `from translations import ...` to resolve to the core
 of the Streamlit app (`main.py`) or other package-based entrypoints.
 """
 
-from cyber_career_compass.translations import *  # noqa: F401,F403
+import importlib
+from typing import Any, List
 
+_TARGET = "cyber_career_compass.translations"
+
+
+def __getattr__(name: str) -> Any:
+    # Resolved on first use, so importing the shim does not load the target module.
+    if name.startswith("__"):
+        raise AttributeError(name)
+    return getattr(importlib.import_module(_TARGET), name)
+
+
+def __dir__() -> List[str]:
+    return dir(importlib.import_module(_TARGET))